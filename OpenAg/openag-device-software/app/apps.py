@@ -9,6 +9,12 @@ class CoreConfig(AppConfig):
     name = "app"
 
     def ready(self) -> None:
+        # Apply sqlite storage profile to every database connection
+        from django.db.backends.signals import connection_created
+        from app.database import configure_connection
+
+        connection_created.connect(configure_connection)
+
         # Ensure startup code only runs once
         if os.environ.get("RUN_MAIN") != "true":
             return
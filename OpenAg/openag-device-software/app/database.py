@@ -0,0 +1,47 @@
+# Import standard python modules
+import logging
+
+# Import python types
+from typing import Any, Dict, List, Tuple
+
+# Import django modules
+from django.conf import settings
+from django.db import connection as default_connection
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+def apply_pragmas(cursor: Any, pragmas: List[Tuple[str, Any]]) -> None:
+    """Applies sqlite pragmas in order with a db-api cursor."""
+    for name, value in pragmas:
+        cursor.execute("PRAGMA {} = {}".format(name, value))
+
+
+def configure_connection(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """Applies sqlite storage profile to each new database connection. Connected to
+    the connection created signal in app config."""
+
+    # Only configure sqlite connections
+    if connection.vendor != "sqlite":
+        return
+
+    # Apply pragmas
+    with connection.cursor() as cursor:
+        try:
+            apply_pragmas(cursor, settings.SQLITE_PRAGMAS)
+        except Exception:
+            logger.exception("Unable to apply sqlite pragmas")
+
+
+def checkpoint(mode: str = "PASSIVE") -> Dict[str, int]:
+    """Checkpoints write-ahead log into database file. Passive checkpoints never wait
+    on readers or writers. Returns number of log frames and checkpointed frames."""
+    with default_connection.cursor() as cursor:
+        cursor.execute("PRAGMA wal_checkpoint({})".format(mode))
+        busy, log_frames, checkpointed_frames = cursor.fetchone()
+    return {
+        "busy": busy,
+        "log_frames": log_frames,
+        "checkpointed_frames": checkpointed_frames,
+    }
@@ -0,0 +1,118 @@
+# Import standard python modules
+import os, sys, json, glob, subprocess
+
+# Import python types
+from typing import Any, Dict, List, Tuple
+
+# Import django modules
+from django.core.management.base import BaseCommand, CommandError
+
+# Import device utilities
+from device.utilities.importtime import Record, parse_record
+
+# Initialize file paths
+DEVICE_CONFIG_FILES_PATH = "data/devices/{}.json"
+PERIPHERAL_SETUP_FILES_PATH = "device/peripherals/modules/*/setups/*.json"
+CONTROLLER_SETUP_FILES_PATH = "device/controllers/modules/*/setups/*.json"
+
+# Initialize heavy driver dependencies worth reporting
+HEAVY_MODULES = ["numpy", "pygame", "pyudev", "pyftdi", "RPi", "Adafruit_DHT", "usb"]
+
+
+def get_setup_modules(path: str, package: str) -> Dict[str, str]:
+    """Gets module names of setup files keyed by setup uuid."""
+    modules = {}
+    for filepath in glob.glob(path):
+        with open(filepath) as f:
+            setup_dict = json.load(f)
+        modules[setup_dict["uuid"]] = package + setup_dict["module_name"]
+    return modules
+
+
+def get_config_modules(config_name: str) -> List[str]:
+    """Gets peripheral and controller modules created for device config."""
+    filepath = DEVICE_CONFIG_FILES_PATH.format(config_name)
+    if not os.path.exists(filepath):
+        raise CommandError("Unknown device config: {}".format(config_name))
+    with open(filepath) as f:
+        config_dict = json.load(f)
+
+    # Resolve setup uuids to module names
+    modules = get_setup_modules(
+        PERIPHERAL_SETUP_FILES_PATH, "device.peripherals.modules."
+    )
+    modules.update(
+        get_setup_modules(CONTROLLER_SETUP_FILES_PATH, "device.controllers.modules.")
+    )
+    module_names: List[str] = []
+    for entry in config_dict.get("peripherals", []) + (
+        config_dict.get("controllers") or []
+    ):
+        module_name = modules.get(entry["uuid"])
+        if module_name is not None and module_name not in module_names:
+            module_names.append(module_name)
+    return module_names
+
+
+class Command(BaseCommand):
+    help = "Reports module import times for the device process"
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            default=["device.coordinator.manager"],
+            help="modules to import",
+        )
+        parser.add_argument(
+            "--config", help="also import modules created for device config"
+        )
+        parser.add_argument(
+            "--limit", type=int, default=20, help="number of modules to list"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        modules = list(options["modules"])
+        if options["config"] != None:
+            modules += get_config_modules(options["config"])
+
+        # Import modules in a fresh interpreter so nothing is cached
+        result = subprocess.run(
+            [sys.executable, "-m", "device.utilities.importtime"] + modules,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            env=dict(os.environ, RUN_MAIN="false"),
+        )
+        if result.returncode != 0:
+            raise CommandError(result.stderr)
+        records: List[Record] = []
+        for line in result.stdout.splitlines():
+            record = parse_record(line)
+            if record is not None:
+                records.append(record)
+
+        # Report total and slowest modules
+        total = sum(record[1] for record in records)
+        self.stdout.write(
+            "Imported {} modules in {:.1f} ms".format(len(records), total / 1000)
+        )
+        for title, cumulative in (("cumulative", True), ("self", False)):
+            self.stdout.write("\nSlowest modules by {} time [ms]:".format(title))
+            times: List[Tuple[int, str]] = [
+                (cumulative_us if cumulative else self_us, name)
+                for name, self_us, cumulative_us, _ in records
+            ]
+            ranked = sorted(times, key=lambda time: time[0], reverse=True)
+            for time_us, name in ranked[: options["limit"]]:
+                self.stdout.write("{:>9.1f}  {}".format(time_us / 1000, name))
+
+        # Report heavy driver dependencies loaded at import
+        self.stdout.write("\nHeavy driver dependencies loaded:")
+        cumulative_times = {record[0]: record[2] for record in records}
+        for name in HEAVY_MODULES:
+            if name in cumulative_times:
+                loaded = "{:.1f} ms".format(cumulative_times[name] / 1000)
+            else:
+                loaded = "no"
+            self.stdout.write("{:>14}: {}".format(name, loaded))
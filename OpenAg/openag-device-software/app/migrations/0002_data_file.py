@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.21 on 2026-10-18 10:57
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("app", "0001_initial")]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataFileModel",
+            fields=[
+                ("path", models.TextField(primary_key=True, serialize=False)),
+                ("hash", models.CharField(max_length=64)),
+                ("timestamp", models.DateTimeField(auto_now=True)),
+            ],
+            options={"verbose_name": "Data File", "verbose_name_plural": "Data Files"},
+        ),
+    ]
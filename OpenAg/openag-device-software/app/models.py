@@ -213,3 +213,13 @@ class ConnectModel(models.Model):
     class Meta:
         verbose_name = "Connect"
         verbose_name_plural = "Connects"
+
+
+class DataFileModel(models.Model):
+    path = models.TextField(primary_key=True)
+    hash = models.CharField(max_length=64)
+    timestamp = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Data File"
+        verbose_name_plural = "Data Files"
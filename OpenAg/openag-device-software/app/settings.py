@@ -106,6 +106,8 @@ DATABASES = {
         "NAME": DATA_PATH + "/db/openag_brain.sqlite",
         "USER": "openag",
         "PASSWORD": "openag",
+        "CONN_MAX_AGE": None,  # Keep connections open across requests
+        "OPTIONS": {"timeout": float(os.getenv("SQLITE_BUSY_TIMEOUT", "20"))},
         "TEST": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": DATA_PATH + "/db/test_openag_brain.sqlite",
@@ -114,6 +116,42 @@ DATABASES = {
     }
 }
 
+# Set sqlite storage profile, pragmas are applied in order on every new connection.
+# Write-ahead logging lets the web server read while device threads write, normal
+# synchronous mode only syncs the log on checkpoints. Cache size is in KiB when
+# negative, mmap size is in bytes. The resource manager runs a passive checkpoint
+# every checkpoint interval (seconds), automatic checkpoints are a backstop.
+SQLITE_PRAGMAS = [
+    ("journal_mode", os.getenv("SQLITE_JOURNAL_MODE", "WAL")),
+    ("synchronous", os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")),
+    ("cache_size", int(os.getenv("SQLITE_CACHE_SIZE", "-8000"))),
+    ("mmap_size", int(os.getenv("SQLITE_MMAP_SIZE", str(64 * 1024 * 1024)))),
+    ("wal_autocheckpoint", int(os.getenv("SQLITE_WAL_AUTOCHECKPOINT", "10000"))),
+]
+SQLITE_CHECKPOINT_INTERVAL = float(os.getenv("SQLITE_CHECKPOINT_INTERVAL", "300"))
+
+# Set shared state storage intervals (seconds). State sections are only written to the
+# database when modified and at most once per flush interval. All sections are
+# re-serialized every full flush interval.
+STATE_FLUSH_INTERVAL = float(os.getenv("STATE_FLUSH_INTERVAL", "1"))
+STATE_FULL_FLUSH_INTERVAL = float(os.getenv("STATE_FULL_FLUSH_INTERVAL", "60"))
+
+# Set environment snapshot interval (seconds), environment state is stored in the
+# environment table every snapshot interval
+ENVIRONMENT_SNAPSHOT_INTERVAL = float(os.getenv("ENVIRONMENT_SNAPSHOT_INTERVAL", "600"))
+
+# Set persistence writer parameters. Database writes are queued and committed by a
+# single writer thread in batched transactions, every commit interval (seconds) or
+# once a batch reaches the max batch size.
+PERSISTENCE_COMMIT_INTERVAL = float(os.getenv("PERSISTENCE_COMMIT_INTERVAL", "0.5"))
+PERSISTENCE_MAX_BATCH_SIZE = int(os.getenv("PERSISTENCE_MAX_BATCH_SIZE", "100"))
+
+# Set manager setup parameters. Peripheral and controller managers are created
+# concurrently by up to create workers threads. The coordinator waits up to init
+# timeout (seconds) for all managers to leave init mode before entering normal mode.
+MANAGER_CREATE_WORKERS = int(os.getenv("MANAGER_CREATE_WORKERS", "8"))
+MANAGER_INIT_TIMEOUT = float(os.getenv("MANAGER_INIT_TIMEOUT", "120"))
+
 # Set log level
 LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
 CONSOLE_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -62,6 +62,11 @@ connect_advanced_view = views.ConnectAdvanced.as_view()
 urlpatterns = [
     url(r"^robots\.txt", TemplateView.as_view(template_name="robots.txt", content_type='text/plain')), 
     url(r"^admin/", admin.site.urls),
+    url(
+        r"^api/environment/statistics/$",
+        views.EnvironmentStatistics.as_view(),
+        name="api-environment-statistics",
+    ),
     url(r"^api/", include(router.urls, namespace="api")),
     url(r"^accounts/login/$", auth_views.login, login_settings, name="login"),
     url(r"^accounts/logout/$", auth_views.logout, {"next_page": "/"}, name="logout"),
@@ -142,7 +142,7 @@ class EnvironmentViewer:
         coordinator = app_config.coordinator
 
         # Get environment state dict
-        environment_dict = coordinator.state.environment
+        environment_dict = coordinator.state.snapshot("environment").value
         if environment_dict == None:
             return {}
 
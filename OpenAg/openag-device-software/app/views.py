@@ -562,6 +562,32 @@ class EnvironmentViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
 
+class EnvironmentStatistics(views.APIView):
+    """Environment statistics endpoint."""
+
+    # Initialize view parameters
+    permission_classes = [IsAuthenticated]
+
+    # Initialize logger
+    logger = logger.Logger("EnvironmentStatisticsView", "app")
+
+    def get(self, request: Request) -> Response:
+        """Gets windowed statistics of reported sensor values."""
+        self.logger.debug("Getting environment statistics")
+
+        # Get optional variable parameter
+        variable = request.query_params.get("variable")
+
+        # Get statistics from shared state
+        app_config = apps.get_app_config(APP_NAME)
+        state = app_config.coordinator.state
+        response = {
+            "message": "Successfully got environment statistics",
+            "statistics": state.get_environment_sensor_statistics(variable),
+        }
+        return Response(response, 200)
+
+
 class RecipeViewSet(viewsets.ModelViewSet):
     """View set for recipe interactions."""
 
@@ -1,8 +1,8 @@
 # Import standard python modules
-import json, time
+import time
 
 # Import python types
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import state machine parent class
 from device.utilities.statemachine import manager, modes
@@ -11,6 +11,8 @@ from device.utilities.statemachine import manager, modes
 from device.utilities import logger
 from device.utilities.statemachine.manager import StateMachineManager
 from device.utilities.state.main import State
+from device.utilities.state.subscriptions import Subscription
+from device.utilities.setups import setups
 
 # Import manager elements
 from device.controllers.classes.controller import modes
@@ -23,6 +25,11 @@ class ControllerManager(StateMachineManager):
     default_sampling_interval = 5  # seconds
     last_update = None  # seconds
     last_update_interval = None  # Seconds
+    latency_samples = 0
+    latency_total = 0.0  # seconds
+    latency_max = 0.0  # seconds
+    error_start_time = 0.0  # seconds
+    subscription: Optional[Subscription] = None
 
     def __init__(self, name: str, state: State, config: Dict) -> None:
         """Initializes manager."""
@@ -63,6 +70,15 @@ class ControllerManager(StateMachineManager):
             modes.ERROR: [modes.RESET, modes.SHUTDOWN],
         }
 
+        # Initialize state machine mode entry and update functions
+        self.mode_steps = {
+            modes.INIT: (self.run_init_mode, None),
+            modes.NORMAL: (self.enter_normal_mode, self.update_normal_mode),
+            modes.RESET: (self.run_reset_mode, None),
+            modes.ERROR: (self.enter_error_mode, self.update_error_mode),
+            modes.SHUTDOWN: (self.run_shutdown_mode, None),
+        }
+
         # Initialize state machine mode
         self.mode = modes.INIT
 
@@ -75,6 +91,7 @@ class ControllerManager(StateMachineManager):
     def mode(self, value: str) -> None:
         """Safely updates controller mode in device state object."""
         self._mode = value
+        self.signal_initialized(value)
         self.state.set_controller_value(self.name, "mode", value)
 
     @property
@@ -110,10 +127,28 @@ class ControllerManager(StateMachineManager):
     @sampling_interval.setter
     def sampling_interval(self, value: float) -> None:
         """Safely updates sampling interval in state object."""
-        with self.state.lock:
+        with self.state.section_lock("controllers"):
             if "stored" not in self.state.controllers[self.name]:
                 self.state.controllers[self.name]["stored"] = {}
             self.state.controllers[self.name]["stored"]["sampling_interval"] = value
+            self.state.mark_dirty("controllers")
+
+    @property
+    def subscribed_variables(self) -> List[str]:
+        """Gets environment sensor variables that trigger a controller update when 
+        their reported or desired values change. Overridden by child classes."""
+        return []
+
+    @property
+    def latency(self) -> Dict[str, Any]:
+        """Gets sensor to actuator latency from shared state object."""
+        value = self.state.get_controller_value(self.name, "latency")
+        return value or {}  # type: ignore
+
+    @latency.setter
+    def latency(self, value: Dict[str, Any]) -> None:
+        """Safely updates sensor to actuator latency in shared state object."""
+        self.state.set_controller_value(self.name, "latency", value)
 
     ##### STATE MACHINE FUNCTIONS #############################################
 
@@ -161,69 +196,96 @@ class ControllerManager(StateMachineManager):
         self.mode = modes.NORMAL
 
     def run_normal_mode(self) -> None:
-        """Runs normal mode. Executes child class update function every sampling
-        interval. Checks for events and transitions after each update."""
+        """Runs normal mode. Executes child class update function whenever a 
+        subscribed variable changes and at least every sampling interval. Checks 
+        for events and transitions after each update."""
+        self.enter_normal_mode()
+        try:
+            self.run_mode_loop(self.update_normal_mode)
+        finally:
+            self.unsubscribe()
+
+    def enter_normal_mode(self) -> None:
+        """Enters normal mode, subscribes to variable changes."""
         self.logger.info("Entered NORMAL")
 
         # Initialize vars
         self._update_complete = True
         self.last_update = time.time()
 
-        # Loop forever
-        while True:
+        # Subscribe to variable changes
+        self.subscription = self.state.subscribe(self.subscribed_variables, self.wake)
+
+    def update_normal_mode(self) -> Optional[float]:
+        """Runs one normal mode update. Returns seconds until the next update is due 
+        or None after a transition."""
+        subscription = self.subscription
+
+        # Update on variable changes or every sampling interval
+        changed, change_time = subscription.consume()  # type: ignore
+        self.last_update_interval = time.time() - self.last_update
+        if changed or self.sampling_interval < self.last_update_interval:
+            message = "Updating controller, delta: {:.3f}, changed: {}".format(
+                self.last_update_interval, sorted(changed)
+            )
+            self.logger.debug(message)
+            self.last_update = time.time()
+            self.update_controller()
+
+            # Record latency from first coalesced change to controller output
+            if change_time != None:
+                self.record_latency(subscription, change_time)  # type: ignore
 
-            # Update every sampling interval
-            self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval:
-                message = "Updating controller, delta: {:.3f}".format(
-                    self.last_update_interval
-                )
-                self.logger.debug(message)
-                self.last_update = time.time()
-                self.update_controller()
-
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
+        # Check for transitions
+        if self.new_transition(modes.NORMAL):
+            self.unsubscribe()
+            return None
 
-            # Check for events
-            self.check_events()
+        # Check for events
+        self.check_events()
 
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
+        # Check for transitions
+        if self.new_transition(modes.NORMAL):
+            self.unsubscribe()
+            return None
 
-            # Update every 100ms
-            time.sleep(0.100)
+        # Wait for next event, variable change or sampling interval
+        return self.last_update + self.sampling_interval - time.time()
 
     def run_error_mode(self) -> None:
         """Runs error mode. Clears reported values then waits for new 
         events and transitions. Tries to reset every hour."""
+        self.enter_error_mode()
+        self.run_mode_loop(self.update_error_mode)
+
+    def enter_error_mode(self) -> None:
+        """Enters error mode, clears reported values."""
         self.logger.info("Entered ERROR")
 
         # Clear reported values
         self.clear_reported_values()
 
         # Initialize vars
-        start_time = time.time()
+        self.error_start_time = time.time()
 
-        # Loop forever
-        while True:
+    def update_error_mode(self) -> Optional[float]:
+        """Runs one error mode update. Returns seconds until the next update is due 
+        or None after a transition."""
 
-            # Check for hourly reset
-            if time.time() - start_time > 3600:  # 1 hour
-                self.mode = modes.RESET
-                break
+        # Check for hourly reset
+        if time.time() - self.error_start_time > 3600:  # 1 hour
+            self.mode = modes.RESET
+            return None
 
-            # Check for events
-            self.check_events()
+        # Check for events
+        self.check_events()
 
-            # Check for transitions
-            if self.new_transition(modes.ERROR):
-                break
+        # Check for transitions
+        if self.new_transition(modes.ERROR):
+            return None
 
-            # Update every 100ms
-            time.sleep(0.1)
+        # Wait for next event or hourly reset
+        return self.error_start_time + 3600 - time.time()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode. Executes child class reset function, checks for any
@@ -247,22 +309,47 @@ class ControllerManager(StateMachineManager):
         self.logger.info("Entered SHUTDOWN")
 
         # Shutdown controller
+        self.unsubscribe()
         self.shutdown_controller()
         self.is_shutdown = True
 
     ##### HELPER FUNCTIONS ####################################################
 
+    def unsubscribe(self) -> None:
+        """Unsubscribes from variable changes if subscribed."""
+        if self.subscription != None:
+            self.state.unsubscribe(self.subscription)  # type: ignore
+            self.subscription = None
+
+    def record_event_stats(self) -> None:
+        """Records event queue statistics in controller state."""
+        self.state.set_controller_value(self.name, "events", self.event_queue.stats)
+
+    def record_latency(self, subscription: Subscription, change_time: float) -> None:
+        """Records time from a subscribed variable change until the controller 
+        updated its actuator outputs, with the number of coalesced changes."""
+        latency = time.monotonic() - change_time
+        self.latency_samples += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency = {
+            "last_ms": round(latency * 1000, 3),
+            "average_ms": round(self.latency_total * 1000 / self.latency_samples, 3),
+            "max_ms": round(self.latency_max * 1000, 3),
+            "samples": self.latency_samples,
+            "notifications": subscription.notifications,
+            "wakeups": subscription.wakeups,
+        }
+
     def load_setup_dict_from_file(self) -> Dict:
-        """Loads setup dict from setup filename parameter."""
+        """Loads setup dict from setup filename parameter. Managers with the same 
+        setup file share one read-only setup dict."""
         self.logger.debug("Loading setup file")
         setup = self.parameters.get("setup", None)
         if setup == None:
             return {}
         file_name = setup["file_name"]
-        setup_dict = json.load(
-            open("device/controllers/modules/" + file_name + ".json")
-        )
-        return dict(setup_dict)
+        return setups.load("device/controllers/modules/" + file_name + ".json")
 
     def initialize_controller(self) -> None:
         """Initializes controller."""
@@ -1,5 +1,5 @@
 # Import standard python modules
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import controller manager parent class
 from device.controllers.classes.controller import manager, modes
@@ -22,6 +22,13 @@ class HystereticControllerManager(manager.ControllerManager):
         self.negative_actuator_name = self.variables.get("negative_actuator_name", None)
         self.accuracy_value = float(self.properties.get("accuracy_value", None))
 
+    @property
+    def subscribed_variables(self) -> List[str]:
+        """Gets sensor variable that triggers controller updates."""
+        if self.sensor_name == None:
+            return []
+        return [self.sensor_name]
+
     @property
     def sensor_value(self) -> Optional[float]:
         """Gets sensor value."""
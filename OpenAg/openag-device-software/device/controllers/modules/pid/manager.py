@@ -1,5 +1,5 @@
 # Import standard python modules
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import controller manager parent class
 from device.controllers.classes.controller import manager, modes
@@ -48,6 +48,14 @@ class PIDControllerManager(manager.ControllerManager):
         self.pid.setWindup(self.windup)
         self.pid.setSampleTime(self.sample_time_seconds)
 
+    # --------------------------------------------------------------------------------------
+    @property
+    def subscribed_variables(self) -> List[str]:
+        """Gets sensor variable that triggers controller updates."""
+        if self.sensor_name == None:
+            return []
+        return [self.sensor_name]
+
     # --------------------------------------------------------------------------------------
     # This is the temperature sensor current temp.
     @property
@@ -6,7 +6,7 @@
 #   python -m pytest -s -k test_update_controller_positive test_manager.py
 
 # Import standard python libraries
-import os, sys, json, pytest
+import os, sys, json, pytest, time
 
 # Set system path and directory
 ROOT_DIR = str(os.getenv("PROJECT_ROOT", "."))
@@ -16,6 +16,7 @@ os.chdir(ROOT_DIR)
 # Import device utilities
 from device.utilities import accessors
 from device.utilities.state.main import State
+from device.utilities.statemachine.runtime import AsyncRuntime
 
 # Import manager
 from device.controllers.modules.pid.manager import PIDControllerManager
@@ -128,3 +129,67 @@ def test_shutdown_controller() -> None:
     )
     manager.initialize_controller()
     manager.shutdown_controller()
+
+
+def test_normal_mode_updates_on_sensor_change() -> None:
+    manager = PIDControllerManager(
+        name="test_normal_mode_updates_on_sensor_change",
+        state=State(),
+        config=controller_config,
+    )
+    sensor_name = controller_config["parameters"]["variables"]["sensor_name"]
+    manager.state.set_environment_desired_sensor_value(sensor_name, 24)
+    manager.spawn()
+    assert manager.initialized.wait(5)
+    manager.sampling_interval = 3600
+
+    # Wait for normal mode to subscribe to sensor variable
+    start_time = time.time()
+    while sensor_name not in manager.state.subscriptions:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+
+    # New sensor value updates controller without waiting for sampling interval
+    manager.state.set_environment_reported_sensor_value("SHT25", sensor_name, 21.9)
+    start_time = time.time()
+    while manager.latency == {} and time.time() - start_time < 5:
+        time.sleep(0.01)
+    assert manager.desired_positive_actuator_percent == 100.0
+    assert manager.latency["samples"] == 1
+    assert manager.latency["max_ms"] < 1000
+    manager.shutdown()
+    manager.thread.join(5)
+
+
+def test_async_runtime_updates_on_sensor_change() -> None:
+    runtime = AsyncRuntime(max_workers=1)
+    manager = PIDControllerManager(
+        name="test_async_runtime_updates_on_sensor_change",
+        state=State(),
+        config=controller_config,
+    )
+    sensor_name = controller_config["parameters"]["variables"]["sensor_name"]
+    manager.state.set_environment_desired_sensor_value(sensor_name, 24)
+    manager.spawn(runtime)
+    assert manager.initialized.wait(5)
+    manager.sampling_interval = 3600
+
+    # Wait for normal mode to subscribe to sensor variable
+    start_time = time.time()
+    while sensor_name not in manager.state.subscriptions:
+        assert time.time() - start_time < 5
+        time.sleep(0.01)
+
+    # Subscription wakes task without waiting for sampling interval
+    manager.state.set_environment_reported_sensor_value("SHT25", sensor_name, 21.9)
+    start_time = time.time()
+    while manager.latency == {} and time.time() - start_time < 5:
+        time.sleep(0.01)
+    assert manager.desired_positive_actuator_percent == 100.0
+    assert manager.latency["max_ms"] < 1000
+
+    # Shutdown unsubscribes and ends task
+    manager.shutdown()
+    manager.task.result(timeout=5)
+    assert sensor_name not in manager.state.subscriptions
+    runtime.stop(timeout=5)
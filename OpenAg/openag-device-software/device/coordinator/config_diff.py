@@ -0,0 +1,81 @@
+# Import python types
+from typing import Any, Dict, List
+
+
+class SectionDiff:
+    """Compares peripheral or controller entries of two device configs by name. An
+    entry changed if its uuid or any of its parameters changed."""
+
+    def __init__(
+        self, old_entries: List[Dict[str, Any]], new_entries: List[Dict[str, Any]]
+    ) -> None:
+        """Initializes section diff."""
+        old_by_name = {entry["name"]: entry for entry in old_entries}
+        new_by_name = {entry["name"]: entry for entry in new_entries}
+        self.added: List[str] = []
+        self.removed: List[str] = []
+        self.changed: List[str] = []
+        self.unchanged: List[str] = []
+
+        # Compare new entries with old entries of the same name
+        for name, entry in new_by_name.items():
+            old_entry = old_by_name.get(name)
+            if old_entry == None:
+                self.added.append(name)
+            elif old_entry != entry:
+                self.changed.append(name)
+            else:
+                self.unchanged.append(name)
+
+        # Get old entries missing from new config
+        for name in old_by_name:
+            if name not in new_by_name:
+                self.removed.append(name)
+
+        # Store new entries in config order
+        self.new_entries = new_by_name
+
+    @property
+    def stopped(self) -> List[str]:
+        """Gets names of managers to stop."""
+        return self.removed + self.changed
+
+    @property
+    def started(self) -> List[str]:
+        """Gets names of managers to create, in new config order."""
+        return [name for name in self.new_entries if name not in self.unchanged]
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Gets diff as a json serializable dict."""
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+        }
+
+
+class ConfigDiff:
+    """Compares peripherals and controllers of an old and a new device config so the
+    coordinator only restarts managers whose config changed."""
+
+    def __init__(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        """Initializes config diff."""
+        self.peripherals = SectionDiff(
+            old_config.get("peripherals") or [], new_config.get("peripherals") or []
+        )
+        self.controllers = SectionDiff(
+            old_config.get("controllers") or [], new_config.get("controllers") or []
+        )
+
+    @property
+    def stopped(self) -> List[str]:
+        """Gets names of all managers to stop."""
+        return self.peripherals.stopped + self.controllers.stopped
+
+    def to_dict(self) -> Dict[str, Dict[str, List[str]]]:
+        """Gets diff as a json serializable dict."""
+        return {
+            "peripherals": self.peripherals.to_dict(),
+            "controllers": self.controllers.to_dict(),
+        }
@@ -1,5 +1,6 @@
 # Import standard python modules
-import logging, time, json, threading, os, sys, glob, uuid, jsonschema
+import logging, time, json, threading, os, sys, glob, uuid, hashlib
+import concurrent.futures
 
 # Import python types
 from typing import Dict, List, Optional, Any, Tuple
@@ -9,13 +10,33 @@ from app import models
 
 # Import device utilities
 from device.utilities.statemachine.manager import StateMachineManager
+from device.utilities.statemachine.runtime import (
+    AsyncRuntime,
+    ASYNCIO,
+    THREADS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_ENTRY_WORKERS,
+)
 from device.utilities.state.main import State
+from device.utilities.state.storage import StateStorage
+from device.utilities.persistence.main import writer
+from device.utilities.schemas import schemas
+from device.utilities.setups import freeze
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
-from device.utilities.accessors import set_nested_dict_safely
+from device.utilities.communication.i2c.mux_state import (
+    get_mux_stats,
+    invalidate_mux_states,
+)
+from device.utilities.communication.i2c.connection import close_connections
+from device.utilities.communication.i2c.bus_manager import (
+    I2CBusManager,
+    HIGH_PRIORITY,
+    NORMAL_PRIORITY,
+)
 from device.utilities.logger import Logger
 
 # Import device managers
-from device.recipe.manager import RecipeManager
+from device.recipe.manager import RecipeManager, RECIPE_SCHEMA_PATH
 from device.iot.manager import IotManager
 from device.resource.manager import ResourceManager
 from device.network.manager import NetworkManager
@@ -23,8 +44,10 @@ from device.upgrade.manager import UpgradeManager
 
 # Import manager elements
 from device.coordinator import modes, events
+from device.coordinator.config_diff import ConfigDiff
 
 from django.conf import settings
+from django.db import connection, transaction
 
 # Initialize file paths
 RECIPES_PATH = "data/recipes/*.json"
@@ -37,6 +60,9 @@ CONTROLLER_SETUP_SCHEMA_PATH = "data/schemas/controller_setup.json"
 DATA_PATH = settings.DATA_PATH  # os.getenv("STORAGE_LOCATION", "data")
 DEVICE_CONFIG_PATH = DATA_PATH + "/config/device.txt"
 
+# Initialize longest time changed managers take to shutdown on config load
+SHUTDOWN_TIMEOUT = 10  # seconds
+
 DEVICE_CONFIG_SCHEMA_PATH = "data/schemas/device_config.json"
 DEVICE_CONFIG_FILES_PATH = "data/devices/*.json"
 SENSOR_VARIABLES_PATH = "data/variables/sensor_variables.json"
@@ -49,6 +75,13 @@ CULTIVATION_METHODS_PATH = "data/cultivations/cultivation_methods.json"
 CULTIVATION_METHODS_SCHEMA_PATH = "data/schemas/cultivation_methods.json"
 
 
+def get_variable_names(config_dict: Dict[str, Any], type_: str) -> List[str]:
+    """Gets sensor or actuator environment variable names of a peripheral config."""
+    variables = config_dict.get("parameters", {}).get("variables") or {}
+    names = variables.get(type_) or {}
+    return [name for name in names.values() if isinstance(name, str)]
+
+
 class CoordinatorManager(StateMachineManager):
     """Manages device state machine thread that spawns child threads to run 
     recipes, read sensors, set actuators, manage control loops, sync data, 
@@ -56,9 +89,18 @@ class CoordinatorManager(StateMachineManager):
 
     # Initialize vars
     latest_publish_timestamp = 0.0
+    latest_environment_timestamp = 0.0
     peripherals: Dict[str, StateMachineManager] = {}
     controllers: Dict[str, StateMachineManager] = {}
     new_config: bool = False
+    config_diff: Optional[ConfigDiff] = None
+    previous_config_dict: Dict[str, Any] = {}
+    stop_times: Dict[str, float] = {}
+    reconfigure_start_time: Optional[float] = None
+    bus_manager: Optional[I2CBusManager] = None
+    mux_simulator: Optional[MuxSimulator] = None
+    runtime: Optional[AsyncRuntime] = None
+    runtime_config: Dict[str, Any] = {}
 
     def __init__(self) -> None:
         """Initializes coordinator."""
@@ -73,16 +115,6 @@ class CoordinatorManager(StateMachineManager):
         # Initialize state
         self.state = State()
 
-        # Initialize environment state dict, TODO: remove this
-        self.state.environment = {
-            "sensor": {"desired": {}, "reported": {}},
-            "actuator": {"desired": {}, "reported": {}},
-            "reported_sensor_stats": {
-                "individual": {"instantaneous": {}, "average": {}},
-                "group": {"instantaneous": {}, "average": {}},
-            },
-        }
-
         # Initialize recipe state dict, TODO: remove this
         self.state.recipe = {
             "recipe_uuid": None,
@@ -90,6 +122,17 @@ class CoordinatorManager(StateMachineManager):
             "last_update_minute": None,
         }
 
+        # Initialize state storage
+        self.state_storage = StateStorage(self.state)
+
+        # Initialize read-only device config and setup caches keyed by uuid
+        self.config_cache: Dict[str, Dict[str, Any]] = {}
+        self.peripheral_setup_cache: Dict[str, Dict[str, Any]] = {}
+        self.controller_setup_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Initialize environment snapshot interval
+        self.environment_snapshot_interval = settings.ENVIRONMENT_SNAPSHOT_INTERVAL
+
         # Initialize managers
         self.recipe = RecipeManager(self.state)
         self.iot = IotManager(self.state, self.recipe)  # type: ignore
@@ -121,8 +164,9 @@ class CoordinatorManager(StateMachineManager):
     def mode(self, value: str) -> None:
         """Safely updates mode in state object."""
         self._mode = value
-        with self.state.lock:
+        with self.state.section_lock("device"):
             self.state.device["mode"] = value
+            self.state.mark_dirty("device")
 
     @property
     def config_uuid(self) -> Optional[str]:
@@ -132,25 +176,16 @@ class CoordinatorManager(StateMachineManager):
     @config_uuid.setter
     def config_uuid(self, value: Optional[str]) -> None:
         """ Safely updates config uuid in state. """
-        with self.state.lock:
+        with self.state.section_lock("device"):
             self.state.device["config_uuid"] = value
+            self.state.mark_dirty("device")
 
     @property
     def config_dict(self) -> Dict[str, Any]:
-        """Gets config dict for config uuid in device config table."""
+        """Gets read-only config dict for config uuid in device config table."""
         if self.config_uuid == None:
             return {}
-        config = models.DeviceConfigModel.objects.get(uuid=self.config_uuid)
-        return json.loads(config.json)  # type: ignore
-
-    @property
-    def latest_environment_timestamp(self) -> float:
-        """Gets latest environment timestamp from environment table."""
-        if not models.EnvironmentModel.objects.all():
-            return 0.0
-        else:
-            environment = models.EnvironmentModel.objects.latest()
-            return float(environment.timestamp.timestamp())
+        return self.get_config_dict(self.config_uuid)  # type: ignore
 
     @property
     def manager_modes(self) -> Dict[str, str]:
@@ -237,6 +272,10 @@ class CoordinatorManager(StateMachineManager):
         # Load local data files and stored db state
         self.load_local_data_files()
         self.load_database_stored_state()
+        self.load_latest_environment_timestamp()
+
+        # Start persistence writer
+        writer.start()
 
         # Transition to config mode on next state machine update
         self.mode = modes.CONFIG
@@ -277,22 +316,22 @@ class CoordinatorManager(StateMachineManager):
         self.logger.debug("Loading device config file: {}".format(config_name))
         device_config = json.load(open("data/devices/{}.json".format(config_name)))
 
+        # Check if config uuid changed, if so, adjust state of restarted managers
+        if self.config_uuid != device_config["uuid"] and self.config_diff != None:
+            self.clear_stopped_manager_state()
+            self.config_uuid = device_config["uuid"]
+
         # Check if config uuid changed, if so, adjust state
-        if self.config_uuid != device_config["uuid"]:
+        elif self.config_uuid != device_config["uuid"]:
             with self.state.lock:
                 self.state.peripherals = {}
                 self.state.controllers = {}
-                set_nested_dict_safely(
-                    self.state.environment,
-                    ["reported_sensor_stats"],
-                    {},
-                    self.state.lock,
-                )
-                set_nested_dict_safely(
-                    self.state.environment, ["sensor", "reported"], {}, self.state.lock
-                )
+                self.state.clear_environment_reported_sensor_values()
                 self.config_uuid = device_config["uuid"]
 
+        # Load device config and setup dicts once for this config pass
+        self.load_config_cache()
+
         # Transition to setup mode on next state machine update
         self.mode = modes.SETUP
 
@@ -311,21 +350,40 @@ class CoordinatorManager(StateMachineManager):
             self.network.spawn()
             self.upgrade.spawn()
 
+        # Get managers to create, only changed managers after a config diff
+        diff = self.config_diff
+        peripheral_names: Optional[List[str]] = None
+        controller_names: Optional[List[str]] = None
+        if diff is not None:
+            peripheral_names = diff.peripherals.started
+            controller_names = diff.controllers.started
+
+        # Create runtime for peripherals and controllers
+        self.create_runtime()
+
         # Create and spawn peripherals
         self.logger.debug("Creating and spawning peripherals")
-        self.create_peripherals()
+        self.create_peripherals(peripheral_names)
         self.spawn_peripherals()
 
         # Create and spawn controllers
-        self.create_controllers()
+        self.create_controllers(controller_names)
         self.spawn_controllers()
 
         # Wait for all threads to initialize
-        while not self.all_managers_initialized():
-            time.sleep(0.2)
+        if not self.wait_for_managers_initialized(settings.MANAGER_INIT_TIMEOUT):
+            names = [n for n, manager in self.managers() if manager.mode == modes.INIT]
+            message = "Managers did not initialize within {} seconds: {}".format(
+                settings.MANAGER_INIT_TIMEOUT, ", ".join(names)
+            )
+            self.logger.error(message)
+        self.log_manager_timings()
+        if self.config_diff != None:
+            self.log_reconfiguration()
 
-        # Unset new config flag
+        # Unset new config flag and config diff
         self.new_config = False
+        self.config_diff = None
 
         # Transition to normal mode on next state machine update
         self.mode = modes.NORMAL
@@ -336,11 +394,13 @@ class CoordinatorManager(StateMachineManager):
         self.logger.info("Entered NORMAL")
 
         while True:
-            # Overwrite system state in database every 100ms
+            # Record i2c statistics then update modified system state in database
+            # every flush interval
+            self.record_i2c_stats()
             self.update_state()
 
-            # Store environment state in every 10 minutes
-            if time.time() - self.latest_environment_timestamp > 60 * 10:
+            # Store environment state every snapshot interval
+            if self.environment_snapshot_due():
                 self.store_environment()
 
             # Check for events
@@ -350,38 +410,35 @@ class CoordinatorManager(StateMachineManager):
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event, state flush or environment snapshot
+            self.wait_for_event(self.next_update_timestamp() - time.time())
 
     def run_load_mode(self) -> None:
-        """Runs load mode, shutsdown peripheral and controller threads then transitions 
-        to config mode."""
+        """Runs load mode, shutsdown peripheral and controller threads whose config 
+        changed then transitions to config mode. Shutsdown all threads if the new 
+        config could not be compared with the current config."""
         self.logger.info("Entered LOAD")
 
-        # Shutdown peripherals and controllers
-        self.shutdown_peripheral_threads()
-        self.shutdown_controller_threads()
-
-        # Initialize timeout parameters
-        timeout = 10
-        start_time = time.time()
-
-        # Loop forever
-        while True:
-
-            # Check if peripherals and controllers are shutdown
-            if self.all_peripherals_shutdown() and self.all_controllers_shutdown():
-                self.logger.debug("All peripherals and controllers shutdown")
-                break
-
-            # Check for timeout
-            if time.time() - start_time > timeout:
-                self.logger.critical("Config threads did not shutdown")
+        # Shutdown removed and changed peripherals and controllers
+        self.reconfigure_start_time = time.monotonic()
+        stopped_managers = self.shutdown_changed_managers()
+
+        # Wait for changed peripherals and controllers to shutdown
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        latencies = {}
+        for manager in stopped_managers:
+            name = manager.name  # type: ignore
+            if not manager.join(deadline - time.monotonic()):
+                self.logger.critical("{} did not shutdown".format(name))
                 self.mode = modes.ERROR
                 return
+            latencies[name] = time.monotonic() - self.stop_times[name]
+        self.logger.debug("Changed peripherals and controllers shutdown")
+        self.record_shutdown_latency(latencies)
 
-            # Update every 100ms
-            time.sleep(0.1)
+        # Store latest state and wait for queued writes before loading new config
+        self.update_state(force=True)
+        writer.flush()
 
         # Set new config flag
         self.new_config = True
@@ -390,24 +447,45 @@ class CoordinatorManager(StateMachineManager):
         self.mode = modes.CONFIG
 
     def run_reset_mode(self) -> None:
-        """Runs reset mode. Shutsdown child threads then transitions to init."""
+        """Runs reset mode. Shutsdown child threads and stops persistence writer then
+        transitions to init."""
         self.logger.info("Entered RESET")
 
         # Shutdown managers
+        self.config_diff = None
         self.shutdown_peripheral_threads()
         self.shutdown_controller_threads()
         self.recipe.shutdown()
         self.iot.shutdown()
 
+        # Stop persistence writer after committing queued writes so init loads data
+        # files with writes executed inline on the load transaction's connection
+        if not writer.stop(timeout=10):
+            self.logger.critical("Persistence writer did not stop")
+
         # Transition to init mode on next state machine update
         self.mode = modes.INIT
 
+    def run_shutdown_mode(self) -> None:
+        """Runs shutdown mode. Stores latest state and stops persistence writer after 
+        committing queued writes."""
+        self.logger.info("Entered SHUTDOWN")
+
+        # Store latest state and stop persistence writer
+        self.update_state(force=True)
+        if not writer.stop(timeout=10):
+            self.logger.critical("Persistence writer did not shutdown")
+
+        # Break out of run thread on next state machine update
+        self.is_shutdown = True
+
     def run_error_mode(self) -> None:
         """Runs error mode. Shutsdown child threads, waits for new events 
         and transitions."""
         self.logger.info("Entered ERROR")
 
-        # Shutsdown peripheral and controller threads
+        # Shutsdown peripheral and controller threads, recreate all after reset
+        self.config_diff = None
         self.shutdown_peripheral_threads()
         self.shutdown_controller_threads()
 
@@ -421,253 +499,247 @@ class CoordinatorManager(StateMachineManager):
             if self.new_transition(modes.ERROR):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     ##### SUPPORT FUNCTIONS ############################################################
 
-    def update_state(self) -> None:
-        """Updates stored state in database. If state does not exist, creates it."""
-
-        # TODO: Move this to state manager
-
-        if not models.StateModel.objects.filter(pk=1).exists():
-            models.StateModel.objects.create(
-                id=1,
-                device=json.dumps(self.state.device),
-                recipe=json.dumps(self.state.recipe),
-                environment=json.dumps(self.state.environment),
-                peripherals=json.dumps(self.state.peripherals),
-                controllers=json.dumps(self.state.controllers),
-                iot=json.dumps(self.state.iot),
-                resource=json.dumps(self.state.resource),
-                connect=json.dumps(self.state.network),
-                upgrade=json.dumps(self.state.upgrade),
-            )
-        else:
-            models.StateModel.objects.filter(pk=1).update(
-                device=json.dumps(self.state.device),
-                recipe=json.dumps(self.state.recipe),
-                environment=json.dumps(self.state.environment),
-                peripherals=json.dumps(self.state.peripherals),
-                controllers=json.dumps(self.state.controllers),
-                iot=json.dumps(self.state.iot),
-                resource=json.dumps(self.state.resource),
-                connect=json.dumps(self.state.network),  # TODO: migrate this
-                upgrade=json.dumps(self.state.upgrade),
-            )
+    def update_state(self, force: bool = False) -> None:
+        """Updates stored state in database. Only writes state sections that changed 
+        since the last update, at most once per state flush interval unless forced. 
+        If state does not exist, creates it."""
+        self.state_storage.flush(force=force)
+
+    def record_i2c_stats(self) -> None:
+        """Records mux and sampler statistics of each i2c bus and bus lock waits of
+        each peripheral in device state if changed."""
+        stats: Dict[str, Any] = {
+            "muxes": get_mux_stats(),
+            "lock_waits": {},
+            "samplers": {},
+        }
+        if self.bus_manager != None:
+            stats["lock_waits"] = self.bus_manager.stats  # type: ignore
+            stats["samplers"] = self.bus_manager.sampler_stats  # type: ignore
+        with self.state.section_lock("device"):
+            if self.state.device.get("i2c") == stats:
+                return
+            self.state.device["i2c"] = stats
+            self.state.mark_dirty("device")
 
     def load_local_data_files(self) -> None:
-        """ Loads local data files. """
+        """Loads local data files into database in a single transaction. Skips files 
+        that are unchanged since they were last loaded."""
         self.logger.info("Loading local data files")
 
-        # Load files with no verification dependencies first
-        self.load_sensor_variables_file()
-        self.load_actuator_variables_file()
-        self.load_cultivars_file()
-        self.load_cultivation_methods_file()
-
-        # Load recipe files after sensor/actuator variables, cultivars, and
-        # cultivation methods since verification depends on them
-        self.load_recipe_files()
-
-        # Load peripheral setup files after sensor/actuator variable since verification
-        # depends on them
-        self.load_peripheral_setup_files()
+        # Load all data files in a single transaction
+        with transaction.atomic():
 
-        # Load controller setup files after sensor/actuator variable since verification
-        # depends on them
-        self.load_controller_setup_files()
+            # Load files with no verification dependencies first
+            dependencies_changed = self.load_sensor_variables_file()
+            dependencies_changed |= self.load_actuator_variables_file()
+            dependencies_changed |= self.load_cultivars_file()
+            dependencies_changed |= self.load_cultivation_methods_file()
 
-        # Load device config after peripheral setups since verification
-        # depends on  them
-        self.load_device_config_files()
+            # Load recipe files after sensor/actuator variables, cultivars, and
+            # cultivation methods since verification depends on them
+            self.load_recipe_files(force=dependencies_changed)
 
-    def load_sensor_variables_file(self) -> None:
-        """ Loads sensor variables file into database after removing all 
-            existing entries. """
-        self.logger.debug("Loading sensor variables file")
-
-        # Load sensor variables and schema
-        sensor_variables = json.load(open(SENSOR_VARIABLES_PATH))
-        sensor_variables_schema = json.load(open(SENSOR_VARIABLES_SCHEMA_PATH))
-
-        # Validate sensor variables with schema
-        jsonschema.validate(sensor_variables, sensor_variables_schema)
+            # Load peripheral setup files after sensor/actuator variable since
+            # verification depends on them
+            self.load_peripheral_setup_files()
 
-        # Delete sensor variables tables
-        models.SensorVariableModel.objects.all().delete()
+            # Load controller setup files after sensor/actuator variable since
+            # verification depends on them
+            self.load_controller_setup_files()
 
-        # Create sensor variables table
-        for sensor_variable in sensor_variables:
-            models.SensorVariableModel.objects.create(json=json.dumps(sensor_variable))
+            # Load device config after peripheral setups since verification
+            # depends on  them
+            self.load_device_config_files()
 
-    def load_actuator_variables_file(self) -> None:
-        """ Loads actuator variables file into database after removing all 
-            existing entries. """
+    def load_sensor_variables_file(self) -> bool:
+        """Loads sensor variables file into database if changed. Returns true if 
+        file was loaded."""
+        self.logger.debug("Loading sensor variables file")
+        return self.load_data_files(
+            models.SensorVariableModel,
+            SENSOR_VARIABLES_PATH,
+            SENSOR_VARIABLES_SCHEMA_PATH,
+        )
+
+    def load_actuator_variables_file(self) -> bool:
+        """Loads actuator variables file into database if changed. Returns true if 
+        file was loaded."""
         self.logger.debug("Loading actuator variables file")
-
-        # Load actuator variables and schema
-        actuator_variables = json.load(open(ACTUATOR_VARIABLES_PATH))
-        actuator_variables_schema = json.load(open(ACTUATOR_VARIABLES_SCHEMA_PATH))
-
-        # Validate actuator variables with schema
-        jsonschema.validate(actuator_variables, actuator_variables_schema)
-
-        # Delete actuator variables tables
-        models.ActuatorVariableModel.objects.all().delete()
-
-        # Create actuator variables table
-        for actuator_variable in actuator_variables:
-            models.ActuatorVariableModel.objects.create(
-                json=json.dumps(actuator_variable)
-            )
-
-    def load_cultivars_file(self) -> None:
-        """ Loads cultivars file into database after removing all 
-            existing entries."""
+        return self.load_data_files(
+            models.ActuatorVariableModel,
+            ACTUATOR_VARIABLES_PATH,
+            ACTUATOR_VARIABLES_SCHEMA_PATH,
+        )
+
+    def load_cultivars_file(self) -> bool:
+        """Loads cultivars file into database if changed. Returns true if file was 
+        loaded."""
         self.logger.debug("Loading cultivars file")
+        return self.load_data_files(
+            models.CultivarModel, CULTIVARS_PATH, CULTIVARS_SCHEMA_PATH
+        )
 
-        # Load cultivars and schema
-        cultivars = json.load(open(CULTIVARS_PATH))
-        cultivars_schema = json.load(open(CULTIVARS_SCHEMA_PATH))
-
-        # Validate cultivars with schema
-        jsonschema.validate(cultivars, cultivars_schema)
-
-        # Delete cultivars tables
-        models.CultivarModel.objects.all().delete()
-
-        # Create cultivars table
-        for cultivar in cultivars:
-            models.CultivarModel.objects.create(json=json.dumps(cultivar))
-
-    def load_cultivation_methods_file(self) -> None:
-        """ Loads cultivation methods file into database after removing all 
-            existing entries. """
+    def load_cultivation_methods_file(self) -> bool:
+        """Loads cultivation methods file into database if changed. Returns true if 
+        file was loaded."""
         self.logger.debug("Loading cultivation methods file")
+        return self.load_data_files(
+            models.CultivationMethodModel,
+            CULTIVATION_METHODS_PATH,
+            CULTIVATION_METHODS_SCHEMA_PATH,
+        )
 
-        # Load cultivation methods and schema
-        cultivation_methods = json.load(open(CULTIVATION_METHODS_PATH))
-        cultivation_methods_schema = json.load(open(CULTIVATION_METHODS_SCHEMA_PATH))
-
-        # Validate cultivation methods with schema
-        jsonschema.validate(cultivation_methods, cultivation_methods_schema)
-
-        # Delete cultivation methods tables
-        models.CultivationMethodModel.objects.all().delete()
-
-        # Create cultivation methods table
-        for cultivation_method in cultivation_methods:
-            models.CultivationMethodModel.objects.create(
-                json=json.dumps(cultivation_method)
-            )
-
-    def load_recipe_files(self) -> None:
+    def load_recipe_files(self, force: bool = False) -> None:
         """Loads recipe files into database via recipe manager create or update 
-        function."""
+        function. Skips recipe files that are unchanged and already in the database 
+        unless forced, e.g. when verification dependencies changed."""
         self.logger.debug("Loading recipe files")
 
         # Get recipes
         for filepath in glob.glob(RECIPES_PATH):
-            self.logger.debug("Loading recipe file: {}".format(filepath))
             with open(filepath, "r") as f:
                 json_ = f.read().replace("\n", "")
-                message, code = self.recipe.create_or_update_recipe(json_)
-                if code != 200:
-                    filename = filepath.split("/")[-1]
-                    error = "Unable to load {} -> {}".format(filename, message)
-                    self.logger.error(error)
-
-    def load_peripheral_setup_files(self) -> None:
-        """Loads peripheral setup files from codebase into database by creating new 
-        entries after deleting existing entries. Verification depends on sensor and 
-        actuator variables."""
-        self.logger.info("Loading peripheral setup files")
 
-        # Get peripheral setups
-        peripheral_setups = []
-        for filepath in glob.glob(PERIPHERAL_SETUP_FILES_PATH):
-            self.logger.debug("Loading peripheral setup file: {}".format(filepath))
-            peripheral_setups.append(json.load(open(filepath)))
+            # Check if recipe file changed since last load
+            hash_ = self.hash_files([filepath, RECIPE_SCHEMA_PATH])
+            if not force and not self.data_file_changed(filepath, hash_):
+                recipe_uuid = json.loads(json_).get("uuid")
+                if self.recipe.recipe_exists(recipe_uuid):
+                    continue
 
-        # Get get peripheral setup schema
-        # TODO: Finish schema
-        peripheral_setup_schema = json.load(open(PERIPHERAL_SETUP_SCHEMA_PATH))
+            # Create or update recipe
+            self.logger.debug("Loading recipe file: {}".format(filepath))
+            message, code = self.recipe.create_or_update_recipe(json_)
+            if code != 200:
+                filename = filepath.split("/")[-1]
+                error = "Unable to load {} -> {}".format(filename, message)
+                self.logger.error(error)
+                continue
 
-        # Validate peripheral setups with schema
-        for peripheral_setup in peripheral_setups:
-            jsonschema.validate(peripheral_setup, peripheral_setup_schema)
+            # Update data file manifest
+            self.update_data_file_manifest(filepath, hash_)
 
-        # Delete all peripheral setup entries from database
-        models.PeripheralSetupModel.objects.all().delete()
+    def load_peripheral_setup_files(self) -> bool:
+        """Loads peripheral setup files into database if changed. Verification depends 
+        on sensor and actuator variables. Returns true if files were loaded."""
+        self.logger.info("Loading peripheral setup files")
 
+        # TODO: Finish schema
         # TODO: Validate peripheral setup variables with database variables
-
-        # Create peripheral setup entries in database
-        for peripheral_setup in peripheral_setups:
-            models.PeripheralSetupModel.objects.create(
-                json=json.dumps(peripheral_setup)
-            )
-
-    def load_controller_setup_files(self) -> None:
-        """Loads controller setup files from codebase into database by creating new 
-        entries after deleting existing entries. Verification depends on sensor and 
-        actuator variables."""
+        return self.load_data_files(
+            models.PeripheralSetupModel,
+            PERIPHERAL_SETUP_FILES_PATH,
+            PERIPHERAL_SETUP_SCHEMA_PATH,
+        )
+
+    def load_controller_setup_files(self) -> bool:
+        """Loads controller setup files into database if changed. Verification depends 
+        on sensor and actuator variables. Returns true if files were loaded."""
         self.logger.info("Loading controller setup files")
 
-        # Get controller setups
-        controller_setups = []
-        for filepath in glob.glob(CONTROLLER_SETUP_FILES_PATH):
-            self.logger.debug("Loading controller setup file: {}".format(filepath))
-            controller_setups.append(json.load(open(filepath)))
-
-        # Get get controller setup schema
-        controller_setup_schema = json.load(open(CONTROLLER_SETUP_SCHEMA_PATH))
-
-        # Validate peripheral setups with schema
-        for controller_setup in controller_setups:
-            jsonschema.validate(controller_setup, controller_setup_schema)
-
-        # Delete all peripheral setup entries from database
-        models.ControllerSetupModel.objects.all().delete()
-
         # TODO: Validate controller setup variables with database variables
-
-        # Create peripheral setup entries in database
-        for controller_setup in controller_setups:
-            models.ControllerSetupModel.objects.create(
-                json=json.dumps(controller_setup)
-            )
-
-    def load_device_config_files(self) -> None:
-        """Loads device config files from codebase into database by creating new entries 
-        after deleting existing entries. Verification depends on peripheral setups. """
+        return self.load_data_files(
+            models.ControllerSetupModel,
+            CONTROLLER_SETUP_FILES_PATH,
+            CONTROLLER_SETUP_SCHEMA_PATH,
+        )
+
+    def load_device_config_files(self) -> bool:
+        """Loads device config files into database if changed. Verification depends on 
+        peripheral setups. Returns true if files were loaded."""
         self.logger.info("Loading device config files")
 
-        # Get devices
-        device_configs = []
-        for filepath in glob.glob(DEVICE_CONFIG_FILES_PATH):
-            self.logger.debug("Loading device config file: {}".format(filepath))
-            device_configs.append(json.load(open(filepath)))
-
-        # Get get device config schema
         # TODO: Finish schema (see optional objects)
-        device_config_schema = json.load(open(DEVICE_CONFIG_SCHEMA_PATH))
-
-        # Validate device configs with schema
-        for device_config in device_configs:
-            jsonschema.validate(device_config, device_config_schema)
-
         # TODO: Validate device config with peripherals
         # TODO: Validate device config with varibles
+        return self.load_data_files(
+            models.DeviceConfigModel, DEVICE_CONFIG_FILES_PATH, DEVICE_CONFIG_SCHEMA_PATH
+        )
+
+    def load_data_files(self, model: Any, path: str, schema_path: str) -> bool:
+        """Loads data files matching path into model table. Skips files if their 
+        content and schema hash matches the data file manifest. Otherwise validates 
+        files with schema, bulk creates new entries, updates changed entries and 
+        deletes entries no longer in files. Returns true if files were loaded."""
+
+        # Check if files changed since last load
+        filepaths = sorted(glob.glob(path))
+        hash_ = self.hash_files(filepaths + [schema_path])
+        if not self.data_file_changed(path, hash_) and model.objects.exists():
+            self.logger.debug("Skipping unchanged data files: {}".format(path))
+            return False
 
-        # Delete all device config entries from database
-        models.DeviceConfigModel.objects.all().delete()
+        # Load and validate files, files contain an entry or a list of entries
+        entries: List[Dict[str, Any]] = []
+        for filepath in filepaths:
+            self.logger.debug("Loading data file: {}".format(filepath))
+            with open(filepath) as f:
+                data = json.load(f)
+            schemas.validate(data, schema_path)
+            if isinstance(data, list):
+                entries += data
+            else:
+                entries.append(data)
+
+        # Get fields extracted from json on save, first field identifies entries
+        fields = [f.name for f in model._meta.fields if f.name not in ["id", "json"]]
+        key_field = fields[0]
+
+        # Get existing entries
+        existing = {}
+        for key, json_ in model.objects.values_list(key_field, "json"):
+            while isinstance(json_, str):
+                json_ = json.loads(json_)
+            existing[str(key)] = json_
+
+        # Upsert entries, bulk create skips save so set extracted fields here. Fields
+        # are set after init so json is stored the same way as with save.
+        new_entries = []
+        for entry in entries:
+            key = str(entry[key_field])
+            values = {field: entry[field] for field in fields}
+            if key not in existing:
+                instance = model(json=json.dumps(entry))
+                for field, value in values.items():
+                    setattr(instance, field, value)
+                new_entries.append(instance)
+            elif existing[key] != entry:
+                queryset = model.objects.filter(**{key_field: key})
+                queryset.update(json=json.dumps(entry), **values)
+        model.objects.bulk_create(new_entries)
+
+        # Delete entries no longer in files
+        keys = [str(entry[key_field]) for entry in entries]
+        model.objects.exclude(**{key_field + "__in": keys}).delete()
+
+        # Update data file manifest
+        self.update_data_file_manifest(path, hash_)
+        return True
 
-        # Create device config entry if new or update existing
-        for device_config in device_configs:
-            models.DeviceConfigModel.objects.create(json=json.dumps(device_config))
+    def hash_files(self, filepaths: List[str]) -> str:
+        """Gets sha256 hash of file paths and contents."""
+        sha256 = hashlib.sha256()
+        for filepath in filepaths:
+            sha256.update(filepath.encode("utf-8"))
+            with open(filepath, "rb") as f:
+                sha256.update(f.read())
+        return sha256.hexdigest()
+
+    def data_file_changed(self, path: str, hash_: str) -> bool:
+        """Checks if data file hash differs from hash in data file manifest."""
+        return not models.DataFileModel.objects.filter(path=path, hash=hash_).exists()
+
+    def update_data_file_manifest(self, path: str, hash_: str) -> None:
+        """Updates data file hash in data file manifest."""
+        models.DataFileModel.objects.update_or_create(
+            path=path, defaults={"hash": hash_}
+        )
 
     def load_database_stored_state(self) -> None:
         """ Loads stored state from database if it exists. """
@@ -714,12 +786,47 @@ class CoordinatorManager(StateMachineManager):
         stored_iot_state = json.loads(stored_state.iot)
         self.state.iot["stored"] = stored_iot_state.get("stored", {})
 
-    def store_environment(self) -> None:
-        """ Stores current environment state in environment table. """
-        models.EnvironmentModel.objects.create(state=self.state.environment)
+    def load_latest_environment_timestamp(self) -> None:
+        """Loads latest environment timestamp from environment table so snapshots 
+        continue on schedule after a restart. Timestamp is tracked in memory after."""
+        self.logger.debug("Loading latest environment timestamp")
+
+        # Get latest environment timestamp
+        timestamp = (
+            models.EnvironmentModel.objects.order_by("-timestamp")
+            .values_list("timestamp", flat=True)
+            .first()
+        )
+
+        # Check if environment table is empty
+        if timestamp == None:
+            self.latest_environment_timestamp = 0.0
+        else:
+            self.latest_environment_timestamp = float(timestamp.timestamp())
+
+    def next_update_timestamp(self) -> float:
+        """Gets timestamp of the next state flush or environment snapshot."""
+        snapshot_timestamp = (
+            self.latest_environment_timestamp + self.environment_snapshot_interval
+        )
+        return min(self.state_storage.next_flush_timestamp, snapshot_timestamp)
+
+    def environment_snapshot_due(self) -> bool:
+        """Checks if environment snapshot interval has elapsed since the latest stored 
+        environment. Also returns true if the latest stored environment is in the 
+        future (e.g. system clock was adjusted backwards)."""
+        elapsed = time.time() - self.latest_environment_timestamp
+        return elapsed >= self.environment_snapshot_interval or elapsed < 0
 
-    def create_peripherals(self) -> None:
-        """ Creates peripheral managers. """
+    def store_environment(self) -> None:
+        """ Queues current environment state to be stored in environment table. """
+        environment = self.state.snapshot("environment").value
+        writer.submit(models.EnvironmentModel.objects.create, state=environment)
+        self.latest_environment_timestamp = time.time()
+
+    def create_peripherals(self, names: Optional[List[str]] = None) -> None:
+        """Creates peripheral managers. Only creates managers for names if given, 
+        running managers share the existing i2c bus locks and mux simulator."""
         self.logger.info("Creating peripheral managers")
 
         # Verify peripherals are configured
@@ -727,25 +834,26 @@ class CoordinatorManager(StateMachineManager):
             self.logger.info("No peripherals configured")
             return
 
-        # Set var type
-        mux_simulator: Optional[MuxSimulator]
-
         # Inintilize simulation parameters
-        if os.environ.get("SIMULATE") == "true":
-            simulate = True
-            mux_simulator = MuxSimulator()
-        else:
-            simulate = False
-            mux_simulator = None
+        simulate = os.environ.get("SIMULATE") == "true"
+        if names == None or self.bus_manager == None:
+            self.mux_simulator = MuxSimulator() if simulate else None
+
+            # Create i2c bus locks
+            self.bus_manager = I2CBusManager()
 
-        # Create thread locks
-        i2c_lock = threading.RLock()
+            # Forget cached mux channels and reopen bus streams for new managers
+            invalidate_mux_states()
+            close_connections()
 
-        # Create peripheral managers
-        self.peripherals = {}
+        # Get peripheral module and class names and manager parameters
+        manager_parameters = []
         peripheral_config_dicts = self.config_dict.get("peripherals", {})
-        for peripheral_config_dict in peripheral_config_dicts:
-            self.logger.debug("Creating {}".format(peripheral_config_dict["name"]))
+        for index, peripheral_config_dict in enumerate(peripheral_config_dicts):
+
+            # Skip running peripherals
+            if names is not None and peripheral_config_dict["name"] not in names:
+                continue
 
             # Get peripheral setup dict
             peripheral_uuid = peripheral_config_dict["uuid"]
@@ -767,40 +875,147 @@ class CoordinatorManager(StateMachineManager):
             )
             class_name = peripheral_setup_dict["class_name"]
 
-            # Import peripheral library
-            module_instance = __import__(module_name, fromlist=[class_name])
-            class_instance = getattr(module_instance, class_name)
-
-            # Create peripheral manager
+            # Register peripheral environment variables
             peripheral_name = peripheral_config_dict["name"]
-
-            peripheral = class_instance(
-                name=peripheral_name,
-                state=self.state,
-                config=peripheral_config_dict,
-                simulate=simulate,
-                i2c_lock=i2c_lock,
-                mux_simulator=mux_simulator,
+            self.state.register_environment_variables(
+                peripheral_name,
+                get_variable_names(peripheral_config_dict, "sensor"),
+                get_variable_names(peripheral_config_dict, "actuator"),
             )
-            self.peripherals[peripheral_name] = peripheral
 
-    def get_peripheral_setup_dict(self, uuid: str) -> Dict[str, Any]:
-        """Gets peripheral setup dict for uuid in peripheral setup table."""
-        if not models.PeripheralSetupModel.objects.filter(uuid=uuid).exists():
-            return {}
+            # Get peripheral manager parameters, phases stagger peripheral updates
+            # in config order so peripherals do not contend for the bus at once
+            kwargs = {
+                "name": peripheral_name,
+                "state": self.state,
+                "config": peripheral_config_dict,
+                "simulate": simulate,
+                "i2c_lock": self.get_i2c_lock(peripheral_config_dict),
+                "sampler": self.get_i2c_sampler(peripheral_config_dict),
+                "mux_simulator": self.mux_simulator,
+                "phase": index / len(peripheral_config_dicts),
+            }
+            manager_parameters.append((peripheral_name, module_name, class_name, kwargs))
+
+        # Create peripheral managers concurrently
+        managers = self.create_managers(manager_parameters)
+        running = self.peripherals if names != None else {}
+        self.peripherals = self.merge_managers(
+            running, managers, peripheral_config_dicts
+        )
+
+    def get_i2c_bus(self, config_dict: Dict[str, Any]) -> Optional[int]:
+        """Gets peripheral's i2c bus from its communication parameters."""
+        parameters = config_dict.get("parameters") or {}
+        bus = (parameters.get("communication") or {}).get("bus")
+        if bus == "default":
+            bus = os.getenv("DEFAULT_I2C_BUS")
+        if bus is None or bus == "none":
+            return None
+        return int(bus)
+
+    def get_i2c_lock(self, config_dict: Dict[str, Any]) -> Any:
+        """Gets peripheral's lock on its i2c bus. Peripherals with actuators are
+        granted the bus ahead of sensors so actuator writes do not wait behind
+        sensor polls."""
+        if get_variable_names(config_dict, "actuator") != []:
+            priority = HIGH_PRIORITY
         else:
-            json_ = models.PeripheralSetupModel.objects.get(uuid=uuid).json
-        peripheral_setup_dict = json.loads(json_)
-        return peripheral_setup_dict  # type: ignore
+            priority = NORMAL_PRIORITY
+        return self.bus_manager.get_lock(  # type: ignore
+            config_dict["name"], self.get_i2c_bus(config_dict), priority
+        )
+
+    def get_i2c_sampler(self, config_dict: Dict[str, Any]) -> Any:
+        """Gets sampler of peripheral's i2c bus so sensors on the bus overlap their
+        conversions. Peripherals without i2c communication are not sampled."""
+        parameters = config_dict.get("parameters") or {}
+        if parameters.get("communication") == None:
+            return None
+        bus = self.get_i2c_bus(config_dict)
+        return self.bus_manager.get_sampler(bus)  # type: ignore
+
+    def get_config_dict(self, uuid: str) -> Dict[str, Any]:
+        """Gets read-only config dict for uuid in device config table. Raises does 
+        not exist error for unknown uuids."""
+        config_dict = self.config_cache.get(uuid)
+        if config_dict == None:
+            config = models.DeviceConfigModel.objects.get(uuid=uuid)
+            config_dict = freeze(json.loads(config.json))
+            self.config_cache[uuid] = config_dict  # type: ignore
+        return config_dict  # type: ignore
+
+    def get_peripheral_setup_dict(self, uuid: str) -> Dict[str, Any]:
+        """Gets read-only peripheral setup dict for uuid in peripheral setup table."""
+        return self.get_setup_dict(
+            models.PeripheralSetupModel, self.peripheral_setup_cache, uuid
+        )
 
     def get_controller_setup_dict(self, uuid: str) -> Dict[str, Any]:
-        """Gets controller setup dict for uuid in peripheral setup table."""
-        if not models.ControllerSetupModel.objects.filter(uuid=uuid).exists():
-            return {}
-        else:
-            json_ = models.ControllerSetupModel.objects.get(uuid=uuid).json
-        controller_setup_dict = json.loads(json_)
-        return controller_setup_dict  # type: ignore
+        """Gets read-only controller setup dict for uuid in controller setup table."""
+        return self.get_setup_dict(
+            models.ControllerSetupModel, self.controller_setup_cache, uuid
+        )
+
+    def get_setup_dict(
+        self, model: Any, cache: Dict[str, Dict[str, Any]], uuid: str
+    ) -> Dict[str, Any]:
+        """Gets read-only setup dict for uuid from cache or setup table. Returns an 
+        empty dict for unknown uuids."""
+        setup_dict = cache.get(uuid)
+        if setup_dict == None:
+            setup = model.objects.filter(uuid=uuid).first()
+            if setup == None:
+                return {}
+            setup_dict = freeze(json.loads(setup.json))
+            cache[uuid] = setup_dict  # type: ignore
+        return setup_dict  # type: ignore
+
+    def load_config_cache(self) -> None:
+        """Loads device config and its peripheral and controller setup dicts into 
+        caches with one query per table."""
+        self.clear_config_cache()
+        config_dict = self.config_dict
+        tables: List[Tuple[Any, Dict[str, Dict[str, Any]], str]] = [
+            (models.PeripheralSetupModel, self.peripheral_setup_cache, "peripherals"),
+            (models.ControllerSetupModel, self.controller_setup_cache, "controllers"),
+        ]
+        for model, cache, key in tables:
+            uuids = [entry["uuid"] for entry in config_dict.get(key) or []]
+            for setup in model.objects.filter(uuid__in=uuids):
+                cache[str(setup.uuid)] = freeze(json.loads(setup.json))
+
+    def clear_config_cache(self) -> None:
+        """Clears device config and setup caches."""
+        self.config_cache = {}
+        self.peripheral_setup_cache = {}
+        self.controller_setup_cache = {}
+
+    def create_runtime(self) -> None:
+        """Creates runtime that peripheral and controller managers are spawned on
+        from the device config runtime parameters. Managers run as threads unless 
+        the asyncio runtime is configured. Keeps the current runtime if its config 
+        is unchanged, otherwise all managers were shutdown before a full restart."""
+        runtime_config = self.config_dict.get("runtime") or {}
+        if runtime_config == self.runtime_config:
+            return
+
+        # Stop previous runtime
+        if self.runtime != None:
+            self.logger.debug("Stopping async runtime")
+            self.runtime.stop(timeout=5)  # type: ignore
+            self.runtime = None
+        self.runtime_config = runtime_config
+
+        # Create async runtime if configured
+        mode = runtime_config.get("mode", THREADS)
+        self.logger.info("Using {} runtime".format(mode))
+        if mode == ASYNCIO:
+            max_workers = runtime_config.get("max_workers", DEFAULT_MAX_WORKERS)
+            max_entry_workers = runtime_config.get(
+                "max_entry_workers", DEFAULT_MAX_ENTRY_WORKERS
+            )
+            self.runtime = AsyncRuntime(max_workers, max_entry_workers)
 
     def spawn_peripherals(self) -> None:
         """ Spawns peripherals. """
@@ -809,10 +1024,11 @@ class CoordinatorManager(StateMachineManager):
         else:
             self.logger.info("Spawning peripherals")
             for name, manager in self.peripherals.items():
-                manager.spawn()
+                if manager.spawn_time == None:
+                    manager.spawn(self.runtime)
 
-    def create_controllers(self) -> None:
-        """ Creates controller managers. """
+    def create_controllers(self, names: Optional[List[str]] = None) -> None:
+        """Creates controller managers. Only creates managers for names if given."""
         self.logger.info("Creating controller managers")
 
         # Verify controllers are configured
@@ -820,11 +1036,14 @@ class CoordinatorManager(StateMachineManager):
             self.logger.info("No controllers configured")
             return
 
-        # Create controller managers
-        self.controllers = {}
+        # Get controller module and class names and manager parameters
+        manager_parameters = []
         controller_config_dicts = self.config_dict.get("controllers", {})
         for controller_config_dict in controller_config_dicts:
-            self.logger.debug("Creating {}".format(controller_config_dict["name"]))
+
+            # Skip running controllers
+            if names is not None and controller_config_dict["name"] not in names:
+                continue
 
             # Get controller setup dict
             controller_uuid = controller_config_dict["uuid"]
@@ -844,16 +1063,80 @@ class CoordinatorManager(StateMachineManager):
             )
             class_name = controller_setup_dict["class_name"]
 
-            # Import controller library
+            # Get controller manager parameters
+            controller_name = controller_config_dict["name"]
+            kwargs = {
+                "name": controller_name,
+                "state": self.state,
+                "config": controller_config_dict,
+            }
+            manager_parameters.append((controller_name, module_name, class_name, kwargs))
+
+        # Create controller managers concurrently
+        managers = self.create_managers(manager_parameters)
+        running = self.controllers if names != None else {}
+        self.controllers = self.merge_managers(
+            running, managers, controller_config_dicts
+        )
+
+    def merge_managers(
+        self,
+        running: Dict[str, StateMachineManager],
+        created: Dict[str, StateMachineManager],
+        config_dicts: List[Dict[str, Any]],
+    ) -> Dict[str, StateMachineManager]:
+        """Merges running and created managers in device config order."""
+        managers = dict(running, **created)
+        merged = {}
+        for config_dict in config_dicts:
+            name = config_dict["name"]
+            if name in managers:
+                merged[name] = managers[name]
+        return merged
+
+    def create_managers(
+        self, manager_parameters: List[Tuple[str, str, str, Dict[str, Any]]]
+    ) -> Dict[str, StateMachineManager]:
+        """Imports manager classes and creates managers concurrently. Takes a list 
+        of manager name, module name, class name and keyword arguments. Returns 
+        managers by name in the same order."""
+
+        # Submit manager creation to worker threads
+        workers = max(1, min(settings.MANAGER_CREATE_WORKERS, len(manager_parameters)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for name, module_name, class_name, kwargs in manager_parameters:
+                future = executor.submit(
+                    self.create_manager, name, module_name, class_name, kwargs
+                )
+                futures.append((name, future))
+
+            # Get managers, re-raises creation exceptions
+            managers = {}
+            for name, future in futures:
+                manager, duration = future.result()
+                manager.create_duration = duration
+                managers[name] = manager
+        return managers
+
+    def create_manager(
+        self, name: str, module_name: str, class_name: str, kwargs: Dict[str, Any]
+    ) -> Tuple[StateMachineManager, float]:
+        """Imports manager class and creates manager. Returns manager and creation 
+        duration in seconds. Runs in a worker thread."""
+        self.logger.debug("Creating {}".format(name))
+        start_time = time.monotonic()
+        try:
+            # Import manager library
             module_instance = __import__(module_name, fromlist=[class_name])
             class_instance = getattr(module_instance, class_name)
 
-            # Create controller manager
-            controller_name = controller_config_dict["name"]
-            controller_manager = class_instance(
-                controller_name, self.state, controller_config_dict
-            )
-            self.controllers[controller_name] = controller_manager
+            # Create manager
+            manager = class_instance(**kwargs)
+            return manager, time.monotonic() - start_time
+        finally:
+            # Close worker thread database connection
+            connection.close()
 
     def spawn_controllers(self) -> None:
         """ Spawns controllers. """
@@ -862,8 +1145,9 @@ class CoordinatorManager(StateMachineManager):
         else:
             self.logger.info("Spawning controllers")
             for name, manager in self.controllers.items():
-                self.logger.debug("Spawning {}".format(name))
-                manager.spawn()
+                if manager.spawn_time == None:
+                    self.logger.debug("Spawning {}".format(name))
+                    manager.spawn(self.runtime)
 
     def all_managers_initialized(self) -> bool:
         """Checks if all managers have initialized."""
@@ -875,6 +1159,45 @@ class CoordinatorManager(StateMachineManager):
             return False
         return True
 
+    def managers(self) -> List[Tuple[str, StateMachineManager]]:
+        """Gets recipe, peripheral and controller managers the coordinator waits on 
+        during setup."""
+        managers: List[Tuple[str, StateMachineManager]] = [("Recipe", self.recipe)]
+        managers += list(self.peripherals.items())
+        managers += list(self.controllers.items())
+        return managers
+
+    def wait_for_managers_initialized(self, timeout: float) -> bool:
+        """Waits for all managers to leave init mode. Returns false on timeout."""
+        deadline = time.monotonic() + timeout
+        for name, manager in self.managers():
+            remaining = max(0.0, deadline - time.monotonic())
+            if not manager.initialized.wait(remaining):
+                return False
+        return True
+
+    def log_manager_timings(self) -> None:
+        """Logs peripheral and controller creation and initialization timings, 
+        slowest first."""
+
+        # Get manager timings
+        timings = []
+        managers = list(self.peripherals.items()) + list(self.controllers.items())
+        for name, manager in managers:
+            create_duration = manager.create_duration or 0.0
+            init_duration = manager.init_duration or 0.0
+            timings.append((create_duration + init_duration, name, manager))
+
+        # Log timings, slowest first
+        for total, name, manager in sorted(timings, key=lambda timing: -timing[0]):
+            message = "{} created in {:.3f} s, initialized in {:.3f} s ({})".format(
+                name,
+                manager.create_duration or 0.0,
+                manager.init_duration or 0.0,
+                manager.mode,
+            )
+            self.logger.info(message)
+
     def all_peripherals_initialized(self) -> bool:
         """Checks if all peripherals have initialized."""
         for name, manager in self.peripherals.items():
@@ -899,32 +1222,147 @@ class CoordinatorManager(StateMachineManager):
         for name, manager in self.controllers.items():
             manager.shutdown()
 
+    def shutdown_changed_managers(self) -> List[StateMachineManager]:
+        """Shutsdown and removes peripheral and controller managers that are removed 
+        or changed in the config diff, or all managers without a config diff. Records 
+        stop times and returns stopped managers."""
+
+        # Get names of managers to stop
+        diff = self.config_diff
+        if diff is None:
+            peripheral_names = list(self.peripherals)
+            controller_names = list(self.controllers)
+        else:
+            peripheral_names = diff.peripherals.stopped
+            controller_names = diff.controllers.stopped
+
+        # Shutdown managers
+        self.stop_times = {}
+        stopped_managers = []
+        for managers, names in [
+            (self.peripherals, peripheral_names),
+            (self.controllers, controller_names),
+        ]:
+            for name in names:
+                manager = managers.pop(name, None)
+                if manager is None:
+                    continue
+                self.logger.debug("Shutting down {}".format(name))
+                self.stop_times[name] = time.monotonic()
+                manager.shutdown()
+                stopped_managers.append(manager)
+        return stopped_managers
+
+    def clear_stopped_manager_state(self) -> None:
+        """Clears peripheral, controller and reported sensor state of managers stopped 
+        for the config diff. Running managers keep their state."""
+        diff = self.config_diff
+        if diff is None:
+            return
+
+        with self.state.lock:
+            # Clear peripheral and controller state
+            bus_manager = self.bus_manager
+            for name in diff.peripherals.stopped:
+                self.state.peripherals.pop(name, None)
+                if bus_manager is not None:
+                    bus_manager.remove(name)
+            for name in diff.controllers.stopped:
+                self.state.controllers.pop(name, None)
+            self.state.mark_dirty("peripherals")
+            self.state.mark_dirty("controllers")
+
+            # Clear sensor values reported by stopped peripherals
+            for config_dict in self.previous_config_dict.get("peripherals") or []:
+                if config_dict["name"] not in diff.peripherals.stopped:
+                    continue
+                variables = get_variable_names(config_dict, "sensor")
+                self.state.remove_environment_sensor(config_dict["name"], variables)
+
+    def record_shutdown_latency(self, latencies: Dict[str, float]) -> None:
+        """Logs and stores time from shutdown request until each stopped manager
+        exited, with the slowest manager."""
+        if latencies == {}:
+            return
+        slowest = max(latencies, key=lambda name: latencies[name])
+        message = "Shutdown {} managers in {:.3f} s, slowest {}".format(
+            len(latencies), latencies[slowest], slowest
+        )
+        self.logger.info(message)
+
+        # Store shutdown latency in device state
+        with self.state.section_lock("device"):
+            self.state.device["shutdown"] = {
+                "managers": len(latencies),
+                "max_ms": round(latencies[slowest] * 1000, 3),
+                "slowest": slowest,
+                "timeout": SHUTDOWN_TIMEOUT,
+            }
+            self.state.mark_dirty("device")
+
+    def log_reconfiguration(self) -> None:
+        """Logs and stores reconfiguration duration and downtime of each restarted 
+        manager, measured from shutdown until the new manager initialized."""
+        diff = self.config_diff
+        if diff is None:
+            return
+
+        # Get downtime of restarted managers
+        downtimes = {}
+        managers = dict(self.peripherals, **self.controllers)
+        for name in diff.peripherals.changed + diff.controllers.changed:
+            manager = managers.get(name)
+            if manager is None:
+                continue
+            spawn_time, init_duration = manager.spawn_time, manager.init_duration
+            if spawn_time is None or init_duration is None:
+                continue
+            initialized_time = spawn_time + init_duration
+            downtimes[name] = round(initialized_time - self.stop_times[name], 3)
+
+        # Log reconfiguration
+        duration = time.monotonic() - self.reconfigure_start_time  # type: ignore
+        message = "Reconfigured in {:.3f} s, restarted {}, kept {} running".format(
+            duration,
+            len(diff.stopped),
+            len(diff.peripherals.unchanged) + len(diff.controllers.unchanged),
+        )
+        self.logger.info(message)
+        for name, downtime in sorted(downtimes.items(), key=lambda item: -item[1]):
+            self.logger.info("{} down for {:.3f} s".format(name, downtime))
+
+        # Store reconfiguration in device state
+        reconfiguration = diff.to_dict()
+        reconfiguration["duration"] = round(duration, 3)  # type: ignore
+        reconfiguration["downtimes"] = downtimes  # type: ignore
+        with self.state.section_lock("device"):
+            self.state.device["reconfiguration"] = reconfiguration
+            self.state.mark_dirty("device")
+
     def all_peripherals_shutdown(self) -> bool:
         """Check if all peripherals are shutdown."""
         for name, manager in self.peripherals.items():
-            if manager.thread.is_alive():
+            if manager.is_alive():
                 return False
         return True
 
     def all_controllers_shutdown(self) -> bool:
         """Check if all controllers are shutdown."""
         for name, manager in self.controllers.items():
-            if manager.thread.is_alive():
+            if manager.is_alive():
                 return False
         return True
 
     ##### EVENT FUNCTIONS ##############################################################
 
-    def check_events(self) -> None:
-        """Checks for a new event. Only processes one event per call, even if there are
-        multiple in the queue. Events are processed first-in-first-out (FIFO)."""
-
-        # Check for new events
-        if self.event_queue.empty():
-            return
+    def record_event_stats(self) -> None:
+        """Records event queue statistics in device state."""
+        with self.state.section_lock("device"):
+            self.state.device["events"] = self.event_queue.stats
+            self.state.mark_dirty("device")
 
-        # Get request
-        request = self.event_queue.get()
+    def process_event(self, request: Dict[str, Any]) -> None:
+        """Processes event request."""
         self.logger.debug("Received new request: {}".format(request))
 
         # Get request parameters
@@ -970,7 +1408,11 @@ class CoordinatorManager(StateMachineManager):
             return message, 400
 
         # Add load device config event request to event queue
-        request = {"type": events.LOAD_DEVICE_CONFIG, "filename": filename}
+        request = {
+            "type": events.LOAD_DEVICE_CONFIG,
+            "filename": filename,
+            "uuid": uuid,
+        }
         self.event_queue.put(request)
 
         # Successfully added load device config request to event queue
@@ -983,6 +1425,26 @@ class CoordinatorManager(StateMachineManager):
 
         # Get request parameters
         filename = request.get("filename")
+        config_uuid = request.get("uuid")
+
+        # Compare new config with current config so only changed managers restart
+        query = models.DeviceConfigModel.objects.filter(uuid=config_uuid)
+        if config_uuid != None and query.exists():
+            new_config_dict = self.get_config_dict(config_uuid)  # type: ignore
+            self.previous_config_dict = self.config_dict
+            self.config_diff = ConfigDiff(self.previous_config_dict, new_config_dict)
+            self.logger.debug("Config diff: {}".format(self.config_diff.to_dict()))
+
+            # Restart all managers if they move to a different runtime
+            runtime_config = self.previous_config_dict.get("runtime")
+            if new_config_dict.get("runtime") != runtime_config:
+                self.logger.debug("Runtime changed, restarting all managers")
+                self.config_diff = None
+        else:
+            self.config_diff = None
+
+        # Invalidate config caches, next config pass reloads them
+        self.clear_config_cache()
 
         # Write config filename to device config path
         with open(DEVICE_CONFIG_PATH, "w") as f:
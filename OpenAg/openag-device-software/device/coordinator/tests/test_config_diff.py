@@ -0,0 +1,81 @@
+# Import standard python libraries
+import os, sys, time
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import coordinator elements
+from device.coordinator.config_diff import ConfigDiff
+from device.coordinator.manager import CoordinatorManager
+
+# Initialize manager parameters
+MODULE_NAME = "device.utilities.statemachine.manager"
+CLASS_NAME = "StateMachineManager"
+
+# Initialize device configs
+OLD_CONFIG = {
+    "peripherals": [
+        {"name": "Sensor-1", "uuid": "a", "parameters": {"bus": 1}},
+        {"name": "Sensor-2", "uuid": "b", "parameters": {"bus": 1}},
+        {"name": "Light-1", "uuid": "c", "parameters": {"bus": 2}},
+    ],
+    "controllers": None,
+}
+NEW_CONFIG = {
+    "peripherals": [
+        {"name": "Sensor-1", "uuid": "a", "parameters": {"bus": 1}},
+        {"name": "Sensor-2", "uuid": "d", "parameters": {"bus": 1}},
+        {"name": "Pump-1", "uuid": "e", "parameters": {"bus": 2}},
+    ],
+    "controllers": [{"name": "Controller-1", "uuid": "f", "parameters": {}}],
+}
+
+
+def test_config_diff() -> None:
+    diff = ConfigDiff(OLD_CONFIG, NEW_CONFIG)
+    assert diff.peripherals.added == ["Pump-1"]
+    assert diff.peripherals.removed == ["Light-1"]
+    assert diff.peripherals.changed == ["Sensor-2"]
+    assert diff.peripherals.unchanged == ["Sensor-1"]
+    assert diff.peripherals.started == ["Sensor-2", "Pump-1"]
+    assert diff.controllers.added == ["Controller-1"]
+    assert diff.stopped == ["Light-1", "Sensor-2"]
+
+
+def test_config_diff_unchanged_config() -> None:
+    diff = ConfigDiff(OLD_CONFIG, OLD_CONFIG)
+    assert diff.stopped == []
+    assert diff.peripherals.started == []
+
+
+def test_shutdown_changed_managers_keeps_unchanged_managers() -> None:
+    coordinator = CoordinatorManager()
+    names = ["Sensor-1", "Sensor-2", "Light-1"]
+    parameters = [(name, MODULE_NAME, CLASS_NAME, {}) for name in names]
+    coordinator.peripherals = coordinator.create_managers(parameters)
+    coordinator.controllers = {}
+    for manager in coordinator.peripherals.values():
+        manager.spawn()
+
+    # Only removed and changed managers are shutdown
+    coordinator.config_diff = ConfigDiff(OLD_CONFIG, NEW_CONFIG)
+    unchanged_manager = coordinator.peripherals["Sensor-1"]
+    stopped_managers = coordinator.shutdown_changed_managers()
+    assert len(stopped_managers) == 2
+    assert list(coordinator.peripherals) == ["Sensor-1"]
+    assert sorted(coordinator.stop_times) == ["Light-1", "Sensor-2"]
+    for manager in stopped_managers:
+        manager.thread.join(timeout=1)
+        assert not manager.thread.is_alive()
+    assert unchanged_manager.thread.is_alive()
+    unchanged_manager.shutdown()
+
+
+def test_merge_managers_keeps_config_order() -> None:
+    coordinator = CoordinatorManager()
+    running = {"Sensor-1": "running"}
+    created = {"Pump-1": "created", "Sensor-2": "created"}
+    merged = coordinator.merge_managers(
+        running, created, NEW_CONFIG["peripherals"]  # type: ignore
+    )
+    assert list(merged) == ["Sensor-1", "Sensor-2", "Pump-1"]
@@ -0,0 +1,83 @@
+# Import standard python libraries
+import os, sys, json, time
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.persistence.main import writer
+
+# Import coordinator manager
+from device.coordinator.manager import CoordinatorManager
+
+
+def test_load_local_data_files() -> None:
+    manager = CoordinatorManager()
+    manager.load_local_data_files()
+    assert models.SensorVariableModel.objects.exists()
+    assert models.PeripheralSetupModel.objects.exists()
+    assert models.DeviceConfigModel.objects.exists()
+    assert models.RecipeModel.objects.exists()
+
+    # Check json is stored like models created with save and extracted fields match
+    sensor_variable = models.SensorVariableModel.objects.first()
+    assert json.loads(sensor_variable.json)["key"] == sensor_variable.key
+    peripheral_setup = models.PeripheralSetupModel.objects.first()
+    assert json.loads(peripheral_setup.json)["uuid"] == str(peripheral_setup.uuid)
+
+
+def test_load_unchanged_data_files_skips_files() -> None:
+    manager = CoordinatorManager()
+    manager.load_local_data_files()
+    assert not manager.load_sensor_variables_file()
+    assert not manager.load_peripheral_setup_files()
+
+
+def test_load_changed_data_files() -> None:
+    manager = CoordinatorManager()
+    manager.load_local_data_files()
+    num_entries = models.CultivarModel.objects.count()
+
+    # Changed manifest hash reloads file
+    models.DataFileModel.objects.all().update(hash="")
+    models.CultivarModel.objects.first().delete()
+    assert manager.load_cultivars_file()
+    assert models.CultivarModel.objects.count() == num_entries
+
+    # Missing entries reload file
+    models.CultivarModel.objects.all().delete()
+    assert manager.load_cultivars_file()
+    assert models.CultivarModel.objects.count() == num_entries
+
+
+def test_reset_reloads_changed_recipes(transactional_db, monkeypatch):  # type: ignore
+    manager = CoordinatorManager()
+    manager.run_init_mode()
+    assert writer.is_running
+    num_recipes = models.RecipeModel.objects.count()
+
+    # Change recipe files, new recipes are created through the persistence writer
+    manager.run_reset_mode()
+    assert not writer.is_running
+    models.DataFileModel.objects.all().update(hash="")
+    models.RecipeModel.objects.first().delete()
+    recipe = manager.recipe
+    update_recipe = recipe.create_or_update_recipe
+
+    def create_or_update_recipe(json_):  # type: ignore
+        if recipe.recipe_exists(json.loads(json_)["uuid"]):
+            return update_recipe(json_)
+        return recipe.create_recipe(json_)
+
+    monkeypatch.setattr(recipe, "create_or_update_recipe", create_or_update_recipe)
+
+    # Writes run inline on the load transaction instead of waiting on the writer
+    start_time = time.monotonic()
+    manager.run_init_mode()
+    assert time.monotonic() - start_time < 10
+    assert models.RecipeModel.objects.count() == num_recipes
+    assert writer.is_running
+    writer.stop(timeout=10)
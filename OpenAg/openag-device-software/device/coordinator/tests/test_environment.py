@@ -0,0 +1,53 @@
+# Import standard python libraries
+import os, sys, datetime, time
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import django modules
+from django.utils import timezone
+
+# Import app models
+from app import models
+
+# Import coordinator manager
+from device.coordinator.manager import CoordinatorManager
+
+
+def seed_environment(seconds_ago: float) -> None:
+    """Stores an environment snapshot taken seconds ago."""
+    environment = models.EnvironmentModel.objects.create(state={})
+    timestamp = timezone.now() - datetime.timedelta(seconds=seconds_ago)
+    models.EnvironmentModel.objects.filter(pk=environment.pk).update(
+        timestamp=timestamp
+    )
+
+
+def test_snapshot_due_without_stored_environment() -> None:
+    manager = CoordinatorManager()
+    manager.load_latest_environment_timestamp()
+    assert manager.latest_environment_timestamp == 0
+    assert manager.environment_snapshot_due()
+
+
+def test_snapshot_not_due_after_restart_within_interval() -> None:
+    manager = CoordinatorManager()
+    seed_environment(manager.environment_snapshot_interval / 2)
+    manager.load_latest_environment_timestamp()
+    assert manager.latest_environment_timestamp < time.time()
+    assert not manager.environment_snapshot_due()
+
+
+def test_snapshot_due_after_restart_past_interval() -> None:
+    manager = CoordinatorManager()
+    seed_environment(manager.environment_snapshot_interval + 60)
+    manager.load_latest_environment_timestamp()
+    assert manager.environment_snapshot_due()
+
+
+def test_snapshot_due_after_clock_moved_backwards() -> None:
+    manager = CoordinatorManager()
+    seed_environment(-3600)
+    manager.load_latest_environment_timestamp()
+    assert manager.latest_environment_timestamp > time.time()
+    assert manager.environment_snapshot_due()
@@ -0,0 +1,67 @@
+# Import standard python libraries
+import os, sys, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import django modules
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Import app models
+from app import models
+
+# Import coordinator manager
+from device.coordinator.manager import CoordinatorManager
+
+# Initialize manager parameters
+MODULE_NAME = "device.utilities.statemachine.manager"
+CLASS_NAME = "StateMachineManager"
+
+
+def test_create_managers_keeps_order() -> None:
+    coordinator = CoordinatorManager()
+    names = ["Manager-{}".format(index) for index in range(10)]
+    parameters = [(name, MODULE_NAME, CLASS_NAME, {}) for name in names]
+    managers = coordinator.create_managers(parameters)
+    assert list(managers.keys()) == names
+    for manager in managers.values():
+        assert manager.create_duration != None
+
+
+def test_wait_for_managers_initialized() -> None:
+    coordinator = CoordinatorManager()
+    parameters = [("Manager", MODULE_NAME, CLASS_NAME, {})]
+    coordinator.peripherals = coordinator.create_managers(parameters)
+    coordinator.controllers = {}
+
+    # Recipe manager has not been spawned so it is still initializing
+    assert not coordinator.wait_for_managers_initialized(timeout=0.1)
+
+    # Managers initialize once spawned
+    coordinator.recipe.mode = "NORECIPE"
+    coordinator.peripherals["Manager"].spawn()
+    assert coordinator.wait_for_managers_initialized(timeout=1)
+    coordinator.log_manager_timings()
+    coordinator.peripherals["Manager"].mode = "SHUTDOWN"
+
+
+def test_config_cache_avoids_queries() -> None:
+    coordinator = CoordinatorManager()
+    coordinator.load_local_data_files()
+    config = models.DeviceConfigModel.objects.get(name="PFC3 v0.2.0")
+    coordinator.config_uuid = str(config.uuid)
+    coordinator.load_config_cache()
+
+    # Cached config and setup dicts are read without queries
+    with CaptureQueriesContext(connection) as queries:
+        for peripheral_config_dict in coordinator.config_dict["peripherals"]:
+            uuid = peripheral_config_dict["uuid"]
+            assert coordinator.get_peripheral_setup_dict(uuid) != {}
+    assert len(queries) == 0
+
+    # Cached dicts are shared and read-only
+    with pytest.raises(TypeError):
+        coordinator.config_dict["peripherals"] = []
+    coordinator.clear_config_cache()
+    assert coordinator.config_cache == {}
@@ -8,7 +8,7 @@ from typing import Dict, Any, List, Tuple
 # Import device utilities
 from device.utilities.statemachine import manager
 from device.utilities.state.main import State
-from device.utilities import logger, accessors, system
+from device.utilities import logger, system
 from device.utilities.iot import registration
 
 # Import device managers
@@ -105,8 +105,9 @@ class IotManager(manager.StateMachineManager):
     @is_connected.setter
     def is_connected(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             self.state.iot["is_connected"] = value
+            self.state.mark_dirty("iot")
 
     @property
     def is_registered(self) -> bool:
@@ -116,8 +117,9 @@ class IotManager(manager.StateMachineManager):
     @is_registered.setter
     def is_registered(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             self.state.iot["is_registered"] = value
+            self.state.mark_dirty("iot")
 
     @property
     def device_id(self) -> str:
@@ -127,8 +129,9 @@ class IotManager(manager.StateMachineManager):
     @device_id.setter
     def device_id(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             self.state.iot["device_id"] = value
+            self.state.mark_dirty("iot")
 
     @property
     def verification_code(self) -> str:
@@ -138,8 +141,9 @@ class IotManager(manager.StateMachineManager):
     @verification_code.setter
     def verification_code(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             self.state.iot["verification_code"] = value
+            self.state.mark_dirty("iot")
 
     @property
     def prev_message_id(self) -> str:
@@ -150,10 +154,11 @@ class IotManager(manager.StateMachineManager):
     @prev_message_id.setter
     def prev_message_id(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             if "stored" not in self.state.iot:
                 self.state.iot["stored"] = {}
             self.state.iot["stored"]["prev_message_id"] = value
+            self.state.mark_dirty("iot")
 
     @property
     def received_message_count(self) -> int:
@@ -163,8 +168,9 @@ class IotManager(manager.StateMachineManager):
     @received_message_count.setter
     def received_message_count(self, value: int) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             self.state.iot["received_message_count"] = value
+            self.state.mark_dirty("iot")
 
     @property
     def published_message_count(self) -> int:
@@ -174,8 +180,9 @@ class IotManager(manager.StateMachineManager):
     @published_message_count.setter
     def published_message_count(self, value: int) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("iot"):
             self.state.iot["published_message_count"] = value
+            self.state.mark_dirty("iot")
 
     ##### EXTERNAL STATE DECORATORS ####################################################
 
@@ -302,8 +309,8 @@ class IotManager(manager.StateMachineManager):
             if self.new_transition(modes.DISCONNECTED):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait up to 100ms for next event, mqtt client needs frequent updates
+            self.wait_for_event(0.1)
 
     def run_connected_mode(self) -> None:
         """Runs connected mode."""
@@ -336,8 +343,8 @@ class IotManager(manager.StateMachineManager):
             if self.new_transition(modes.CONNECTED):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait up to 100ms for next event, mqtt client needs frequent updates
+            self.wait_for_event(0.1)
 
     ##### IOT PUBLISH FUNCTIONS ###############################################
 
@@ -404,23 +411,17 @@ class IotManager(manager.StateMachineManager):
         self.logger.debug("Publishing environment variables")
 
         # Get environment variables
-        keys = ["reported_sensor_stats", "individual", "instantaneous"]
-        environment_variables = accessors.get_nested_dict_safely(
-            self.state.environment, keys
-        )
-
-        # Ensure environment variables is a dict
-        if environment_variables == None:
-            environment_variables = {}
+        environment_variables = self.state.get_environment_instantaneous_sensor_values()
 
         # Keep a copy of the first set of values (usually None). Why?
         #if self.prev_environment_variables == {}:
         #    self.environment_variables = copy.deepcopy(environment_variables)
 
-        # For each value, only publish the ones that have changed.
+        # For each value, only publish the ones that have changed. Values are built
+        # on each call so they can be kept without copying
         for name, value in environment_variables.items():
             if self.prev_environment_variables.get(name) != value:
-                self.prev_environment_variables[name] = copy.deepcopy(value)
+                self.prev_environment_variables[name] = value
                 self.pubsub.publish_environment_variable(name, value)
 
     def publish_images(self) -> None:
@@ -85,8 +85,9 @@ class NetworkManager(manager.StateMachineManager):
             self.reconnected = False
 
         # Update connection status in shared state
-        with self.state.lock:
+        with self.state.section_lock("network"):
             self.state.network["is_connected"] = value
+            self.state.mark_dirty("network")
 
     @property
     def wifi_ssids(self) -> List[Dict[str, str]]:
@@ -96,8 +97,9 @@ class NetworkManager(manager.StateMachineManager):
     @wifi_ssids.setter
     def wifi_ssids(self, value: List[Dict[str, str]]) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("network"):
             self.state.network["wifi_ssids"] = value
+            self.state.mark_dirty("network")
 
     @property
     def ip_address(self) -> str:
@@ -107,8 +109,9 @@ class NetworkManager(manager.StateMachineManager):
     @ip_address.setter
     def ip_address(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("network"):
             self.state.network["ip_address"] = value
+            self.state.mark_dirty("network")
 
     @property
     def access_point_enabled(self) -> bool:
@@ -118,8 +121,9 @@ class NetworkManager(manager.StateMachineManager):
     @access_point_enabled.setter
     def access_point_enabled(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("network"):
             self.state.network["access_point_enabled"] = value
+            self.state.mark_dirty("network")
 
     ##### EXTERNAL STATE DECORATORS ####################################################
 
@@ -214,8 +218,8 @@ class NetworkManager(manager.StateMachineManager):
             #         # Update connection information
             #         self.update_connection()
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event or connection update
+            self.wait_for_event(last_update_time + update_interval - time.time())
 
     def run_disconnected_mode(self) -> None:
         """Runs normal mode."""
@@ -252,8 +256,8 @@ class NetworkManager(manager.StateMachineManager):
             #         # Re-enable access point
             #         self._enable_raspi_access_point()
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event or connection update
+            self.wait_for_event(last_update_time + update_interval - time.time())
 
         # TODO: SRMoore: DO we need this in Balena?
         # If completing raspi registration, give the iot manager enough time to
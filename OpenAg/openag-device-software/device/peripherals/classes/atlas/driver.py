@@ -1,5 +1,5 @@
 # Import standard python modules
-import time, threading
+import threading
 
 # Import python types
 from typing import Optional, Tuple, Dict, NamedTuple
@@ -9,6 +9,8 @@ from device.utilities.logger import Logger
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
+from device.utilities.measurement import Measurement
 from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
 
 # Import manager elements
@@ -43,11 +45,13 @@ class AtlasDriver:
         simulate: bool = False,
         mux_simulator: Optional[MuxSimulator] = None,
         Simulator: Optional[PeripheralSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
         """ Initializes atlas driver. """
 
         # Initialize parameters
         self.simulate = simulate
+        self.cancel_token = cancel_token or CancelToken()
 
         # Initialize logger
         logname = "Driver({})".format(name)
@@ -109,6 +113,37 @@ class AtlasDriver:
         except Exception as e:
             raise exceptions.ProcessCommandError(logger=self.logger) from e
 
+    def measure_command(
+        self,
+        command_string: str,
+        process_seconds: float,
+        num_bytes: int = 31,
+        retry: bool = True,
+    ) -> Measurement:
+        """Processes command as a measurement. Sends command string to device,
+        yields processing seconds, then reads num response bytes. Yields processing
+        seconds again and reads once more if device is still processing and retry is
+        enabled. Returns response string on success or raises exception on error."""
+        self.logger.debug("Measuring command: {}".format(command_string))
+
+        try:
+            # Send command to device
+            byte_array = bytearray(command_string + "\00", "utf8")
+            self.i2c.write(bytes(byte_array), retry=retry)
+
+            # Give device time to process then read response
+            yield process_seconds
+            response = self.collect_response(num_bytes, retry=retry)
+
+            # Read one more time if device was still processing
+            if response == None:
+                yield process_seconds
+                response = self.collect_response(num_bytes, retry=False)
+            return response
+
+        except Exception as e:
+            raise exceptions.ProcessCommandError(logger=self.logger) from e
+
     def read_response(
         self, process_seconds: float, num_bytes: int, retry: bool = True
     ) -> str:
@@ -116,9 +151,22 @@ class AtlasDriver:
         tries to read num response bytes with optional retry. Returns 
         response string on success or raises exception on error."""
 
-        # Give device time to process
+        # Give device time to process, stop waiting if cancelled
         self.logger.debug("Waiting for {} seconds".format(process_seconds))
-        time.sleep(process_seconds)
+        if self.cancel_token.wait(process_seconds):
+            message = "wait cancelled"
+            raise exceptions.ReadResponseError(message=message, logger=self.logger)
+
+        # Read response, try to read one more time if device was still processing
+        response = self.collect_response(num_bytes, retry=retry)
+        if response == None:
+            return self.read_response(process_seconds, num_bytes, retry=False)
+        return response  # type: ignore
+
+    def collect_response(self, num_bytes: int, retry: bool = True) -> Optional[str]:
+        """Reads num response bytes from device. Returns response string on success,
+        none if device is still processing or has no data and retry is enabled or
+        raises exception on error."""
 
         # Read device dataSet
         try:
@@ -141,7 +189,7 @@ class AtlasDriver:
             # Try to read one more time if retry enabled
             if retry == True:
                 self.logger.debug("Sensor still processing, retrying read")
-                return self.read_response(process_seconds, num_bytes, retry=False)
+                return None
             else:
                 message = "insufficient processing time"
                 raise exceptions.ReadResponseError(message, logger=self.logger)
@@ -152,7 +200,7 @@ class AtlasDriver:
             # Try to read one more time if retry enabled
             if retry == True:
                 self.logger.warning("Sensor reported no data to read, retrying read")
-                return self.read_response(process_seconds, num_bytes, retry=False)
+                return None
             else:
                 message = "insufficient processing time"
                 raise exceptions.ReadResponseError(message=message, logger=self.logger)
@@ -1,5 +1,5 @@
 # Import standard python libraries
-import sys, os, pytest, threading
+import sys, os, pytest, threading, time
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -7,6 +7,8 @@ sys.path.append(os.environ["PROJECT_ROOT"])
 # Import driver elements
 from device.peripherals.classes.atlas.driver import AtlasDriver
 from device.peripherals.classes.atlas.simulator import AtlasSimulator
+from device.peripherals.classes.atlas import exceptions
+from device.utilities.cancellation import CancelToken
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 
 
@@ -193,3 +195,22 @@ def test_factory_reset() -> None:
         Simulator=AtlasSimulator,
     )
     driver.factory_reset()
+
+
+def test_read_response_cancelled() -> None:
+    cancel_token = CancelToken()
+    driver = AtlasDriver(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x64,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+        Simulator=AtlasSimulator,
+        cancel_token=cancel_token,
+    )
+    threading.Timer(0.1, cancel_token.cancel).start()
+    start_time = time.monotonic()
+    with pytest.raises(exceptions.ReadResponseError):
+        driver.read_response(process_seconds=10, num_bytes=31)
+    assert time.monotonic() - start_time < 1
@@ -1,14 +1,17 @@
 # Import python modules
-import os, logging, time, threading, math, json
+import os, logging, time, threading, math
 
 # Import python types
-from typing import Dict, Optional, List, Any, Tuple
+from typing import Dict, Optional, List, Any, Tuple, Hashable
 
 # Import device utilities
 from device.utilities import logger
-from device.utilities.statemachine.manager import StateMachineManager
+from device.utilities.statemachine.manager import StateMachineManager, MAX_EVENT_WAIT
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 from device.utilities.state.main import State
+from device.utilities.setups import setups
+from device.utilities.scheduler import PeriodicScheduler
+from device.utilities.measurement import BusSampler, Measurement, run_measurement
 
 # Import manager elements
 from device.peripherals.classes.peripheral import modes, events
@@ -20,8 +23,7 @@ class PeripheralManager(StateMachineManager):
     # Initialize timing variables
     default_sampling_interval = 5  # seconds
     min_sampling_interval = 2  # seconds
-    last_update = None  # seconds
-    last_update_interval = None  # Seconds
+    error_start_time = 0.0  # seconds
 
     def __init__(
         self,
@@ -31,8 +33,12 @@ class PeripheralManager(StateMachineManager):
         i2c_lock: threading.RLock,
         simulate: bool = False,
         mux_simulator: MuxSimulator = None,
+        phase: float = 0.0,
+        sampler: Optional[BusSampler] = None,
     ) -> None:
-        """Initializes manager."""
+        """Initializes manager. Phase is the fraction of the sampling interval that
+        updates are offset by to spread bus load across peripherals. Sensors on a
+        bus with a sampler overlap their conversions with other sensors."""
 
         # Initialize parent class
         super().__init__()
@@ -44,6 +50,8 @@ class PeripheralManager(StateMachineManager):
         self.i2c_lock = i2c_lock
         self.simulate = simulate
         self.mux_simulator = mux_simulator
+        self.sampler = sampler
+        self.scheduler = PeriodicScheduler(self.default_sampling_interval, phase)
 
         # Initialize logger
         logname = "Manager({})".format(self.name)
@@ -122,6 +130,18 @@ class PeripheralManager(StateMachineManager):
             modes.ERROR: [modes.RESET, modes.SHUTDOWN],
         }
 
+        # Initialize state machine mode entry and update functions
+        self.mode_steps = {
+            modes.INIT: (self.run_init_mode, None),
+            modes.SETUP: (self.run_setup_mode, None),
+            modes.NORMAL: (self.enter_normal_mode, self.update_normal_mode),
+            modes.CALIBRATE: (self.enter_calibrate_mode, self.update_calibrate_mode),
+            modes.MANUAL: (self.enter_manual_mode, self.update_manual_mode),
+            modes.RESET: (self.run_reset_mode, None),
+            modes.ERROR: (self.enter_error_mode, self.update_error_mode),
+            modes.SHUTDOWN: (self.run_shutdown_mode, None),
+        }
+
         # Initialize state machine mode
         self.mode = modes.INIT
 
@@ -147,6 +167,7 @@ class PeripheralManager(StateMachineManager):
     def mode(self, value: str) -> None:
         """Safely updates peripheral mode in device state object."""
         self._mode = value
+        self.signal_initialized(value)
         self.state.set_peripheral_value(self.name, "mode", value)
 
     @property
@@ -182,10 +203,22 @@ class PeripheralManager(StateMachineManager):
     @sampling_interval.setter
     def sampling_interval(self, value: float) -> None:
         """Safely updates sampling interval in state object."""
-        with self.state.lock:
+        with self.state.section_lock("peripherals"):
             if "stored" not in self.state.peripherals[self.name]:
                 self.state.peripherals[self.name]["stored"] = {}
             self.state.peripherals[self.name]["stored"]["sampling_interval"] = value
+            self.state.mark_dirty("peripherals")
+
+    @property
+    def schedule(self) -> Dict[str, Any]:
+        """Gets sampling schedule statistics from shared state object."""
+        value = self.state.get_peripheral_value(self.name, "schedule")
+        return value or {}  # type: ignore
+
+    @schedule.setter
+    def schedule(self, value: Dict[str, Any]) -> None:
+        """Safely updates sampling schedule statistics in shared state object."""
+        self.state.set_peripheral_value(self.name, "schedule", value)
 
     ##### STATE MACHINE FUNCTIONS ######################################################
 
@@ -257,122 +290,134 @@ class PeripheralManager(StateMachineManager):
     def run_normal_mode(self) -> None:
         """Runs normal mode. Executes child class update function every sampling
         interval. Checks for events and transitions after each update."""
+        self.enter_normal_mode()
+        self.run_mode_loop(self.update_normal_mode)
+
+    def enter_normal_mode(self) -> None:
+        """Enters normal mode, schedules first update at the next deadline of the
+        peripheral's phase."""
         self.logger.info("Entered NORMAL")
 
         # Initialize vars
         self._update_complete = True
-        self.last_update = time.time()
+        self.scheduler.set_interval(self.sampling_interval)
+        self.scheduler.start()
 
-        # Loop forever
-        while True:
+    def update_normal_mode(self) -> Optional[float]:
+        """Runs one normal mode update. Returns seconds until the next update is due 
+        or None after a transition."""
 
-            # Update every sampling interval
-            self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval:
-                message = "Updating peripheral, delta: {:.3f}".format(
-                    self.last_update_interval
-                )
-                self.logger.debug(message)
-                self.last_update = time.time()
-                self.update_peripheral()
-
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
+        # Update every sampling interval
+        self.update_scheduled()
 
-            # Check for events
-            self.check_events()
+        # Check for transitions
+        if self.new_transition(modes.NORMAL):
+            return None
 
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
+        # Check for events
+        self.check_events()
 
-            # Update every 100ms
-            time.sleep(0.100)
+        # Check for transitions
+        if self.new_transition(modes.NORMAL):
+            return None
+
+        # Wait for next event or sampling interval
+        return self.scheduler.remaining()
 
     def run_calibrate_mode(self) -> None:
         """Runs calibrate mode. Performs same function as normal mode except for 
         variable reporting functions only update peripheral state instead of both 
         peripheral and environment."""
+        self.enter_calibrate_mode()
+        self.run_mode_loop(self.update_calibrate_mode)
+
+    def enter_calibrate_mode(self) -> None:
+        """Enters calibrate mode, schedules first update immediately."""
         self.logger.info("Entered CALIBRATE")
 
         # Initialize vars
         self._update_complete = True
-        self.last_update = time.time() - self.sampling_interval
+        self.scheduler.set_interval(self.sampling_interval)
+        self.scheduler.start(immediate=True)
 
-        # Loop forever
-        while True:
+    def update_calibrate_mode(self) -> Optional[float]:
+        """Runs one calibrate mode update. Returns seconds until the next update is 
+        due or None after a transition."""
 
-            # Update every sampling interval
-            self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval:
-                self.logger.debug(
-                    "Updating peripheral, time delta: {:.3f} sec".format(
-                        self.last_update_interval
-                    )
-                )
-                self.last_update = time.time()
-                self.update_peripheral()
-
-            # Check for transitions
-            if self.new_transition(modes.CALIBRATE):
-                break
+        # Update every sampling interval
+        self.update_scheduled()
 
-            # Check for events
-            self.check_events()
+        # Check for transitions
+        if self.new_transition(modes.CALIBRATE):
+            return None
 
-            # Check for transitions
-            if self.new_transition(modes.CALIBRATE):
-                break
+        # Check for events
+        self.check_events()
+
+        # Check for transitions
+        if self.new_transition(modes.CALIBRATE):
+            return None
 
-            # Update every 100ms
-            time.sleep(0.100)
+        # Wait for next event or sampling interval
+        return self.scheduler.remaining()
 
     def run_manual_mode(self) -> None:
         """Runs manual mode. Waits for events and transitions."""
+        self.enter_manual_mode()
+        self.run_mode_loop(self.update_manual_mode)
+
+    def enter_manual_mode(self) -> None:
+        """Enters manual mode."""
         self.logger.info("Entered MANUAL")
 
-        # Loop forever
-        while True:
+    def update_manual_mode(self) -> Optional[float]:
+        """Runs one manual mode update. Returns seconds until the next update is due 
+        or None after a transition."""
 
-            # Check for events
-            self.check_events()
+        # Check for events
+        self.check_events()
 
-            # Check for transitions
-            if self.new_transition(modes.MANUAL):
-                break
+        # Check for transitions
+        if self.new_transition(modes.MANUAL):
+            return None
 
-            # Update every 100ms
-            time.sleep(0.100)
+        # Wait for next event
+        return MAX_EVENT_WAIT
 
     def run_error_mode(self) -> None:
         """Runs error mode. Clears reported values then waits for new 
         events and transitions. Tries to reset every hour."""
+        self.enter_error_mode()
+        self.run_mode_loop(self.update_error_mode)
+
+    def enter_error_mode(self) -> None:
+        """Enters error mode, clears reported values."""
         self.logger.info("Entered ERROR")
 
         # Clear reported values
         self.clear_reported_values()
 
         # Initialize vars
-        start_time = time.time()
+        self.error_start_time = time.time()
 
-        # Loop forever
-        while True:
+    def update_error_mode(self) -> Optional[float]:
+        """Runs one error mode update. Returns seconds until the next update is due 
+        or None after a transition."""
 
-            # Check for hourly reset
-            if time.time() - start_time > 3600:  # 1 hour
-                self.mode = modes.RESET
-                break
+        # Check for hourly reset
+        if time.time() - self.error_start_time > 3600:  # 1 hour
+            self.mode = modes.RESET
+            return None
 
-            # Check for events
-            self.check_events()
+        # Check for events
+        self.check_events()
 
-            # Check for transitions
-            if self.new_transition(modes.ERROR):
-                break
+        # Check for transitions
+        if self.new_transition(modes.ERROR):
+            return None
 
-            # Update every 100ms
-            time.sleep(0.1)
+        # Wait for next event or hourly reset
+        return self.error_start_time + 3600 - time.time()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode. Executes child class reset function, checks for any
@@ -400,14 +445,39 @@ class PeripheralManager(StateMachineManager):
 
     ##### HELPER FUNCTIONS #############################################################
 
+    def update_scheduled(self, timestamp: Optional[float] = None) -> None:
+        """Updates peripheral if its sampling deadline passed at timestamp (default
+        now), records schedule jitter and overruns in peripheral state. The update
+        ends its measured duration after timestamp."""
+        start_time = time.monotonic()
+        now = start_time if timestamp is None else timestamp
+        self.scheduler.set_interval(self.sampling_interval, now)
+        if not self.scheduler.due(now):
+            return
+        self.scheduler.begin(now)
+        message = "Updating peripheral, jitter: {:.3f} sec".format(
+            self.scheduler.jitter_last
+        )
+        self.logger.debug(message)
+        self.update_peripheral()
+        self.scheduler.end(now + time.monotonic() - start_time)
+        self.schedule = self.scheduler.to_dict()
+
+    def measure(self, measurement: Measurement) -> Any:
+        """Runs driver measurement. Conversions overlap with other sensors on the
+        bus if sampled, otherwise waits for each conversion in turn. Either way
+        stops waiting once the manager is shutdown."""
+        sampler = self.sampler
+        if sampler is not None:
+            return sampler.sample(measurement, cancel_token=self.cancel_token)
+        return run_measurement(measurement, self.cancel_token)
+
     def load_setup_dict_from_file(self) -> Dict:
-        """Loads setup dict from setup filename parameter."""
+        """Loads setup dict from setup filename parameter. Managers with the same 
+        setup file share one read-only setup dict."""
         self.logger.debug("Loading setup file")
         file_name = self.parameters["setup"]["file_name"]
-        setup_dict = json.load(
-            open("device/peripherals/modules/" + file_name + ".json")
-        )
-        return dict(setup_dict)
+        return setups.load("device/peripherals/modules/" + file_name + ".json")
 
     def initialize_peripheral(self) -> None:
         """Initializes peripheral."""
@@ -471,16 +541,28 @@ class PeripheralManager(StateMachineManager):
         overridden in child class."""
         return "Unknown event request type", 400
 
-    def check_events(self) -> None:
-        """Checks for a new event. Only processes one event per call, even if there are 
-        multiple in the queue. Events are processed first-in-first-out (FIFO)."""
+    def event_key(self, request: Dict[str, Any]) -> Optional[Hashable]:
+        """Gets key of events that supersede queued events with the same key, the 
+        last sampling interval supersedes queued ones. Child classes add their own 
+        keys with peripheral specific event key."""
+        type_ = request.get("type")
+        if type_ == events.SET_SAMPLING_INTERVAL:
+            return type_
+        return self.peripheral_specific_event_key(request)
 
-        # Check for new events
-        if self.event_queue.empty():
-            return
+    def peripheral_specific_event_key(
+        self, request: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """Gets key of peripheral specific events that supersede queued events. This 
+        method should be overridden in child class."""
+        return None
+
+    def record_event_stats(self) -> None:
+        """Records event queue statistics in peripheral state."""
+        self.state.set_peripheral_value(self.name, "events", self.event_queue.stats)
 
-        # Get request
-        request = self.event_queue.get()
+    def process_event(self, request: Dict[str, Any]) -> None:
+        """Processes event request."""
         self.logger.debug("Received new request: {}".format(request))
 
         # Get request parameters
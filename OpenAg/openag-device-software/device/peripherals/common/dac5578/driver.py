@@ -9,6 +9,7 @@ from device.utilities.logger import Logger
 from device.utilities import bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
+from device.utilities.communication.i2c.message import write_message
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 
 # Import driver elements
@@ -65,6 +66,16 @@ class DAC5578Driver:
         message = "Writing output on channel {} to: {:.02F}%".format(channel, percent)
         self.logger.debug(message)
 
+        # Send set output command to dac
+        bytes_ = self.build_output_bytes(channel, percent)
+        try:
+            self.i2c.write(bytes_, retry=retry, disable_mux=disable_mux)
+        except I2CError as e:
+            raise exceptions.WriteOutputError(logger=self.logger) from e
+
+    def build_output_bytes(self, channel: int, percent: int) -> bytes:
+        """Builds set output command bytes for channel."""
+
         # Check valid channel range
         if channel < 0 or channel > 7:
             message = "channel out of range, must be within 0-7"
@@ -81,16 +92,13 @@ class DAC5578Driver:
         else:
             byte = int(percent * 2.55)
 
-        # Send set output command to dac
+        # Build set output command
         self.logger.debug("Writing to dac: ch={}, byte={}".format(channel, byte))
-        try:
-            self.i2c.write(bytes([0x30 + channel, byte, 0x00]), disable_mux=disable_mux)
-        except I2CError as e:
-            raise exceptions.WriteOutputError(logger=self.logger) from e
+        return bytes([0x30 + channel, byte, 0x00])
 
     def write_outputs(self, outputs: dict, retry: bool = True) -> None:
-        """Sets output channels to output percents. Only sets mux once. 
-        Keeps thread locked since relies on mux not changing."""
+        """Sets output channels to output percents. Sends every set output command
+        in one combined transfer so the mux is set and the bus locked once."""
         self.logger.debug("Writing outputs: {}".format(outputs))
 
         # Check output dict is not empty
@@ -103,14 +111,22 @@ class DAC5578Driver:
             message = "output dict must not contain more than 8 entries"
             raise exceptions.WriteOutputsError(message=message, logger=self.logger)
 
-        # Run through each output
+        # Build set output command for each output
+        messages = []
         for channel, percent in outputs.items():
             message = "Writing output for ch {}: {}%".format(channel, percent)
             self.logger.debug(message)
             try:
-                self.write_output(channel, percent, retry=retry)
+                bytes_ = self.build_output_bytes(channel, percent)
             except exceptions.WriteOutputError as e:
                 raise exceptions.WriteOutputsError(logger=self.logger) from e
+            messages.append(write_message(bytes_))
+
+        # Send set output commands to dac
+        try:
+            self.i2c.transfer(messages, retry=retry)
+        except I2CError as e:
+            raise exceptions.WriteOutputsError(logger=self.logger) from e
 
     def read_power_register(self, retry: bool = True) -> Optional[Dict[int, bool]]:
         """Reads power register."""
@@ -118,8 +134,7 @@ class DAC5578Driver:
 
         # Read register
         try:
-            self.i2c.write([0x40], retry=retry)
-            bytes_ = self.i2c.read(2, retry=retry)
+            bytes_ = self.i2c.write_read(bytes([0x40]), 2, retry=retry)
         except I2CError as e:
             raise exceptions.ReadPowerRegisterError(logger=self.logger) from e
 
@@ -2,13 +2,18 @@
 import time, threading
 
 # Import python types
-from typing import NamedTuple, Optional, Tuple
+from typing import NamedTuple, Optional, Tuple, Generator
 
 # Import device utilities
 from device.utilities import logger, bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.measurement import (
+    Measurement,
+    MeasurementCancelled,
+    run_measurement,
+)
 
 # Import driver elements
 from device.peripherals.modules.adafruit_soil import simulator, exceptions
@@ -87,47 +92,58 @@ class AdafruitSoilDriver:
         self, retry: bool = True, total_sample_attempts: int = 3
     ) -> Optional[int]:
         """read the moisture capacitive value"""
-
-        try:
-            self.i2c.write(bytes([0x0F, 0x10]), retry=retry)
-        except I2CError as e:
-            raise exceptions.ReadMoistureError(logger=self.logger) from e
-
-        time.sleep(0.005)
-
-        try:
-            bytes_ = self.i2c.read(2, retry=retry)
-        except I2CError as e:
-            raise exceptions.ReadMoistureError(logger=self.logger) from e
-
-        raw = int.from_bytes(bytes_, byteorder="big", signed=False)
-
-        #  if raw is out of bounds, try again or throw an exception
-        if raw > self.max_moisture:
-            if total_sample_attempts > 0:
-                time.sleep(0.001)
-                return self.read_moisture(
-                    retry=retry, total_sample_attempts=total_sample_attempts - 1
-                )
-            else:
-                raise exceptions.BadMoistureReading(logger=self.logger)
-
-        return raw
+        measurement = self.measure_moisture(retry, total_sample_attempts)
+        return run_measurement(measurement)
 
     def read_temperature(self, retry: bool = True) -> Optional[float]:
         """read temperature value"""
+        return run_measurement(self.measure_temperature(retry=retry))
+
+    def measure(
+        self, retry: bool = True
+    ) -> Generator[float, None, Tuple[Optional[float], Optional[int]]]:
+        """Measures temperature then moisture. Returns temperature and moisture."""
+        temperature = yield from self.measure_temperature(retry=retry)
+        moisture = yield from self.measure_moisture(retry=retry)
+        return temperature, moisture
 
+    def measure_moisture(
+        self, retry: bool = True, total_sample_attempts: int = 3
+    ) -> Measurement:
+        """Measures moisture capacitive value, yields conversion seconds between
+        trigger and collect. Samples again if the value is out of bounds."""
+        while True:
+            try:
+                self.i2c.write(bytes([0x0F, 0x10]), retry=retry)
+                yield 0.005
+                bytes_ = self.i2c.read(2, retry=retry)
+            except (I2CError, MeasurementCancelled) as e:
+                raise exceptions.ReadMoistureError(logger=self.logger) from e
+
+            raw = int.from_bytes(bytes_, byteorder="big", signed=False)
+
+            #  if raw is out of bounds, try again or throw an exception
+            if raw <= self.max_moisture:
+                return raw
+            if total_sample_attempts <= 0:
+                raise exceptions.BadMoistureReading(logger=self.logger)
+            total_sample_attempts -= 1
+            try:
+                yield 0.001
+            except MeasurementCancelled as e:
+                raise exceptions.ReadMoistureError(logger=self.logger) from e
+
+    def measure_temperature(self, retry: bool = True) -> Measurement:
+        """Measures temperature, yields conversion seconds between trigger and
+        collect."""
         try:
             self.i2c.write(bytes([0x00, 0x04]), retry=retry)
-        except I2CError as e:
-            raise exceptions.ReadTemperatureError(logger=self.logger) from e
 
-        # Wait for sensor to process, from Adafruit arduino lib for seesaw
-        time.sleep(0.001)
+            # Wait for sensor to process, from Adafruit arduino lib for seesaw
+            yield 0.001
 
-        try:
             bytes_ = self.i2c.read(4, retry=retry)
-        except I2CError as e:
+        except (I2CError, MeasurementCancelled) as e:
             raise exceptions.ReadTemperatureError(logger=self.logger) from e
 
         raw = int.from_bytes(bytes_, byteorder="big", signed=False)
@@ -93,20 +93,11 @@ class AdafruitSoilManager(manager.PeripheralManager):
         """Updates sensor by reading temperature and moisture values then
         reports them to shared state."""
 
-        # Read temperature
+        # Measure temperature and moisture
         try:
-            temperature = self.driver.read_temperature()
+            temperature, moisture = self.measure(self.driver.measure())
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to read temperature: {}".format(e))
-            self.mode = modes.ERROR
-            self.health = 0.0
-            return
-
-        # Read humidity
-        try:
-            moisture = self.driver.read_moisture()
-        except exceptions.DriverError as e:
-            self.logger.debug("Unable to read moisture: {}".format(e))
+            self.logger.debug("Unable to measure: {}".format(e))
             self.mode = modes.ERROR
             self.health = 0.0
             return
@@ -9,6 +9,8 @@ from device.utilities import maths
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
+from device.utilities.measurement import Measurement, run_measurement
 
 # Import module elements
 from device.peripherals.classes.atlas import driver
@@ -36,6 +38,7 @@ class AtlasCo2Driver(driver.AtlasDriver):
         channel: Optional[int] = None,
         simulate: bool = False,
         mux_simulator: Optional[MuxSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
         """Initializes driver."""
 
@@ -55,6 +58,7 @@ class AtlasCo2Driver(driver.AtlasDriver):
             channel=channel,
             simulate=simulate,
             mux_simulator=mux_simulator,
+            cancel_token=cancel_token,
             Simulator=Simulator,
         )
 
@@ -87,16 +91,19 @@ class AtlasCo2Driver(driver.AtlasDriver):
                     self.logger.debug("Simulated 10 minute wait")
                     break
 
-                # Update every minute
-                time.sleep(60)
+                # Update every minute, stop warming up if cancelled
+                if self.cancel_token.wait(60):
+                    self.logger.debug("Warm up cancelled")
+                    return
 
             # Get initial internal temperature measurement
             self.logger.debug("Taking initial internal temperature reading")
             prev_internal_temperature = self.read_internal_temperature()
 
-            # Wait for a minute if not simulating
-            if not self.simulate:
-                time.sleep(60)
+            # Wait for a minute if not simulating, stop warming up if cancelled
+            if not self.simulate and self.cancel_token.wait(60):
+                self.logger.debug("Warm up cancelled")
+                return
 
             # Wait for sensor to report stable internal temperature
             start_time = time.time()
@@ -120,19 +127,28 @@ class AtlasCo2Driver(driver.AtlasDriver):
                     message = "Internal temperature did not stabilize, timed out"
                     raise exceptions.SetupError(message=message, logger=self.logger)
 
-                # Update every minute
-                time.sleep(60)
+                # Update every minute, stop warming up if cancelled
+                if self.cancel_token.wait(60):
+                    self.logger.debug("Warm up cancelled")
+                    return
 
         except Exception as e:
             raise exceptions.SetupError(logger=self.logger) from e
 
     def read_co2(self, retry: bool = True) -> Optional[float]:
         """Reads co2 value."""
+        return run_measurement(self.measure_co2(retry=retry), self.cancel_token)
+
+    def measure_co2(self, retry: bool = True) -> Measurement:
+        """Measures co2, yields processing seconds between sending the read
+        command and reading the response."""
         self.logger.debug("Reading Co2")
 
         # Get co2 reading from hardware
         try:
-            response = self.process_command("R", process_seconds=0.6, retry=retry)
+            response = yield from self.measure_command(
+                "R", process_seconds=0.6, retry=retry
+            )
         except Exception as e:
             raise exceptions.ReadCo2Error(logger=self.logger) from e
 
@@ -60,6 +60,7 @@ class AtlasCo2Manager(manager.PeripheralManager):
                 channel=self.channel,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize")
@@ -82,7 +83,7 @@ class AtlasCo2Manager(manager.PeripheralManager):
         self.logger.info("Updating")
 
         try:
-            self.co2 = self.driver.read_co2()
+            self.co2 = self.measure(self.driver.measure_co2())
             self.health = 100.0
         except exceptions.DriverError as e:
             self.logger.error("Unable to update")
@@ -11,6 +11,8 @@ from device.utilities import logger, maths
 # from device.utilities.communication.i2c.main import I2C
 # from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
+from device.utilities.measurement import Measurement, run_measurement
 
 # Import driver elements
 from device.peripherals.classes.atlas import driver
@@ -35,6 +37,7 @@ class AtlasDODriver(driver.AtlasDriver):
         channel: Optional[int] = None,
         simulate: bool = False,
         mux_simulator: Optional[MuxSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
         """ Initializes driver. """
 
@@ -54,6 +57,7 @@ class AtlasDODriver(driver.AtlasDriver):
             channel=channel,
             simulate=simulate,
             mux_simulator=mux_simulator,
+            cancel_token=cancel_token,
             Simulator=Simulator,
         )
 
@@ -72,12 +76,19 @@ class AtlasDODriver(driver.AtlasDriver):
 
     def read_do(self, retry: bool = True) -> Optional[float]:
         """Reads dissolved oxygen value."""
+        return run_measurement(self.measure_do(retry=retry), self.cancel_token)
+
+    def measure_do(self, retry: bool = True) -> Measurement:
+        """Measures dissolved oxygen, yields processing seconds between sending the read
+        command and reading the response."""
         self.logger.debug("Reading DO")
 
         # Get dissolved oxygen reading from hardware
         # Assumed dissolved oxygen is only enabled output
         try:
-            response = self.process_command("R", process_seconds=0.6, retry=retry)
+            response = yield from self.measure_command(
+                "R", process_seconds=0.6, retry=retry
+            )
         except Exception as e:
             raise exceptions.ReadDOError(logger=self.logger) from e
 
@@ -92,6 +92,7 @@ class AtlasDOManager(manager.PeripheralManager):
                 channel=self.channel,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize")
@@ -127,7 +128,7 @@ class AtlasDOManager(manager.PeripheralManager):
                 self.driver.set_compensation_ec(self.ec)
 
             # Read pH and update health
-            self.do = self.driver.read_do()
+            self.do = self.measure(self.driver.measure_do())
             self.health = 100.0
 
         except exceptions.DriverError as e:
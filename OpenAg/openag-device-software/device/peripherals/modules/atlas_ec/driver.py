@@ -9,6 +9,8 @@ from device.utilities import maths
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
+from device.utilities.measurement import Measurement, run_measurement
 
 # Import module elements
 from device.peripherals.classes.atlas import driver
@@ -33,6 +35,7 @@ class AtlasECDriver(driver.AtlasDriver):
         channel: Optional[int] = None,
         simulate: bool = False,
         mux_simulator: Optional[MuxSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
         """ Initializes driver. """
 
@@ -52,6 +55,7 @@ class AtlasECDriver(driver.AtlasDriver):
             channel=channel,
             simulate=simulate,
             mux_simulator=mux_simulator,
+            cancel_token=cancel_token,
             Simulator=Simulator,
         )
 
@@ -74,12 +78,19 @@ class AtlasECDriver(driver.AtlasDriver):
     def read_ec(self, retry: bool = True) -> Optional[float]:
         """ Reads ec from sensor, sets significant 
             figures based off error magnitude, returns value in mS/cm. """
+        return run_measurement(self.measure_ec(retry=retry), self.cancel_token)
+
+    def measure_ec(self, retry: bool = True) -> Measurement:
+        """Measures ec, yields processing seconds between sending the read
+        command and reading the response."""
         self.logger.info("Reading EC")
 
         # Get ec reading from hardware
         # Assumes ec is only enabled output
         try:
-            ec_raw = self.process_command("R", process_seconds=0.6, retry=retry)
+            ec_raw = yield from self.measure_command(
+                "R", process_seconds=0.6, retry=retry
+            )
         except Exception as e:
             message = "Driver unable to read ec"
             raise exceptions.ReadECError(message, logger=self.logger) from e
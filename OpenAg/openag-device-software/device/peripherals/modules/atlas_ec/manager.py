@@ -73,6 +73,7 @@ class AtlasECManager(manager.PeripheralManager):
                 channel=self.channel,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize")
@@ -98,7 +99,7 @@ class AtlasECManager(manager.PeripheralManager):
                 self.driver.set_compensation_temperature(self.temperature)
 
             # Read pH and update health
-            self.ec = self.driver.read_ec()
+            self.ec = self.measure(self.driver.measure_ec())
             self.health = 100.0
 
         except exceptions.DriverError as e:
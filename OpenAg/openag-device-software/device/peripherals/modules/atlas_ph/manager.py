@@ -71,6 +71,7 @@ class AtlasPHManager(manager.PeripheralManager):
                 channel=self.channel,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize")
@@ -98,7 +99,7 @@ class AtlasPHManager(manager.PeripheralManager):
                 self.driver.set_compensation_temperature(self.temperature)
 
             # Read pH and update health
-            self.ph = self.driver.read_ph()
+            self.ph = self.measure(self.driver.measure_ph())
             self.health = 100.0
 
         except exceptions.DriverError as e:
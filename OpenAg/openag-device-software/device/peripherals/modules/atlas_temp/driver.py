@@ -9,6 +9,8 @@ from device.utilities import maths
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
+from device.utilities.measurement import Measurement, run_measurement
 
 # Import module elements
 from device.peripherals.classes.atlas import driver
@@ -33,6 +35,7 @@ class AtlasTempDriver(driver.AtlasDriver):
         channel: Optional[int] = None,
         simulate: bool = False,
         mux_simulator: Optional[MuxSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
         """ Initializes driver. """
 
@@ -52,6 +55,7 @@ class AtlasTempDriver(driver.AtlasDriver):
             channel=channel,
             simulate=simulate,
             mux_simulator=mux_simulator,
+            cancel_token=cancel_token,
             Simulator=Simulator,
         )
 
@@ -70,12 +74,19 @@ class AtlasTempDriver(driver.AtlasDriver):
 
     def read_temperature(self, retry: bool = True) -> Optional[float]:
         """Reads temperature value."""
+        return run_measurement(self.measure_temperature(retry=retry), self.cancel_token)
+
+    def measure_temperature(self, retry: bool = True) -> Measurement:
+        """Measures temperature, yields processing seconds between sending the read
+        command and reading the response."""
         self.logger.debug("Reading Temperature")
 
         # Get temperature reading from hardware
         # Assumes temperature output is in celsius
         try:
-            response = self.process_command("R", process_seconds=0.6, retry=retry)
+            response = yield from self.measure_command(
+                "R", process_seconds=0.6, retry=retry
+            )
         except Exception as e:
             raise exceptions.ReadTemperatureError(logger=self.logger) from e
 
@@ -62,6 +62,7 @@ class AtlasTempManager(manager.PeripheralManager):
                 channel=self.channel,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize")
@@ -84,7 +85,7 @@ class AtlasTempManager(manager.PeripheralManager):
         self.logger.info("Updating")
 
         try:
-            self.temperature = self.driver.read_temperature()
+            self.temperature = self.measure(self.driver.measure_temperature())
             self.health = 100.0
         except exceptions.DriverError as e:
             self.logger.error("Unable to update")
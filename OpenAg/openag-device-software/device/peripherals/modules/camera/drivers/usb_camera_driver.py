@@ -14,12 +14,12 @@ from device.peripherals.modules.camera import exceptions
 from device.utilities import usb
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.lazy import lazy_import
 
-# Import pygame modules (only if running Linux!)
+# Import pygame modules on first use (only if running Linux!)
 PLATFORM = os.getenv("PLATFORM")
-if PLATFORM is not None and PLATFORM != "osx-machine" and PLATFORM != "unknown":
-    import pygame
-    import pygame.camera
+pygame = lazy_import("pygame")
+pygame_camera = lazy_import("pygame.camera")
 
 
 class USBCameraDriver(CameraDriver):
@@ -41,7 +41,7 @@ class USBCameraDriver(CameraDriver):
         if PLATFORM is not None and PLATFORM != "osx-machine" and PLATFORM != "unknown":
             # Initialize pygame
             pygame.init()
-            pygame.camera.init()
+            pygame_camera.init()
             self.simulate = simulate
             pygame_loaded = True
         else:
@@ -158,7 +158,7 @@ class USBCameraDriver(CameraDriver):
             if not self._simulate_capture(image_path):
                 resolution_array = self.resolution.split("x")
                 resolution = (int(resolution_array[0]), int(resolution_array[1]))
-                camera = pygame.camera.Camera(camera_path, resolution)
+                camera = pygame_camera.Camera(camera_path, resolution)
                 camera.start()
                 image = camera.get_image()
                 pygame.image.save(image, image_path)
@@ -9,6 +9,7 @@ from device.utilities import logger, bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
 
 # Import driver elements
 from device.peripherals.modules.ccs811 import simulator, exceptions
@@ -49,10 +50,12 @@ class CCS811Driver:
         channel: Optional[int] = None,
         simulate: bool = False,
         mux_simulator: Optional[MuxSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
 
-        # Initialize simulation mode
+        # Initialize simulation mode and cancellable waits
         self.simulate = simulate
+        self.cancel_token = cancel_token or CancelToken()
 
         # Initialize logger
         logname = "Driver({})".format(name)
@@ -97,8 +100,10 @@ class CCS811Driver:
                 # Keep logs active
                 self.logger.info("Warming up, waiting for 20 minutes")
 
-                # Update every 30 seconds
-                time.sleep(30)
+                # Update every 30 seconds, stop warming up if cancelled
+                if self.cancel_token.wait(30):
+                    self.logger.info("Warm up cancelled")
+                    break
 
                 # Break out if simulating
                 if self.simulate:
@@ -277,7 +282,11 @@ class CCS811Driver:
         if not status.data_ready:
             if reread:
                 self.logger.debug("Data not ready yet, re-reading in 1 second")
-                time.sleep(1)
+                if self.cancel_token.wait(1):
+                    message = "wait cancelled"
+                    raise exceptions.ReadAlgorithmDataError(
+                        message=message, logger=self.logger
+                    )
                 self.read_algorithm_data(retry=retry, reread=reread - 1)
             else:
                 message = "data not ready"
@@ -287,9 +296,8 @@ class CCS811Driver:
 
         # Get algorithm data
         try:
-            self.i2c.write(bytes([0x02]), retry=retry)
-            bytes_ = self.i2c.read(4)
-        except I2CError:
+            bytes_ = self.i2c.read_block(0x02, 4, retry=retry)
+        except I2CError as e:
             raise exceptions.ReadAlgorithmDataError(logger=self.logger) from e
 
         # Parse data bytes
@@ -108,6 +108,7 @@ class CCS811Manager(manager.PeripheralManager):  # type: ignore
                 address=self.address,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Unable to initialize")
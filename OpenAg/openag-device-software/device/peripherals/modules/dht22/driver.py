@@ -1,17 +1,12 @@
 # Import standard python modules
 import time, threading
 
-try:
-    import Adafruit_DHT
-    import_ok = True
-except ImportError:
-    import_ok = False
-
 # Import python types
 from typing import NamedTuple, Optional, Dict, Any, Tuple
 
 # Import device utilities
 from device.utilities import logger, bitwise
+from device.utilities.lazy import lazy_import, module_available
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
@@ -19,6 +14,10 @@ from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 # Import driver elements
 from device.peripherals.modules.dht22 import exceptions
 
+# Import dht library on first use
+Adafruit_DHT = lazy_import("Adafruit_DHT")
+import_ok = module_available("Adafruit_DHT")
+
 
 class DHT22Driver:
     """Driver for dht22 temperature and humidity sensor."""
@@ -2,7 +2,7 @@
 import threading, time
 
 # Import python types
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Hashable
 
 # Import device utilities
 from device.utilities import maths
@@ -398,6 +398,15 @@ class LEDDAC5578Manager(manager.PeripheralManager):
         else:
             return "Unknown event request type", 400
 
+    def peripheral_specific_event_key(
+        self, request: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """Gets key of peripheral specific events that supersede queued events, the 
+        last set channel event of a channel supersedes queued ones."""
+        if request.get("type") == events.SET_CHANNEL:
+            return (events.SET_CHANNEL, request.get("channel"))
+        return None
+
     def check_peripheral_specific_events(self, request: Dict[str, Any]) -> None:
         """Checks peripheral specific events."""
         if request["type"] == events.TURN_ON:
@@ -613,13 +622,10 @@ class LEDDAC5578Manager(manager.PeripheralManager):
                         self.logger.exception("Unable to fade driver")
                         return
 
-                    # Check for events
-                    if not self.event_queue.empty():
+                    # Update every 100ms, stop fading as soon as an event arrives
+                    if self.event_queue.wait(0.1):
                         return
 
-                    # Update every 100ms
-                    time.sleep(0.1)
-
                 # Fade down
                 for value in range(100, -10, -10):
 
@@ -631,9 +637,6 @@ class LEDDAC5578Manager(manager.PeripheralManager):
                         self.logger.exception("Unable to fade driver")
                         return
 
-                    # Check for events
-                    if not self.event_queue.empty():
+                    # Update every 100ms, stop fading as soon as an event arrives
+                    if self.event_queue.wait(0.1):
                         return
-
-                    # Update every 100ms
-                    time.sleep(0.1)
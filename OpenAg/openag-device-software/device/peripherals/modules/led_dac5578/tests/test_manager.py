@@ -13,6 +13,7 @@ from device.utilities.state.main import State
 
 # Import peripheral manager
 from device.peripherals.modules.led_dac5578.manager import LEDDAC5578Manager
+from device.peripherals.classes.peripheral import modes
 
 # Load test config and setup
 CONFIG_PATH = "device/peripherals/modules/led_dac5578/tests/config.json"
@@ -95,3 +96,31 @@ def test_shutdown_peripheral() -> None:
     )
     manager.initialize_peripheral()
     manager.shutdown_peripheral()
+
+
+def test_set_channel_events_coalesce() -> None:
+    manager = LEDDAC5578Manager(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        state=State(),
+        config=peripheral_config,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+    )
+    manager.initialize_peripheral()
+    manager.setup_peripheral()
+    manager.mode = modes.MANUAL
+    channel_name = list(manager.channel_names)[0]
+
+    # Queue a burst of set channel events, only the last one is processed
+    for percent in range(0, 110, 10):
+        value = "{},{}".format(channel_name, percent)
+        request = {"type": "Set Channel", "value": value}
+        message, status = manager.create_event(request)
+        assert status == 200
+    assert manager.event_queue.qsize() == 1
+    manager.check_events()
+    assert manager.channel_setpoints[channel_name] == 100
+    events = manager.state.get_peripheral_value("Test", "events")
+    assert events["processed"] == 1
+    assert events["coalesced"] == 10
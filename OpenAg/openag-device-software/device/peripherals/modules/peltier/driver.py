@@ -1,22 +1,22 @@
 # Import standard python modules
 import os, time, threading
-try:
-    import RPi.GPIO as GPIO
-    pi_gpio_available = True
-except ImportError:
-    pi_gpio_available = False
 
 # Import python types
 from typing import NamedTuple, Optional, Tuple, Dict, Any, List
 
 # Import device utilities
 from device.utilities import logger, bitwise
+from device.utilities.lazy import lazy_import, module_available
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 
 from device.peripherals.modules.spacevac import exceptions
 
+# Import gpio library on first use
+GPIO = lazy_import("RPi.GPIO")
+pi_gpio_available = module_available("RPi.GPIO")
+
 
 class PeltierDriver():
     """Driver for array of led panels controlled by a dac5578."""
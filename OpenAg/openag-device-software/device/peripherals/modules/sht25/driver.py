@@ -1,14 +1,19 @@
 # Import standard python modules
-import time, threading
+import threading
 
 # Import python types
-from typing import NamedTuple, Optional, Tuple
+from typing import NamedTuple, Optional, Tuple, Generator
 
 # Import device utilities
 from device.utilities import logger, bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.measurement import (
+    Measurement,
+    MeasurementCancelled,
+    run_measurement,
+)
 
 # Import driver elements
 from device.peripherals.modules.sht25 import simulator, exceptions
@@ -76,6 +81,50 @@ class SHT25Driver:
 
     def read_temperature(self, retry: bool = True) -> Optional[float]:
         """ Reads temperature value."""
+        return run_measurement(self.measure_temperature(retry=retry))
+
+    def read_humidity(self, retry: bool = True) -> Optional[float]:
+        """Reads humidity value."""
+        return run_measurement(self.measure_humidity(retry=retry))
+
+    def measure(
+        self, retry: bool = True
+    ) -> Generator[float, None, Tuple[Optional[float], Optional[float]]]:
+        """Measures temperature then humidity. Returns temperature and humidity."""
+        temperature = yield from self.measure_temperature(retry=retry)
+        humidity = yield from self.measure_humidity(retry=retry)
+        return temperature, humidity
+
+    def measure_temperature(self, retry: bool = True) -> Measurement:
+        """Measures temperature, yields conversion seconds between trigger and
+        collect."""
+        self.trigger_temperature(retry=retry)
+
+        # Wait for sensor to process, see datasheet Table 7
+        # SHT25 is 12-bit so max temperature processing time is 22ms
+        try:
+            yield 0.22
+        except MeasurementCancelled as e:
+            raise exceptions.ReadTemperatureError(logger=self.logger) from e
+
+        return self.collect_temperature(retry=retry)
+
+    def measure_humidity(self, retry: bool = True) -> Measurement:
+        """Measures humidity, yields conversion seconds between trigger and
+        collect."""
+        self.trigger_humidity(retry=retry)
+
+        # Wait for sensor to process, see datasheet Table 7
+        # SHT25 is 12-bit so max humidity processing time is 29ms
+        try:
+            yield 0.29
+        except MeasurementCancelled as e:
+            raise exceptions.ReadHumidityError(logger=self.logger) from e
+
+        return self.collect_humidity(retry=retry)
+
+    def trigger_temperature(self, retry: bool = True) -> None:
+        """Triggers temperature conversion."""
         self.logger.debug("Reading temperature")
 
         # Send read temperature command (no-hold master)
@@ -84,9 +133,8 @@ class SHT25Driver:
         except I2CError as e:
             raise exceptions.ReadTemperatureError(logger=self.logger) from e
 
-        # Wait for sensor to process, see datasheet Table 7
-        # SHT25 is 12-bit so max temperature processing time is 22ms
-        time.sleep(0.22)
+    def collect_temperature(self, retry: bool = True) -> Optional[float]:
+        """Collects converted temperature value."""
 
         # Read sensor data
         try:
@@ -109,8 +157,8 @@ class SHT25Driver:
         self.logger.debug("Temperature: {} C".format(temperature))
         return temperature
 
-    def read_humidity(self, retry: bool = True) -> Optional[float]:
-        """Reads humidity value."""
+    def trigger_humidity(self, retry: bool = True) -> None:
+        """Triggers humidity conversion."""
         self.logger.debug("Reading humidity value from hardware")
 
         # Send read humidity command (no-hold master)
@@ -119,9 +167,8 @@ class SHT25Driver:
         except I2CError as e:
             raise exceptions.ReadHumidityError(logger=self.logger) from e
 
-        # Wait for sensor to process, see datasheet Table 7
-        # SHT25 is 12-bit so max humidity processing time is 29ms
-        time.sleep(0.29)
+    def collect_humidity(self, retry: bool = True) -> Optional[float]:
+        """Collects converted humidity value."""
 
         # Read sensor
         try:
@@ -100,20 +100,11 @@ class SHT25Manager(manager.PeripheralManager):
         """Updates sensor by reading temperature and humidity values then 
         reports them to shared state."""
 
-        # Read temperature
+        # Measure temperature and humidity
         try:
-            temperature = self.driver.read_temperature()
+            temperature, humidity = self.measure(self.driver.measure())
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to read temperature: {}".format(e))
-            self.mode = modes.ERROR
-            self.health = 0.0
-            return
-
-        # Read humidity
-        try:
-            humidity = self.driver.read_humidity()
-        except exceptions.DriverError as e:
-            self.logger.debug("Unable to read humidity: {}".format(e))
+            self.logger.debug("Unable to measure: {}".format(e))
             self.mode = modes.ERROR
             self.health = 0.0
             return
@@ -1,5 +1,5 @@
 # Import standard python libraries
-import os, sys, json, threading, pytest
+import os, sys, json, threading, pytest, time
 
 # Set system path and directory
 ROOT_DIR = os.environ["PROJECT_ROOT"]
@@ -9,9 +9,12 @@ os.chdir(ROOT_DIR)
 # Import device utilities
 from device.utilities import accessors
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.measurement import BusSampler
 from device.utilities.state.main import State
+from device.utilities.statemachine.runtime import AsyncRuntime
 
 # Import peripheral manager
+from device.peripherals.classes.peripheral import modes
 from device.peripherals.modules.sht25.manager import SHT25Manager
 
 # Load test config
@@ -71,6 +74,25 @@ def test_update_peripheral() -> None:
     manager.update_peripheral()
 
 
+def test_update_peripheral_with_sampler() -> None:
+    sampler = BusSampler()
+    manager = SHT25Manager(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        state=State(),
+        config=peripheral_config,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+        sampler=sampler,
+    )
+    manager.state.peripherals = {}
+    manager.initialize_peripheral()
+    manager.update_peripheral()
+    assert manager.temperature != None
+    assert manager.humidity != None
+    assert sampler.measurements == 1
+
+
 def test_reset_peripheral() -> None:
     manager = SHT25Manager(
         name="Test",
@@ -95,3 +117,85 @@ def test_shutdown_peripheral() -> None:
     )
     manager.initialize_peripheral()
     manager.shutdown_peripheral()
+
+
+def test_step_to_normal_mode() -> None:
+    manager = SHT25Manager(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        state=State(),
+        config=peripheral_config,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+    )
+    while manager.mode != modes.NORMAL:
+        assert manager.step() == 0.0
+    assert 0 < manager.step() <= manager.sampling_interval
+    manager.mode = modes.SHUTDOWN
+    assert manager.step() == None
+    assert manager.is_shutdown
+
+
+def test_spawn_async_runtime_shutdown() -> None:
+    runtime = AsyncRuntime(max_workers=2)
+    manager = SHT25Manager(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        state=State(),
+        config=peripheral_config,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+    )
+    manager.spawn(runtime)
+    start_time = time.monotonic()
+    while manager.mode != modes.NORMAL:
+        assert time.monotonic() - start_time < 5
+        time.sleep(0.01)
+    assert manager.is_alive()
+    assert runtime.stats["tasks"] == 1
+
+    # Shutdown event wakes task waiting for next sampling interval
+    start_time = time.monotonic()
+    manager.shutdown()
+    manager.task.result(timeout=5)
+    assert time.monotonic() - start_time < 1
+    assert not manager.is_alive()
+    assert manager.is_shutdown
+    runtime.stop(timeout=5)
+    assert not runtime.thread.is_alive()
+
+
+def test_calibrate_mode_records_schedule() -> None:
+    manager = SHT25Manager(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        state=State(),
+        config=peripheral_config,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+        phase=0.5,
+    )
+    manager.state.peripherals = {}
+    manager.initialize_peripheral()
+    manager.setup_peripheral()
+    manager.mode = modes.CALIBRATE
+    manager.enter_calibrate_mode()
+
+    # Update immediately on a deadline, next deadline is one interval later
+    interval = manager.sampling_interval
+    timestamp = 100.5 * interval
+    manager.scheduler.start(timestamp, immediate=True)
+    manager.update_scheduled(timestamp)
+    assert manager.scheduler.remaining(timestamp) == interval
+    schedule = manager.state.get_peripheral_value("Test", "schedule")
+    assert schedule["samples"] == 1
+    assert schedule["phase"] == 0.5
+    assert schedule["overruns"] == 0
+
+    # Update started just before a deadline overruns it
+    timestamp = manager.scheduler.deadline - 0.000001
+    manager.scheduler.start(timestamp, immediate=True)
+    manager.update_scheduled(timestamp)
+    schedule = manager.state.get_peripheral_value("Test", "schedule")
+    assert schedule["samples"] == 2
+    assert schedule["overruns"] == 1
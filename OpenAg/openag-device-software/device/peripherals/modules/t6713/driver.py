@@ -8,7 +8,9 @@ from typing import NamedTuple, Optional, Tuple
 from device.utilities import logger, bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
 from device.utilities.communication.i2c.exceptions import I2CError
+from device.utilities.measurement import Measurement
 
 # Import driver elements
 from device.peripherals.modules.t6713 import exceptions, simulator
@@ -45,12 +47,14 @@ class T6713Driver:
         channel: Optional[int] = None,
         simulate: Optional[bool] = False,
         mux_simulator: Optional[MuxSimulator] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> None:
         """Initializes t6713 driver."""
 
         # Initialize parameters
         self.simulate = simulate
         self.i2c_lock = i2c_lock
+        self.cancel_token = cancel_token or CancelToken()
 
         # Initialize logger
         logname = "Driver({})".format(name)
@@ -95,8 +99,10 @@ class T6713Driver:
             # Keep logs active
             self.logger.info("Warming up, waiting for 2 minutes")
 
-            # Update every few seconds
-            time.sleep(3)
+            # Update every few seconds, stop warming up if cancelled
+            if self.cancel_token.wait(3):
+                self.logger.info("Warm up cancelled")
+                return
 
             # Break out if simulating
             if self.simulate:
@@ -126,8 +132,10 @@ class T6713Driver:
                     "Warmup period timed out", logger=self.logger
                 )
 
-            # Update every 3 seconds
-            time.sleep(3)
+            # Update every 3 seconds, stop warming up if cancelled
+            if self.cancel_token.wait(3):
+                self.logger.info("Warm up cancelled")
+                return
 
     def read_co2(self, retry: bool = True) -> Optional[float]:
         """Reads co2 value."""
@@ -155,6 +163,14 @@ class T6713Driver:
         self.logger.debug("Co2: {} ppm".format(co2))
         return co2
 
+    def measure_co2(self, retry: bool = True) -> Measurement:
+        """Measures co2. The read command and response must be one locked transaction
+        with the mux held, so co2 is read right away without a conversion for other
+        sensors to overlap."""
+        co2 = self.read_co2(retry=retry)
+        yield from ()
+        return co2
+
     def read_status(self, retry: bool = True) -> Status:
         """Reads status."""
         self.logger.debug("Reading status")
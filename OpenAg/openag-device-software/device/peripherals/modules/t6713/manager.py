@@ -62,6 +62,7 @@ class T6713Manager(manager.PeripheralManager):
                 address=self.address,
                 simulate=self.simulate,
                 mux_simulator=self.mux_simulator,
+                cancel_token=self.cancel_token,
             )
         except exceptions.DriverError as e:
             self.logger.exception("Manager unable to initialize")
@@ -84,7 +85,7 @@ class T6713Manager(manager.PeripheralManager):
 
         # Read co2
         try:
-            co2 = self.driver.read_co2()
+            co2 = self.measure(self.driver.measure_co2())
         except exceptions.DriverError:
             self.logger.exception("Unable to read co2")
             self.mode = modes.ERROR
@@ -1,11 +1,12 @@
 # Import standard python libraries
-import os, sys, pytest, threading
+import os, sys, pytest, threading, time
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
 
 # Import mux simulator
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.cancellation import CancelToken
 
 # Import peripheral driver
 from device.peripherals.modules.t6713.driver import T6713Driver
@@ -77,3 +78,20 @@ def test_disable_abc_logic() -> None:
         mux_simulator=MuxSimulator(),
     )
     driver.disable_abc_logic()
+
+
+def test_setup_cancelled_warm_up() -> None:
+    cancel_token = CancelToken()
+    driver = T6713Driver(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x77,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+        cancel_token=cancel_token,
+    )
+    threading.Timer(0.1, cancel_token.cancel).start()
+    start_time = time.monotonic()
+    driver.setup()
+    assert time.monotonic() - start_time < 1
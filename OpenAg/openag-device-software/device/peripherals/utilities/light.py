@@ -1,12 +1,16 @@
-# Import standard python modules
-import numpy
-
 # Import python types
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, TYPE_CHECKING
 
 # Import device utilities
 from device.utilities import maths
 from device.utilities import accessors
+from device.utilities.lazy import lazy_import
+
+# Import numpy on first use, type checkers import it for annotations
+if TYPE_CHECKING:
+    import numpy
+else:
+    numpy = lazy_import("numpy")
 
 
 def approximate_spd(
@@ -179,7 +183,7 @@ def discretize_spd_dict(spd_dict: Dict[str, float]) -> Dict[str, float]:
 
 
 def solve_setpoints(
-    channel_spd_matrix: numpy.ndarray, desired_spd_vector: numpy.ndarray
+    channel_spd_matrix: "numpy.ndarray", desired_spd_vector: "numpy.ndarray"
 ) -> List[float]:
     """Solves for channel setpoints with a bounded non-negative least squares solver."""
     raw_setpoint_list = maths.bnnls(channel_spd_matrix, desired_spd_vector)
@@ -190,7 +194,7 @@ def solve_setpoints(
 
 
 def calculate_output_spd(
-    channel_spd_matrix: numpy.ndarray, channel_output_vector: List[float]
+    channel_spd_matrix: "numpy.ndarray", channel_output_vector: List[float]
 ) -> List[float]:
     """Calculates ouput spectral power distribution."""
     raw_output_spd = channel_spd_matrix.dot(channel_output_vector)
@@ -10,6 +10,8 @@ from device.utilities.statemachine.manager import StateMachineManager
 
 # Import device state
 from device.utilities.state.main import State
+from device.utilities.persistence.main import writer
+from device.utilities.schemas import schemas
 
 # Import database models
 from app import models
@@ -67,8 +69,10 @@ class RecipeManager(StateMachineManager):
     def mode(self, value: str) -> None:
         """Safely updates recipe mode in shared state."""
         self._mode = value
-        with self.state.lock:
+        self.signal_initialized(value)
+        with self.state.section_lock("recipe"):
             self.state.recipe["mode"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def stored_mode(self) -> Optional[str]:
@@ -82,8 +86,9 @@ class RecipeManager(StateMachineManager):
     @stored_mode.setter
     def stored_mode(self, value: Optional[str]) -> None:
         """Safely updates stored mode in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["stored_mode"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def recipe_uuid(self) -> Optional[str]:
@@ -97,8 +102,9 @@ class RecipeManager(StateMachineManager):
     @recipe_uuid.setter
     def recipe_uuid(self, value: Optional[str]) -> None:
         """Safely updates recipe uuid in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["recipe_uuid"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def recipe_name(self) -> Optional[str]:
@@ -112,8 +118,9 @@ class RecipeManager(StateMachineManager):
     @recipe_name.setter
     def recipe_name(self, value: Optional[str]) -> None:
         """ afely updates recipe name in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["recipe_name"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def is_active(self) -> bool:
@@ -123,8 +130,9 @@ class RecipeManager(StateMachineManager):
     @is_active.setter
     def is_active(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["is_active"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def current_timestamp_minutes(self) -> int:
@@ -161,9 +169,10 @@ class RecipeManager(StateMachineManager):
             start_datestring = None
 
         # Update start timestamp minutes and datestring in shared state
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["start_timestamp_minutes"] = value
             self.state.recipe["start_datestring"] = start_datestring
+            self.state.mark_dirty("recipe")
 
     @property
     def start_datestring(self) -> Optional[str]:
@@ -190,9 +199,10 @@ class RecipeManager(StateMachineManager):
             duration_string = None
 
         # Safely update duration minutes and string in shared state
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["duration_minutes"] = value
             self.state.recipe["duration_string"] = duration_string
+            self.state.mark_dirty("recipe")
 
     @property
     def last_update_minute(self) -> Optional[int]:
@@ -230,13 +240,14 @@ class RecipeManager(StateMachineManager):
             time_elapsed_string = None
 
         # Safely update values in shared state
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["last_update_minute"] = value
             self.state.recipe["percent_complete"] = percent_complete
             self.state.recipe["percent_complete_string"] = percent_complete_string
             self.state.recipe["time_remaining_minutes"] = time_remaining_minutes
             self.state.recipe["time_remaining_string"] = time_remaining_string
             self.state.recipe["time_elapsed_string"] = time_elapsed_string
+            self.state.mark_dirty("recipe")
 
     @property
     def percent_complete(self) -> Optional[float]:
@@ -279,8 +290,9 @@ class RecipeManager(StateMachineManager):
     @current_phase.setter
     def current_phase(self, value: str) -> None:
         """Safely updates current phase in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["current_phase"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def current_cycle(self) -> Optional[str]:
@@ -294,8 +306,9 @@ class RecipeManager(StateMachineManager):
     @current_cycle.setter
     def current_cycle(self, value: Optional[str]) -> None:
         """Safely updates current cycle in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["current_cycle"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def current_environment_name(self) -> Optional[str]:
@@ -309,8 +322,9 @@ class RecipeManager(StateMachineManager):
     @current_environment_name.setter
     def current_environment_name(self, value: Optional[str]) -> None:
         """Safely updates current environment name in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["current_environment_name"] = value
+            self.state.mark_dirty("recipe")
 
     @property
     def current_environment_state(self) -> Any:
@@ -320,9 +334,10 @@ class RecipeManager(StateMachineManager):
     @current_environment_state.setter
     def current_environment_state(self, value: Optional[Dict]) -> None:
         """ Safely updates current environment state in shared state. """
-        with self.state.lock:
+        with self.state.section_lock("recipe"):
             self.state.recipe["current_environment_state"] = value
             self.set_desired_sensor_values(value)  # type: ignore
+            self.state.mark_dirty("recipe")
 
     ##### STATE MACHINE FUNCTIONS ######################################################
 
@@ -401,8 +416,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.NORECIPE):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_start_mode(self) -> None:
         """Runs start mode. Loads commanded recipe uuid into shared state, 
@@ -486,8 +501,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.QUEUED):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_normal_mode(self) -> None:
         """ Runs normal mode. Updates recipe and environment states every minute. 
@@ -523,8 +538,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_pause_mode(self) -> None:
         """Runs pause mode. Clears recipe and desired sensor state, waits for new 
@@ -548,8 +563,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.PAUSE):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_stop_mode(self) -> None:
         """Runs stop mode. Clears recipe and desired sensor state then transitions
@@ -590,8 +605,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.ERROR):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode. Clears error state then transitions to init mode."""
@@ -611,20 +626,29 @@ class RecipeManager(StateMachineManager):
         )
 
     def store_recipe_transitions(self, recipe_transitions: List) -> None:
-        """Stores recipe transitions in database."""
+        """Stores recipe transitions in database. Waits for the write to be committed 
+        since the recipe environment is read from the transitions table next."""
+        writer.submit(self.write_recipe_transitions, recipe_transitions, wait=True)
+
+    def write_recipe_transitions(self, recipe_transitions: List) -> None:
+        """Replaces recipe transitions table entries, called by persistence writer."""
 
         # Clear recipe transitions table in database
         models.RecipeTransitionModel.objects.all().delete()
 
         # Create recipe transitions entries
-        for transitions in recipe_transitions:
-            models.RecipeTransitionModel.objects.create(
-                minute=transitions["minute"],
-                phase=transitions["phase"],
-                cycle=transitions["cycle"],
-                environment_name=transitions["environment_name"],
-                environment_state=transitions["environment_state"],
-            )
+        models.RecipeTransitionModel.objects.bulk_create(
+            [
+                models.RecipeTransitionModel(
+                    minute=transitions["minute"],
+                    phase=transitions["phase"],
+                    cycle=transitions["cycle"],
+                    environment_name=transitions["environment_name"],
+                    environment_state=transitions["environment_state"],
+                )
+                for transitions in recipe_transitions
+            ]
+        )
 
     def update_recipe_environment(self) -> None:
         """ Updates recipe environment. """
@@ -641,9 +665,7 @@ class RecipeManager(StateMachineManager):
 
     def clear_desired_sensor_state(self) -> None:
         """ Sets desired sensor state to null values. """
-        with self.state.lock:
-            for variable in self.state.environment["sensor"]["desired"]:
-                self.state.environment["sensor"]["desired"][variable] = None
+        self.state.clear_environment_desired_sensor_values()
 
     def clear_recipe_state(self) -> None:
         """Sets recipe state to null values."""
@@ -679,26 +701,23 @@ class RecipeManager(StateMachineManager):
 
     def set_desired_sensor_values(self, environment_dict: Dict) -> None:
         """Sets desired sensor values from provided environment dict."""
-        with self.state.lock:
+        with self.state.section_lock("environment"):
             for variable in environment_dict:
                 value = environment_dict[variable]
-                self.state.environment["sensor"]["desired"][variable] = value
+                self.state.set_environment_desired_sensor_value(variable, value)
 
     def validate(
         self, json_: str, should_exist: Optional[bool] = None
     ) -> Tuple[bool, Optional[str]]:
         """Validates a recipe. Returns true if valid."""
 
-        # Load recipe schema
-        schema = json.load(open(RECIPE_SCHEMA_PATH))
-
         # Check valid json and try to parse recipe
         try:
             # Decode json
             recipe = json.loads(json_)
 
-            # Validate recipe against schema
-            jsonschema.validate(recipe, schema)
+            # Validate recipe against cached schema validator
+            schemas.validate(recipe, RECIPE_SCHEMA_PATH)
 
             # Get top level recipe parameters
             format_ = recipe["format"]
@@ -864,16 +883,8 @@ class RecipeManager(StateMachineManager):
         # Return state transitions
         return transitions
 
-    def check_events(self) -> None:
-        """Checks for a new event. Only processes one event per call, even if there are 
-        multiple in the queue. Events are processed first-in-first-out (FIFO)."""
-
-        # Check for new events
-        if self.event_queue.empty():
-            return
-
-        # Get request
-        request = self.event_queue.get()
+    def process_event(self, request: Dict[str, Any]) -> None:
+        """Processes event request."""
         self.logger.debug("Received new request: {}".format(request))
 
         # Get request parameters
@@ -993,7 +1004,9 @@ class RecipeManager(StateMachineManager):
         # Create recipe in database
         try:
             recipe = json.loads(json_)
-            models.RecipeModel.objects.create(json=json.dumps(recipe))
+            writer.submit(
+                models.RecipeModel.objects.create, json=json.dumps(recipe), wait=True
+            )
             message = "Successfully created recipe"
             return message, 200
         except:
@@ -2,15 +2,17 @@
 import os, sys, glob, subprocess, time
 
 # Import python types
-from typing import Dict, List
+from typing import Any, Dict, List
 
 # Import app models
 from app.models import EnvironmentModel, EventModel
+from app.database import checkpoint
 
 # Import device utilities
 from device.utilities import logger, accessors, constants
 from device.utilities.statemachine import manager, modes
 from device.utilities.state.main import State
+from device.utilities.persistence.main import writer
 
 # Import device managers
 from device.iot.manager import IotManager
@@ -80,8 +82,9 @@ class ResourceManager(manager.StateMachineManager):
     @status.setter
     def status(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("resource"):
             self.state.resource["status"] = value
+            self.state.mark_dirty("resource")
 
     @property
     def free_disk(self) -> str:
@@ -92,9 +95,10 @@ class ResourceManager(manager.StateMachineManager):
     @free_disk.setter
     def free_disk(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("resource"):
             # TODO: Fix name
             self.state.resource["available_disk_space"] = value
+            self.state.mark_dirty("resource")
 
     @property
     def free_memory(self) -> str:
@@ -104,8 +108,33 @@ class ResourceManager(manager.StateMachineManager):
     @free_memory.setter
     def free_memory(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("resource"):
             self.state.resource["free_memory"] = value
+            self.state.mark_dirty("resource")
+
+    @property
+    def database(self) -> Dict[str, Any]:
+        """Gets value from shared state."""
+        return self.state.resource.get("database", {})  # type: ignore
+
+    @database.setter
+    def database(self, value: Dict[str, Any]) -> None:
+        """Safely updates value in shared state."""
+        with self.state.section_lock("resource"):
+            self.state.resource["database"] = value
+            self.state.mark_dirty("resource")
+
+    @property
+    def state_locks(self) -> Dict[str, Any]:
+        """Gets value from shared state."""
+        return self.state.resource.get("state_locks", {})  # type: ignore
+
+    @state_locks.setter
+    def state_locks(self, value: Dict[str, Any]) -> None:
+        """Safely updates value in shared state."""
+        with self.state.section_lock("resource"):
+            self.state.resource["state_locks"] = value
+            self.state.mark_dirty("resource")
 
     ##### STATE MACHINE FUNCTIONS ######################################################
 
@@ -140,6 +169,10 @@ class ResourceManager(manager.StateMachineManager):
         last_update_time = 0.0
         update_interval = 300  # seconds -> 5 minutes
 
+        # Initialize last checkpoint time
+        last_checkpoint_time = time.time()
+        checkpoint_interval = settings.SQLITE_CHECKPOINT_INTERVAL
+
         # Loop forever
         while True:
 
@@ -148,6 +181,11 @@ class ResourceManager(manager.StateMachineManager):
                 last_update_time = time.time()
                 self.update_storage()
 
+            # Checkpoint database write-ahead log every checkpoint interval
+            if time.time() - last_checkpoint_time > checkpoint_interval:
+                last_checkpoint_time = time.time()
+                self.checkpoint_database()
+
             # Check for events
             self.check_events()
 
@@ -155,8 +193,12 @@ class ResourceManager(manager.StateMachineManager):
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)  # TODO: Do we really need to update this frequently?
+            # Wait for next event, storage update or checkpoint
+            next_update_time = min(
+                last_update_time + update_interval,
+                last_checkpoint_time + checkpoint_interval,
+            )
+            self.wait_for_event(next_update_time - time.time())
 
     ##### HELPER FUNCTIONS #############################################################
 
@@ -168,6 +210,14 @@ class ResourceManager(manager.StateMachineManager):
         self.free_disk = self.get_free_disk()
         self.free_memory = self.get_free_memory()
 
+        # Update persistence writer queue depth and commit latency in shared state
+        database = dict(writer.stats)
+        database["checkpoint"] = self.database.get("checkpoint")
+        self.database = database
+
+        # Update shared state lock contention statistics
+        self.state_locks = self.state.lock_stats()
+
         # Convert num strings to float
         free_disk = accessors.floatify_string(self.free_disk)
         free_memory = accessors.floatify_string(self.free_disk)
@@ -200,6 +250,28 @@ class ResourceManager(manager.StateMachineManager):
             self.clean_up_disk()
             self.clean_up_database(keep=50)
 
+    def checkpoint_database(self) -> None:
+        """Runs a passive checkpoint of the database write-ahead log. Passive 
+        checkpoints copy as much of the log as possible without waiting on readers 
+        or writers, keeping fsyncs out of the persistence writer commits."""
+        self.logger.debug("Checkpointing database")
+
+        # Checkpoint database
+        try:
+            result = checkpoint()
+        except Exception:
+            self.logger.exception("Unable to checkpoint database")
+            return
+
+        # Check if log was only partially checkpointed
+        if result["checkpointed_frames"] < result["log_frames"]:
+            self.logger.debug("Partial checkpoint: {}".format(result))
+
+        # Update checkpoint result in shared state
+        database = dict(self.database)
+        database["checkpoint"] = result
+        self.database = database
+
     def get_free_disk(self) -> str:
         """Returns the amount of free disk space on Debian and OSX."""
         self.logger.debug("Getting free disk")
@@ -302,31 +374,26 @@ class ResourceManager(manager.StateMachineManager):
                 os.system("rm -f {}".format(filepath))
 
     def clean_up_database(self, keep: int = 0) -> None:
-        """Cleans up database, deletes old entries from event and environment tables."""
+        """Cleans up database, queues deletion of old entries from event and 
+        environment tables."""
         self.logger.info("Cleaning up database")
-
-        # Get number of event entries
-        events = EventModel.objects.all()
-        num_event_entries = len(events)
-
-        # Check for too many event entries
-        if num_event_entries > keep:
-
-            # Delete oldest event entries
-            index = num_event_entries - keep
-            old_events = EventModel.objects.order_by("timestamp")[:index]
-            for event in old_events:
-                event.delete()
-
-        # Get number of environment entries
-        environments = EnvironmentModel.objects.all()
-        num_environment_entries = len(environments)
-
-        # Check for too many environment entries
-        if num_environment_entries > keep:
-
-            # Delete oldest environment entries
-            index = num_environment_entries - keep
-            old_environments = EnvironmentModel.objects.order_by("timestamp")[:index]
-            for environment in old_environments:
-                environment.delete()
+        writer.submit(self.delete_old_database_entries, keep)
+
+    def delete_old_database_entries(self, keep: int) -> None:
+        """Deletes all but the newest entries from event and environment tables, 
+        called by persistence writer."""
+
+        # Clean up each table
+        models_: List[Any] = [EventModel, EnvironmentModel]
+        for model in models_:
+
+            # Check for too many entries
+            num_entries = model.objects.count()
+            if num_entries <= keep:
+                continue
+
+            # Delete oldest entries
+            index = num_entries - keep
+            old_entries = model.objects.order_by("timestamp")[:index]
+            old_pks = list(old_entries.values_list("pk", flat=True))
+            model.objects.filter(pk__in=old_pks).delete()
@@ -19,3 +19,10 @@ from device.resource.manager import ResourceManager
 def test_init() -> None:
     state = State()
     manager = ResourceManager(state, IotManager(state, RecipeManager(state)))
+
+
+def test_checkpoint_database() -> None:
+    state = State()
+    manager = ResourceManager(state, IotManager(state, RecipeManager(state)))
+    manager.checkpoint_database()
+    assert "log_frames" in manager.database["checkpoint"]
@@ -53,8 +53,9 @@ class UpgradeManager(manager.StateMachineManager):
     @status.setter
     def status(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("upgrade"):
             self.state.upgrade["status"] = value
+            self.state.mark_dirty("upgrade")
 
     @property
     def current_version(self) -> str:
@@ -64,8 +65,9 @@ class UpgradeManager(manager.StateMachineManager):
     @current_version.setter
     def current_version(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("upgrade"):
             self.state.upgrade["current_version"] = value
+            self.state.mark_dirty("upgrade")
 
     @property
     def upgrade_version(self) -> str:
@@ -75,8 +77,9 @@ class UpgradeManager(manager.StateMachineManager):
     @upgrade_version.setter
     def upgrade_version(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("upgrade"):
             self.state.upgrade["upgrade_version"] = value
+            self.state.mark_dirty("upgrade")
 
     @property
     def upgrade_available(self) -> bool:
@@ -86,8 +89,9 @@ class UpgradeManager(manager.StateMachineManager):
     @upgrade_available.setter
     def upgrade_available(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.section_lock("upgrade"):
             self.state.upgrade["upgrade_available"] = value
+            self.state.mark_dirty("upgrade")
 
     ##### STATE MACHINE FUNCTIONS ######################################################
 
@@ -143,8 +147,8 @@ class UpgradeManager(manager.StateMachineManager):
             if self.new_transition(modes.AUTOMATIC):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event or upgrade check
+            self.wait_for_event(last_update_time + update_interval - time.time())
 
     def run_manual_mode(self) -> None:
         """Runs manual mode."""
@@ -164,8 +168,8 @@ class UpgradeManager(manager.StateMachineManager):
             if self.new_transition(modes.MANUAL):
                 break
 
-            # Update every minute
-            time.sleep(60)
+            # Wait for next event
+            self.wait_for_event()
 
     ##### HELPER FUNCTIONS #############################################################
 
@@ -1,11 +1,18 @@
 # Import python modules
-import threading, subprocess, numpy
+import threading, subprocess
 
 # Import python types
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, ContextManager, TYPE_CHECKING
 
 # Import device utilities
 from device.utilities import constants
+from device.utilities.lazy import lazy_import
+
+# Import numpy on first use, type checkers import it for annotations
+if TYPE_CHECKING:
+    import numpy
+else:
+    numpy = lazy_import("numpy")
 
 
 def listify_dict(dict_: Dict[str, float]) -> List[float]:
@@ -16,14 +23,14 @@ def listify_dict(dict_: Dict[str, float]) -> List[float]:
     return list_
 
 
-def vectorize_dict(dict_: Dict[str, float]) -> numpy.ndarray:
+def vectorize_dict(dict_: Dict[str, float]) -> "numpy.ndarray":
     """Converts a dict into a vector."""
     list_ = listify_dict(dict_)
     vector = numpy.array(list_)
     return vector
 
 
-def matrixify_nested_dict(nested_dict: Dict[str, Dict[str, float]]) -> numpy.ndarray:
+def matrixify_nested_dict(nested_dict: Dict[str, Dict[str, float]]) -> "numpy.ndarray":
     """Converts a nested dict into a matrix."""
     nested_list = []
     for key, dict_ in nested_dict.items():
@@ -42,7 +49,7 @@ def dictify_list(list_: List[Any], reference_dict: Dict[str, Any]) -> Dict[str,
 
 
 def set_nested_dict_safely(
-    nested_dict: Dict, keys: List, value: Any, lock: threading.RLock
+    nested_dict: Dict, keys: List, value: Any, lock: ContextManager[Any]
 ) -> None:
     """ Safely sets value in nested dict. """
     with lock:
@@ -0,0 +1,59 @@
+# Import standard python modules
+import threading, time
+
+# Import python types
+from typing import Callable, List, Optional
+
+
+class CancelToken:
+    """Cancellable wait for drivers and managers. Waits return as soon as the token
+    is cancelled, e.g. when the owning manager is shutdown, so long sensor warm ups
+    and processing delays do not hold up shutdown."""
+
+    def __init__(self) -> None:
+        """Initializes cancel token."""
+        self.event = threading.Event()
+        self.cancel_time: Optional[float] = None
+        self.callbacks: List[Callable[[], None]] = []
+        self.callbacks_lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Checks if token is cancelled."""
+        return self.event.is_set()
+
+    def cancel(self) -> None:
+        """Cancels token, wakes all waits and calls cancel callbacks."""
+        with self.callbacks_lock:
+            if not self.event.is_set():
+                self.cancel_time = time.monotonic()
+            self.event.set()
+            callbacks = list(self.callbacks)
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Adds callback called when token is cancelled, calls it right away if
+        already cancelled. Used to wait on the token together with other events."""
+        with self.callbacks_lock:
+            if not self.event.is_set():
+                self.callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Removes cancel callback if added."""
+        with self.callbacks_lock:
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
+
+    def clear(self) -> None:
+        """Clears cancellation so token can be waited on again."""
+        self.event.clear()
+        self.cancel_time = None
+
+    def wait(self, seconds: float) -> bool:
+        """Waits for seconds unless cancelled. Returns true if cancelled."""
+        if seconds <= 0:
+            return self.event.is_set()
+        return self.event.wait(seconds)
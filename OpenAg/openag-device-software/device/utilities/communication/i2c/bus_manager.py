@@ -0,0 +1,198 @@
+# Import standard python modules
+import heapq, itertools, threading, time
+
+# Import python types
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Import device utilities
+from device.utilities.measurement import BusSampler
+
+# Import i2c package elements
+from device.utilities.communication.i2c.connection import get_bus_key
+
+# Initialize transaction priorities, lower values are granted the bus first
+HIGH_PRIORITY = 0
+NORMAL_PRIORITY = 1
+
+
+class BusLock(object):
+    """Reentrant lock for one i2c bus. Waiting threads are granted the bus by
+    priority then in arrival order, so actuator writes are not queued behind
+    slow sensor polls."""
+
+    def __init__(self, key: Hashable) -> None:
+        """Initializes bus lock."""
+        self.key = key
+        self.condition = threading.Condition(threading.Lock())
+        self.owner: Optional[int] = None
+        self.count = 0
+        self.waiters: List[Tuple[int, int, int]] = []
+        self.sequence = itertools.count()
+
+    def is_owned(self) -> bool:
+        """Checks if current thread holds lock."""
+        return self.owner == threading.get_ident()
+
+    def acquire(
+        self,
+        priority: int = NORMAL_PRIORITY,
+        blocking: bool = True,
+        timeout: float = -1,
+    ) -> bool:
+        """Acquires lock, waits behind higher priority and earlier waiters. Returns
+        true if acquired."""
+        ident = threading.get_ident()
+        with self.condition:
+            if self.owner == ident:
+                self.count += 1
+                return True
+
+            # Wait until lock is free and this is the first waiter
+            waiter = (priority, next(self.sequence), ident)
+            heapq.heappush(self.waiters, waiter)
+            deadline = time.monotonic() + timeout if timeout >= 0 else None
+            while self.owner != None or self.waiters[0] != waiter:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                if not blocking or (remaining is not None and remaining <= 0):
+                    self.waiters.remove(waiter)
+                    heapq.heapify(self.waiters)
+                    self.condition.notify_all()
+                    return False
+                self.condition.wait(remaining)
+
+            # Take lock
+            heapq.heappop(self.waiters)
+            self.owner = ident
+            self.count = 1
+            return True
+
+    def release(self) -> None:
+        """Releases lock, wakes waiters once fully released."""
+        with self.condition:
+            if self.owner != threading.get_ident():
+                raise RuntimeError("Cannot release un-acquired lock")
+            self.count -= 1
+            if self.count == 0:
+                self.owner = None
+                self.condition.notify_all()
+
+    def __enter__(self) -> bool:
+        """Context manager enter function."""
+        return self.acquire()
+
+    def __exit__(self, *args: Any) -> bool:
+        """Context manager exit function."""
+        self.release()
+        return False  # Don't suppress exceptions
+
+
+class BusLockHandle(object):
+    """A peripheral's lock on its i2c bus. Used in place of an i2c lock, acquires
+    the bus lock at the peripheral's priority and records how long the peripheral
+    waited for the bus."""
+
+    def __init__(self, name: str, lock: BusLock, priority: int) -> None:
+        """Initializes bus lock handle."""
+        self.name = name
+        self.lock = lock
+        self.priority = priority
+
+        # Initialize statistics
+        self.waits = 0
+        self.wait_last = 0.0  # seconds
+        self.wait_total = 0.0  # seconds
+        self.wait_max = 0.0  # seconds
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires bus lock, records wait unless already held."""
+        if self.lock.is_owned():
+            return self.lock.acquire(self.priority)
+        start_time = time.monotonic()
+        acquired = self.lock.acquire(self.priority, blocking, timeout)
+        if acquired:
+            wait = time.monotonic() - start_time
+            self.waits += 1
+            self.wait_last = wait
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+        return acquired
+
+    def release(self) -> None:
+        """Releases bus lock."""
+        self.lock.release()
+
+    def __enter__(self) -> bool:
+        """Context manager enter function."""
+        return self.acquire()
+
+    def __exit__(self, *args: Any) -> bool:
+        """Context manager exit function."""
+        self.release()
+        return False  # Don't suppress exceptions
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Gets lock wait statistics as a json serializable dict."""
+        average = self.wait_total / self.waits if self.waits else 0.0
+        return {
+            "bus": "-".join(str(part) for part in self.lock.key),  # type: ignore
+            "priority": self.priority,
+            "waits": self.waits,
+            "last_wait_ms": round(self.wait_last * 1000, 3),
+            "average_wait_ms": round(average * 1000, 3),
+            "max_wait_ms": round(self.wait_max * 1000, 3),
+        }
+
+
+class I2CBusManager(object):
+    """Keeps one prioritized lock per i2c backend and bus so transactions on
+    independent buses run in parallel while transactions on the same bus are
+    serialized."""
+
+    def __init__(self) -> None:
+        """Initializes bus manager."""
+        self.locks: Dict[Hashable, BusLock] = {}
+        self.handles: Dict[str, BusLockHandle] = {}
+        self.samplers: Dict[Hashable, BusSampler] = {}
+        self.lock = threading.Lock()
+
+    def get_lock(
+        self, name: str, bus: Optional[int], priority: int = NORMAL_PRIORITY
+    ) -> BusLockHandle:
+        """Gets peripheral's lock on bus."""
+        key = get_bus_key(bus)
+        with self.lock:
+            if key not in self.locks:
+                self.locks[key] = BusLock(key)
+            handle = BusLockHandle(name, self.locks[key], priority)
+            self.handles[name] = handle
+            return handle
+
+    def get_sampler(self, bus: Optional[int]) -> BusSampler:
+        """Gets sampler shared by sensors on bus."""
+        key = get_bus_key(bus)
+        with self.lock:
+            if key not in self.samplers:
+                name = "-".join(str(part) for part in key)  # type: ignore
+                self.samplers[key] = BusSampler("BusSampler-" + name)
+            return self.samplers[key]
+
+    def remove(self, name: str) -> None:
+        """Removes peripheral's lock statistics."""
+        with self.lock:
+            self.handles.pop(name, None)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Gets lock wait statistics of each peripheral."""
+        with self.lock:
+            return {name: handle.to_dict() for name, handle in self.handles.items()}
+
+    @property
+    def sampler_stats(self) -> Dict[str, Any]:
+        """Gets pipelined measurement statistics of each bus."""
+        with self.lock:
+            return {
+                sampler.name: sampler.to_dict() for sampler in self.samplers.values()
+            }
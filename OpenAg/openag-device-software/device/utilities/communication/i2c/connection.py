@@ -0,0 +1,129 @@
+# Import standard python modules
+import io, os, threading
+
+# Import python types
+from typing import Any, Dict, Hashable, Optional
+
+# Import device utilities
+from device.utilities.logger import Logger
+from device.utilities.lazy import lazy_import
+
+# Import usb-i2c driver on first use
+pyftdi_i2c = lazy_import("pyftdi.i2c")
+
+# Import i2c package elements
+from device.utilities.communication.i2c.exceptions import InitError
+
+# Initialize io stream locations
+DEVICE_PATH = "/dev/i2c-{}"
+FTDI_URL = "ftdi://ftdi:232h/1"
+
+
+class BusConnection(object):
+    """Persistent io stream to an i2c bus shared by every device io on the bus.
+    The stream is opened on first use, reused across threads under the connection
+    lock and closed after an error so the next transaction reopens it."""
+
+    def __init__(self, key: Hashable, bus: Optional[int] = None) -> None:
+        """Initializes bus connection."""
+        self.key = key
+        self.bus = bus
+        self.lock = threading.RLock()
+        self.io: Any = None
+
+        # Initialize logger
+        logname = "BusConnection({})".format(bus)
+        self.logger = Logger(logname, __name__)
+
+        # Initialize statistics
+        self.opens = 0
+        self.transactions = 0
+        self.errors = 0
+
+    def open(self) -> Any:
+        """Gets io stream, opens stream if not already open."""
+        with self.lock:
+            if self.io != None:
+                return self.io
+            try:
+                if os.getenv("IS_I2C_ENABLED") == "true":
+                    device_name = DEVICE_PATH.format(self.bus)
+                    self.io = io.open(device_name, "r+b", buffering=0)
+                elif os.getenv("IS_USB_I2C_ENABLED") == "true":
+                    device_name = FTDI_URL
+                    controller = pyftdi_i2c.I2cController()
+                    controller.configure(device_name)  # type: ignore
+                    self.io = controller
+                else:
+                    message = "Platform does not support i2c communication"
+                    raise InitError(message)
+            except (
+                PermissionError,
+                pyftdi_i2c.I2cIOError,
+                pyftdi_i2c.I2cNackError,
+            ) as e:
+                message = "Unable to open device io: {}".format(device_name)
+                raise InitError(message, logger=self.logger) from e
+            self.opens += 1
+            self.logger.debug("Opened io stream: {}".format(device_name))
+            return self.io
+
+    def close(self) -> None:
+        """Closes io stream if open."""
+        with self.lock:
+            if self.io == None:
+                return
+            try:
+                if isinstance(self.io, io.IOBase):
+                    self.io.close()
+                else:
+                    self.io.terminate()
+            except:
+                self.logger.exception("Unable to close")
+            self.io = None
+
+    def reset(self) -> None:
+        """Closes io stream after an error so the next transaction reopens it."""
+        with self.lock:
+            self.errors += 1
+            self.close()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Gets connection statistics as a json serializable dict."""
+        return {
+            "bus": self.bus,
+            "open": self.io != None,
+            "opens": self.opens,
+            "transactions": self.transactions,
+            "errors": self.errors,
+        }
+
+
+# Initialize connection pool, one connection per bus
+connections: Dict[Hashable, BusConnection] = {}
+connections_lock = threading.Lock()
+
+
+def get_bus_key(bus: Optional[int]) -> Hashable:
+    """Gets key identifying bus. The usb-i2c cable drives a single bus so every bus
+    number shares its key."""
+    if os.getenv("IS_USB_I2C_ENABLED") == "true":
+        return ("usb", FTDI_URL)
+    return ("i2c", bus)
+
+
+def get_connection(bus: Optional[int]) -> BusConnection:
+    """Gets pooled connection for bus."""
+    key = get_bus_key(bus)
+    with connections_lock:
+        if key not in connections:
+            connections[key] = BusConnection(key, bus)
+        return connections[key]
+
+
+def close_connections() -> None:
+    """Closes every pooled connection."""
+    with connections_lock:
+        for connection in connections.values():
+            connection.close()
+        connections.clear()
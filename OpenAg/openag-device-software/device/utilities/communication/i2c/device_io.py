@@ -1,14 +1,11 @@
 # Import standard python modules
-import fcntl, io, os
-from typing import Optional, Type, Callable, cast, Any, TypeVar
+import fcntl, os
+from typing import Optional, Type, Callable, cast, Any, TypeVar, List
 from types import TracebackType
 
 # Import device utilities
 from device.utilities.logger import Logger
 
-# Import usb-i2c driver
-from pyftdi.i2c import I2cController, I2cIOError, I2cNackError
-
 # Import i2c package elements
 from device.utilities.communication.i2c.exceptions import (
     InitError,
@@ -16,6 +13,8 @@ from device.utilities.communication.i2c.exceptions import (
     ReadError,
     MuxError,
 )
+from device.utilities.communication.i2c.connection import get_connection
+from device.utilities.communication.i2c.message import Message
 from device.utilities.communication.i2c.utilities import (
     make_i2c_rdwr_data,
     c_uint8,
@@ -35,14 +34,23 @@ EB = TypeVar("EB", bound=Optional[TracebackType])
 
 
 def manage_io(func: F) -> F:
-    """Manages opening/closing io stream."""
+    """Runs transaction on the pooled bus io stream under the bus connection lock.
+    Resets the stream after an io error so the next transaction reopens it. Devices
+    that are not persistent close the stream after every transaction."""
 
     def wrapper(*args, **kwds):  # type: ignore
         self = args[0]
-        self.open()
-        resp = func(*args, **kwds)
-        self.close()
-        return resp
+        with self.connection.lock:
+            self.open()
+            try:
+                resp = func(*args, **kwds)
+            except (ReadError, WriteError):
+                self.connection.reset()
+                raise
+            self.connection.transactions += 1
+            if not self.persistent:
+                self.connection.close()
+            return resp
 
     return cast(F, wrapper)
 
@@ -50,16 +58,22 @@ def manage_io(func: F) -> F:
 class DeviceIO(object):
     """Manages byte-level device IO."""
 
-    def __init__(self, name: str, bus: Optional[int] = None) -> None:
+    def __init__(
+        self, name: str, bus: Optional[int] = None, persistent: bool = True
+    ) -> None:
 
         # Initialize parameters
         self.name = name
         self.bus = bus
+        self.persistent = persistent
 
         # Initialize logger
         logname = "DeviceIO({})".format(name)
         self.logger = Logger(logname, __name__)
 
+        # Get pooled bus connection
+        self.connection = get_connection(bus)
+
         # Verify io exists
         self.logger.debug("Verifying io stream exists")
         self.open()
@@ -79,33 +93,14 @@ class DeviceIO(object):
         return False  # Don't suppress exceptions
 
     def open(self) -> None:
-        """Opens io stream."""
-        try:
-            if os.getenv("IS_I2C_ENABLED") == "true":
-                device_name = "/dev/i2c-{}".format(self.bus)
-                self.io = io.open(device_name, "r+b", buffering=0)
-            elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                self.io = I2cController()
-                self.io.configure("ftdi://ftdi:232h/1")  # type: ignore
-            else:
-                message = "Platform does not support i2c communication"
-                raise InitError(message)
-        except (PermissionError, I2cIOError, I2cNackError) as e:
-            message = "Unable to open device io: {}".format(device_name)
-            raise InitError(message, logger=self.logger) from e
+        """Opens io stream, reuses the bus connection stream if already open."""
+        self.io = self.connection.open()
 
     def close(self) -> None:
-        """Closes io stream."""
-        try:
-            if os.getenv("IS_I2C_ENABLED") == "true":
-                self.io.close()
-            elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                self.io.terminate()  # type: ignore
-            else:
-                message = "Platform does not support i2c communication"
-                raise InitError(message)
-        except:
-            self.logger.exception("Unable to close")
+        """Releases io stream. The bus connection stream stays open for other
+        devices on the bus unless this device is not persistent."""
+        if not self.persistent:
+            self.connection.close()
 
     @manage_io
     def write(self, address: int, bytes_: bytes) -> None:
@@ -120,7 +115,7 @@ class DeviceIO(object):
             else:
                 message = "Platform does not support i2c communication"
                 raise WriteError(message)
-        except (IOError, I2cIOError, I2cNackError) as e:
+        except IOError as e:  # Includes usb-i2c errors
             message = "Unable to write: {}".format(bytes_)
             raise WriteError(message) from e
 
@@ -138,7 +133,7 @@ class DeviceIO(object):
             else:
                 message = "Platform does not support i2c communication"
                 raise ReadError(message)
-        except (IOError, I2cIOError, I2cNackError) as e:
+        except IOError as e:  # Includes usb-i2c errors
             message = "Unable to read {} bytes".format(num_bytes)
             raise ReadError(message) from e
 
@@ -175,7 +170,7 @@ class DeviceIO(object):
             else:
                 message = "Platform does not support i2c communication"
                 raise ReadError(message)
-        except (IOError, I2cIOError, I2cNackError) as e:
+        except IOError as e:  # Includes usb-i2c errors
             message = "Unable to read register 0x{:02}".format(register)
             raise ReadError(message) from e
 
@@ -203,6 +198,50 @@ class DeviceIO(object):
             else:
                 message = "Platform does not support i2c communication"
                 raise WriteError(message)
-        except (IOError, I2cIOError, I2cNackError) as e:
+        except IOError as e:  # Includes usb-i2c errors
             message = "Unable to write register 0x{:02}".format(register)
             raise WriteError(message) from e
+
+    @manage_io
+    def transfer(self, address: int, messages: List[Message]) -> List[bytes]:
+        """Runs messages as one combined transfer, messages are separated by a
+        repeated start with a single stop at the end. Returns bytes read by each
+        read message."""
+        Error = ReadError if any(message.read for message in messages) else WriteError
+        try:
+            if os.getenv("IS_I2C_ENABLED") == "true":
+                buffers = []
+                rdwr_messages = []
+                for message in messages:
+                    if message.read:
+                        buffer = (c_uint8 * message.num_bytes)()
+                        flags = I2C_M_RD
+                    else:
+                        buffer = (c_uint8 * len(message.data))(*message.data)
+                        flags = 0
+                    buffers.append(buffer)
+                    rdwr_messages.append((address, flags, len(buffer), buffer))
+                request = make_i2c_rdwr_data(rdwr_messages)  # type: ignore
+                fcntl.ioctl(self.io.fileno(), I2C_RDWR, request)
+                return [
+                    bytes(buffer)
+                    for message, buffer in zip(messages, buffers)
+                    if message.read
+                ]
+            elif os.getenv("IS_USB_I2C_ENABLED") == "true":
+                device = self.io.get_port(address)  # type: ignore
+                responses = []
+                for index, message in enumerate(messages):
+                    relax = index == len(messages) - 1  # stop after last message
+                    if message.read:
+                        bytes_ = device.read(readlen=message.num_bytes, relax=relax)
+                        responses.append(bytes(bytes_))
+                    else:
+                        device.write(message.data, relax=relax)
+                return responses
+            else:
+                error_message = "Platform does not support i2c communication"
+                raise Error(error_message)
+        except IOError as e:  # Includes usb-i2c errors
+            error_message = "Unable to transfer {} messages".format(len(messages))
+            raise Error(error_message) from e
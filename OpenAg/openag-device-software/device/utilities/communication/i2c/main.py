@@ -1,12 +1,19 @@
 # Import standard python libraries
 import fcntl, io, time, logging, struct, threading
-from typing import Optional, List
+from contextlib import contextmanager
+from typing import Optional, List, Iterator
 
 # # Import package elements
 from device.utilities.communication.i2c.device_io import DeviceIO
 from device.utilities.communication.i2c.utilities import make_i2c_rdwr_data
 from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.mux_state import get_mux_state
+from device.utilities.communication.i2c.message import (
+    Message,
+    read_message,
+    write_message,
+)
 from device.utilities.communication.i2c.exceptions import (
     InitError,
     WriteError,
@@ -54,6 +61,9 @@ class I2C(object):
         if self.mux != None and self.channel == None:
             raise InitError("Mux requires channel value to be set") from ValueError
 
+        # Initialize mux state shared by devices on the bus
+        self.mux_state = get_mux_state(bus)
+
         # Initialize io
         if PeripheralSimulator != None:
             self.logger.debug("Using simulated io stream")
@@ -103,7 +113,7 @@ class I2C(object):
     ) -> None:
         """Writes byte list to device. Converts byte list to byte array then
         sends bytes. Returns error message."""
-        with self.i2c_lock:
+        with self.i2c_lock, self.track_mux():
             self.manage_mux("write bytes", disable_mux)
             self.logger.debug("Writing bytes: {}".format(byte_str(bytes_)))
             self.io.write(self.address, bytes_)
@@ -113,7 +123,7 @@ class I2C(object):
         self, num_bytes: int, retry: bool = True, disable_mux: bool = False
     ) -> bytes:
         """Reads num bytes from device. Returns byte array."""
-        with self.i2c_lock:
+        with self.i2c_lock, self.track_mux():
             self.manage_mux("read bytes", disable_mux)
             self.logger.debug("Reading {} bytes".format(num_bytes))
             bytes_ = bytes(self.io.read(self.address, num_bytes))
@@ -125,7 +135,7 @@ class I2C(object):
         self, register: int, retry: bool = True, disable_mux: bool = False
     ) -> int:
         """Reads byte stored in register at address."""
-        with self.i2c_lock:
+        with self.i2c_lock, self.track_mux():
             self.manage_mux("read register", disable_mux)
             self.logger.debug("Reading register: 0x{:02X}".format(register))
             return int(self.io.read_register(self.address, register))
@@ -134,7 +144,7 @@ class I2C(object):
     def write_register(
         self, register: int, value: int, retry: bool = True, disable_mux: bool = False
     ) -> None:
-        with self.i2c_lock:
+        with self.i2c_lock, self.track_mux():
             self.manage_mux("write register", disable_mux)
             message = "Writing register: 0x{:02X}, value: 0x{:02X}".format(
                 register, value
@@ -142,10 +152,58 @@ class I2C(object):
             self.logger.debug(message)
             self.io.write_register(self.address, register, value)
 
+    @retry((ReadError, WriteError, MuxError), tries=5, delay=0.2, backoff=3)
+    def transfer(
+        self, messages: List[Message], retry: bool = True, disable_mux: bool = False
+    ) -> List[bytes]:
+        """Runs messages as one combined transfer with a single mux switch and lock
+        acquisition. Returns bytes read by each read message."""
+        with self.i2c_lock, self.track_mux():
+            self.manage_mux("transfer", disable_mux)
+            self.logger.debug("Transferring {} messages".format(len(messages)))
+            responses = self.io.transfer(self.address, messages)
+            for bytes_ in responses:
+                self.logger.debug("Read bytes: {}".format(byte_str(bytes_)))
+            return [bytes(bytes_) for bytes_ in responses]
+
+    def write_read(
+        self,
+        bytes_: bytes,
+        num_bytes: int,
+        retry: bool = True,
+        disable_mux: bool = False,
+    ) -> bytes:
+        """Writes bytes then reads num bytes in one combined transfer."""
+        messages = [write_message(bytes_), read_message(num_bytes)]
+        return self.transfer(messages, retry=retry, disable_mux=disable_mux)[0]
+
+    def read_block(
+        self,
+        register: int,
+        num_bytes: int,
+        retry: bool = True,
+        disable_mux: bool = False,
+    ) -> bytes:
+        """Reads num bytes starting at register in one combined transfer."""
+        return self.write_read(
+            bytes([register]), num_bytes, retry=retry, disable_mux=disable_mux
+        )
+
+    def write_block(
+        self,
+        register: int,
+        bytes_: bytes,
+        retry: bool = True,
+        disable_mux: bool = False,
+    ) -> None:
+        """Writes bytes starting at register in one message."""
+        messages = [write_message(bytes([register]) + bytes(bytes_))]
+        self.transfer(messages, retry=retry, disable_mux=disable_mux)
+
     @retry(MuxError, tries=5, delay=0.2, backoff=3)
     def set_mux(self, mux: int, channel: int, retry: bool = True) -> None:
-        """Sets mux to channel"""
-        with self.i2c_lock:
+        """Sets mux to channel, records channel in bus mux state."""
+        with self.i2c_lock, self.track_mux():
             channel_byte = 0x01 << channel
             self.logger.debug(
                 "Setting mux 0x{:02X} to channel {}, writing: [0x{:02X}]".format(
@@ -156,11 +214,26 @@ class I2C(object):
                 self.io.write(mux, bytes([channel_byte]))
             except WriteError as e:
                 raise MuxError("Unable to set mux", logger=self.logger) from e
+            self.mux_state.select(mux, channel)
 
     def manage_mux(self, message: str, disable_mux: bool) -> None:
-        """Sets mux if enabled."""
+        """Sets mux if enabled and not already set to channel by the last
+        transaction on the bus."""
         if disable_mux:
             return
         elif self.mux != None:
+            if self.mux_state.is_selected(self.mux, self.channel):  # type: ignore
+                self.mux_state.skip()
+                return
             self.logger.debug("Managing mux to {}".format(message))
             self.set_mux(self.mux, self.channel, retry=False)
+
+    @contextmanager
+    def track_mux(self) -> Iterator[None]:
+        """Invalidates bus mux state after a mux or bus error, the mux may no longer
+        be set to the cached channel."""
+        try:
+            yield
+        except (ReadError, WriteError, MuxError):
+            self.mux_state.invalidate()
+            raise
@@ -0,0 +1,20 @@
+# Import python types
+from typing import NamedTuple
+
+
+class Message(NamedTuple):
+    """Message in a combined i2c transfer. Writes data or reads num bytes."""
+
+    read: bool
+    data: bytes = bytes([])
+    num_bytes: int = 0
+
+
+def write_message(bytes_: bytes) -> Message:
+    """Creates message writing bytes."""
+    return Message(read=False, data=bytes(bytes_))
+
+
+def read_message(num_bytes: int) -> Message:
+    """Creates message reading num bytes."""
+    return Message(read=True, num_bytes=num_bytes)
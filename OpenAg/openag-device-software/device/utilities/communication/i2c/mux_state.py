@@ -0,0 +1,86 @@
+# Import standard python modules
+import threading
+
+# Import python types
+from typing import Any, Dict, Hashable, Optional
+
+# Import i2c package elements
+from device.utilities.communication.i2c.connection import get_bus_key
+
+
+class MuxState(object):
+    """Channel selected on each mux on a bus, shared by every i2c device on the bus
+    so a mux is only switched when a device needs a different channel than the
+    last transaction on the bus. Used under the i2c lock. Invalidated after any
+    mux or bus error since the mux may no longer be set to the cached channel."""
+
+    def __init__(self, key: Hashable) -> None:
+        """Initializes mux state."""
+        self.key = key
+        self.channels: Dict[int, int] = {}
+
+        # Initialize statistics
+        self.switches = 0
+        self.skipped = 0
+        self.invalidations = 0
+
+    def is_selected(self, mux: int, channel: int) -> bool:
+        """Checks if mux is known to be set to channel."""
+        return self.channels.get(mux) == channel
+
+    def select(self, mux: int, channel: int) -> None:
+        """Records mux was set to channel."""
+        self.channels[mux] = channel
+        self.switches += 1
+
+    def skip(self) -> None:
+        """Records a channel switch that was skipped."""
+        self.skipped += 1
+
+    def invalidate(self) -> None:
+        """Forgets selected channels so the next transaction sets its mux."""
+        if self.channels != {}:
+            self.invalidations += 1
+        self.channels = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Gets mux statistics as a json serializable dict."""
+        channels = {
+            "0x{:02X}".format(mux): channel for mux, channel in self.channels.items()
+        }
+        return {
+            "channels": channels,
+            "switches": self.switches,
+            "skipped": self.skipped,
+            "invalidations": self.invalidations,
+        }
+
+
+# Initialize mux states, one per bus
+mux_states: Dict[Hashable, MuxState] = {}
+mux_states_lock = threading.Lock()
+
+
+def get_mux_state(bus: Optional[int]) -> MuxState:
+    """Gets mux state for bus."""
+    key = get_bus_key(bus)
+    with mux_states_lock:
+        if key not in mux_states:
+            mux_states[key] = MuxState(key)
+        return mux_states[key]
+
+
+def get_mux_stats() -> Dict[str, Any]:
+    """Gets mux statistics of each bus as a json serializable dict."""
+    with mux_states_lock:
+        return {
+            "-".join(str(part) for part in key): mux_state.to_dict()  # type: ignore
+            for key, mux_state in mux_states.items()
+        }
+
+
+def invalidate_mux_states() -> None:
+    """Invalidates mux state of every bus, e.g. after muxes were reset."""
+    with mux_states_lock:
+        for mux_state in mux_states.values():
+            mux_state.invalidate()
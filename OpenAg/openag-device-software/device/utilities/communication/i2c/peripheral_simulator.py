@@ -2,7 +2,7 @@
 import logging
 
 # Import python types
-from typing import Optional, Dict, Type, TypeVar, Callable, Any, cast
+from typing import Optional, Dict, Type, TypeVar, Callable, Any, cast, List
 from types import TracebackType
 
 # Import device utilities
@@ -17,6 +17,7 @@ from device.utilities.communication.i2c.exceptions import (
     MuxError,
 )
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.message import Message
 
 # Initialize type checking variables
 F = TypeVar("F", bound=Callable[..., Any])
@@ -179,6 +180,16 @@ class PeripheralSimulator:
         # Write value to register
         self.registers[register_addr] = value
 
+    def transfer(self, device_addr: int, messages: List[Message]) -> List[bytes]:
+        """Runs messages in order. Returns bytes read by each read message."""
+        responses = []
+        for message in messages:
+            if message.read:
+                responses.append(self.read(device_addr, message.num_bytes))
+            else:
+                self.write(device_addr, message.data)
+        return responses
+
     def get_write_response_bytes(self, write_bytes: bytes) -> Optional[bytes]:
         """Gets response byte for write command. Handles state based writes."""
         return self.writes.get(byte_str(write_bytes), None)
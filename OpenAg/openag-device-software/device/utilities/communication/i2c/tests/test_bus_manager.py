@@ -0,0 +1,81 @@
+# Import standard python libraries
+import os, sys, threading, time
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c.bus_manager import (
+    I2CBusManager,
+    HIGH_PRIORITY,
+    NORMAL_PRIORITY,
+)
+
+
+def test_buses_lock_independently() -> None:
+    bus_manager = I2CBusManager()
+    lock_1 = bus_manager.get_lock("Sensor-1", bus=1)
+    lock_2 = bus_manager.get_lock("Sensor-2", bus=2)
+    lock_3 = bus_manager.get_lock("Sensor-3", bus=1)
+    assert lock_1.lock is lock_3.lock
+    assert lock_1.lock is not lock_2.lock
+
+    # Lock on another bus does not block, same bus does
+    acquired = []
+
+    def transaction(lock):  # type: ignore
+        if not lock.acquire(timeout=0.1):
+            acquired.append(False)
+            return
+        acquired.append(True)
+        lock.release()
+
+    with lock_1:
+        for lock in [lock_2, lock_3]:
+            thread = threading.Thread(target=transaction, args=(lock,))
+            thread.start()
+            thread.join()
+    assert acquired == [True, False]
+    assert lock_1.lock.waiters == []
+
+
+def test_lock_is_reentrant() -> None:
+    lock = I2CBusManager().get_lock("Sensor", bus=1)
+    with lock:
+        with lock:
+            assert lock.lock.count == 2
+        assert lock.lock.is_owned()
+    assert not lock.lock.is_owned()
+    assert lock.waits == 1
+
+
+def test_high_priority_granted_first() -> None:
+    bus_manager = I2CBusManager()
+    sensor = bus_manager.get_lock("Sensor", bus=1, priority=NORMAL_PRIORITY)
+    actuator = bus_manager.get_lock("Actuator", bus=1, priority=HIGH_PRIORITY)
+    order = []
+
+    def transaction(lock, name):  # type: ignore
+        with lock:
+            order.append(name)
+
+    # Queue sensor then actuator behind a held lock
+    sensor.acquire()
+    threads = []
+    for lock, name in [(sensor, "Sensor"), (actuator, "Actuator")]:
+        thread = threading.Thread(target=transaction, args=(lock, name))
+        thread.start()
+        threads.append(thread)
+        while len(sensor.lock.waiters) < len(threads):
+            time.sleep(0.001)
+    time.sleep(0.05)
+    sensor.release()
+    for thread in threads:
+        thread.join()
+    assert order == ["Actuator", "Sensor"]
+
+    # Actuator waited for the bus
+    stats = bus_manager.stats
+    assert stats["Actuator"]["waits"] == 1
+    assert stats["Actuator"]["max_wait_ms"] >= 50
+    assert stats["Actuator"]["bus"] == "i2c-1"
@@ -0,0 +1,88 @@
+# Import standard python libraries
+import os, sys, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c import connection, device_io
+from device.utilities.communication.i2c.device_io import DeviceIO
+from device.utilities.communication.i2c.exceptions import ReadError
+from device.utilities.communication.i2c.message import read_message, write_message
+
+
+@pytest.fixture
+def i2c_file(tmpdir, monkeypatch):  # type: ignore
+    """Simulates i2c device files with regular files."""
+    path = tmpdir.join("i2c-1")
+    path.write_binary(bytes([0x01, 0x02, 0x03, 0x04]))
+    monkeypatch.setenv("IS_I2C_ENABLED", "true")
+    monkeypatch.setenv("IS_USB_I2C_ENABLED", "false")
+    monkeypatch.setattr(connection, "DEVICE_PATH", str(tmpdir.join("i2c-{}")))
+    monkeypatch.setattr(device_io.fcntl, "ioctl", lambda *args: 0)
+    connection.close_connections()
+    yield path
+    connection.close_connections()
+
+
+def test_devices_share_bus_connection(i2c_file) -> None:  # type: ignore
+    io_1 = DeviceIO("Test-1", bus=1)
+    io_2 = DeviceIO("Test-2", bus=1)
+    assert io_1.connection is io_2.connection
+    assert io_1.read(0x40, 1) == bytes([0x01])
+    assert io_2.read(0x41, 1) == bytes([0x02])
+    assert io_1.read(0x40, 2) == bytes([0x03, 0x04])
+    stats = io_1.connection.to_dict()
+    assert stats["opens"] == 1
+    assert stats["transactions"] == 3
+    assert stats["open"]
+
+
+def test_connection_reopens_after_error(i2c_file, monkeypatch) -> None:  # type: ignore
+    io = DeviceIO("Test", bus=1)
+    io.read(0x40, 1)
+
+    # Fail a transaction, stream should be closed
+    def ioctl(*args):  # type: ignore
+        raise IOError("nack")
+
+    monkeypatch.setattr(device_io.fcntl, "ioctl", ioctl)
+    with pytest.raises(ReadError):
+        io.read(0x40, 1)
+    monkeypatch.setattr(device_io.fcntl, "ioctl", lambda *args: 0)
+    assert io.connection.io == None
+    assert io.connection.errors == 1
+
+    # Next transaction reopens stream from the start of the file
+    assert io.read(0x40, 1) == bytes([0x01])
+    assert io.connection.opens == 2
+
+
+def test_non_persistent_closes_after_transaction(i2c_file) -> None:  # type: ignore
+    io = DeviceIO("Test", bus=1, persistent=False)
+    assert io.read(0x40, 1) == bytes([0x01])
+    assert io.read(0x40, 1) == bytes([0x01])
+    assert io.connection.io == None
+    assert io.connection.opens == 3
+
+
+def test_transfer_combined_rdwr(i2c_file, monkeypatch) -> None:  # type: ignore
+    requests = []
+
+    # Fill read buffers of combined transfer requests
+    def ioctl(fd, request, data):  # type: ignore
+        if request != device_io.I2C_RDWR:
+            return 0
+        messages = [data.msgs[index] for index in range(data.nmsgs)]
+        requests.append([(msg.addr, msg.flags, msg.len) for msg in messages])
+        for msg in messages:
+            if msg.flags & device_io.I2C_M_RD:
+                for index in range(msg.len):
+                    msg.buf[index] = 0xA0 + index
+        return 0
+
+    monkeypatch.setattr(device_io.fcntl, "ioctl", ioctl)
+    io = DeviceIO("Test", bus=1)
+    messages = [write_message(bytes([0x02])), read_message(2), read_message(1)]
+    assert io.transfer(0x40, messages) == [bytes([0xA0, 0xA1]), bytes([0xA0])]
+    assert requests == [[(0x40, 0, 1), (0x40, 1, 2), (0x40, 1, 1)]]
@@ -6,7 +6,9 @@ from unittest import TestCase
 from device.utilities.bitwise import byte_str
 
 # Import i2c elements
+from device.utilities.communication.i2c import mux_state
 from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.message import read_message, write_message
 from device.utilities.communication.i2c.exceptions import ReadError, WriteError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
@@ -143,3 +145,80 @@ def test_read_custom_register():
         PeripheralSimulator=CustomPeripheralSimulator,
     )
     assert i2c.read_register(0xE7) == 0x00
+
+
+def test_mux_switch_skipped_when_selected():
+    mux_state.mux_states.clear()
+    mux_simulator = MuxSimulator()
+    i2c_1, i2c_2 = [
+        I2C(
+            name="Test-{}".format(channel),
+            i2c_lock=threading.RLock(),
+            bus=2,
+            address=0x40,
+            mux=0x77,
+            channel=channel,
+            mux_simulator=mux_simulator,
+            PeripheralSimulator=PeripheralSimulator,
+        )
+        for channel in [4, 5]
+    ]
+    assert i2c_1.mux_state is i2c_2.mux_state
+    switches, skipped = i2c_1.mux_state.switches, i2c_1.mux_state.skipped
+    i2c_2.read(1)
+    i2c_2.read(1)
+    i2c_1.read(1)
+    i2c_1.write_register(0x01, 0x02)
+    assert i2c_1.mux_state.switches == switches + 1
+    assert i2c_1.mux_state.skipped == skipped + 3
+    assert i2c_1.mux_state.to_dict()["channels"] == {"0x77": 4}
+    assert mux_state.get_mux_stats()["i2c-2"]["skipped"] == skipped + 3
+
+
+def test_mux_state_invalidated_on_error():
+    mux_state.mux_states.clear()
+    i2c = I2C(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=PeripheralSimulator,
+    )
+    with pytest.raises(ReadError):
+        i2c.read_register(0x01, retry=False)
+    assert i2c.mux_state.channels == {}
+    assert i2c.mux_state.invalidations == 1
+
+    # Next transaction sets mux again
+    switches = i2c.mux_state.switches
+    i2c.write_register(0x01, 0x02)
+    assert i2c.mux_state.switches == switches + 1
+
+
+def test_transfer_write_read():
+    class CustomPeripheralSimulator(PeripheralSimulator):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.writes = {
+                byte_str(bytes([0x01])): bytes([0x02]),
+                byte_str(bytes([0x03, 0x04, 0x05])): bytes([0x06, 0x07]),
+            }
+
+    i2c = I2C(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=CustomPeripheralSimulator,
+    )
+    assert i2c.write_read(bytes([0x01]), 1) == bytes([0x02])
+    assert i2c.read_block(0x01, 1) == bytes([0x02])
+    i2c.write_block(0x03, bytes([0x04, 0x05]))
+    messages = [write_message(bytes([0x01])), read_message(3)]
+    assert i2c.transfer(messages) == [bytes([0x06, 0x07, 0x02])]
@@ -0,0 +1,133 @@
+# Import standard python modules
+import os, sys, time, argparse, importlib, importlib.abc
+
+# Import python types
+from typing import Any, List, Optional, Tuple
+
+# Initialize record type: (name, self us, cumulative us, depth)
+Record = Tuple[str, int, int, int]
+
+
+class TimedLoader(importlib.abc.Loader):
+    """Loader proxy that times module execution. Restores the original loader on
+    the module spec before executing so modules never see the proxy."""
+
+    def __init__(self, timer: "ImportTimer", loader: Any) -> None:
+        """Initializes timed loader."""
+        self.timer = timer
+        self.loader = loader
+
+    def create_module(self, spec: Any) -> Any:
+        """Creates module with original loader."""
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        """Executes module with original loader and records import time."""
+        module.__loader__ = self.loader
+        if module.__spec__ != None:
+            module.__spec__.loader = self.loader
+        self.timer.enter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timer.exit(module.__name__)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """Records self and cumulative import time per module like python's -X importtime
+    option, which is unavailable before python 3.7. Installs itself at the front of the
+    meta path and wraps specs found by the remaining finders."""
+
+    def __init__(self) -> None:
+        """Initializes import timer."""
+        self.records: List[Record] = []
+        self.stack: List[List[float]] = []
+
+    def install(self) -> None:
+        """Installs timer at front of meta path."""
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Removes timer from meta path."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name: str, path: Any, target: Any = None) -> Any:
+        """Finds spec with remaining finders and wraps its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec == None:
+                continue
+            if spec.loader != None and hasattr(spec.loader, "exec_module"):
+                spec.loader = TimedLoader(self, spec.loader)
+            return spec
+        return None
+
+    def enter(self) -> None:
+        """Starts timing a module, nested imports accumulate as child time."""
+        self.stack.append([time.perf_counter(), 0.0])
+
+    def exit(self, name: str) -> None:
+        """Stops timing a module and records self and cumulative time."""
+        start, children = self.stack.pop()
+        cumulative = time.perf_counter() - start
+        if self.stack != []:
+            self.stack[-1][1] += cumulative
+        self_us = int((cumulative - children) * 1e6)
+        self.records.append((name, self_us, int(cumulative * 1e6), len(self.stack)))
+
+
+def format_record(record: Record) -> str:
+    """Formats record like python's -X importtime output."""
+    name, self_us, cumulative_us, depth = record
+    return "import time: {:>9} | {:>10} | {}{}".format(
+        self_us, cumulative_us, "  " * depth, name
+    )
+
+
+def parse_record(line: str) -> Optional[Record]:
+    """Parses a formatted record, returns None for other lines."""
+    if not line.startswith("import time:"):
+        return None
+    try:
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        stripped = name.rstrip().lstrip(" ")
+        depth = (len(name.rstrip()) - len(stripped) - 1) // 2
+        return stripped, int(self_us), int(cumulative_us), depth
+    except ValueError:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Imports modules after django setup and prints import times."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Import time report")
+    parser.add_argument("modules", nargs="+", help="modules to import")
+    args = parser.parse_args(argv)
+
+    # Setup django like the device process does before importing managers
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
+    import django
+
+    django.setup()
+
+    # Import modules with timer installed
+    timer = ImportTimer()
+    timer.install()
+    try:
+        for module in args.modules:
+            importlib.import_module(module)
+    finally:
+        timer.uninstall()
+
+    # Print records
+    print("import time: self [us] | cumulative | imported package")
+    for record in timer.records:
+        print(format_record(record))
+
+
+if __name__ == "__main__":
+    main()
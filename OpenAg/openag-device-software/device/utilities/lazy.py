@@ -0,0 +1,32 @@
+# Import standard python modules
+import importlib, importlib.util, types
+
+# Import python types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the module on first attribute access. Lets
+    drivers declare heavy optional dependencies at module level without paying their
+    import cost until a peripheral actually uses them."""
+
+    def __getattr__(self, attribute: str) -> Any:
+        """Imports module and gets attribute. Only called for attributes not found on
+        the placeholder, after the first import attributes are found directly."""
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+
+def lazy_import(name: str) -> Any:
+    """Gets a placeholder for module that is imported on first attribute access."""
+    return LazyModule(name)
+
+
+def module_available(name: str) -> bool:
+    """Checks if module can be imported without importing it. Parent packages of
+    dotted names are imported."""
+    try:
+        return importlib.util.find_spec(name) != None
+    except (ImportError, ValueError):
+        return False
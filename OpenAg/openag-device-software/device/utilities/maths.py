@@ -1,8 +1,17 @@
 # Import standard python modules
-import numpy, math, operator
+import math, operator
 
 # Import python types
-from typing import List, Union, Dict, Optional
+from typing import List, Union, Dict, Optional, TYPE_CHECKING
+
+# Import device utilities
+from device.utilities.lazy import lazy_import
+
+# Import numpy on first use, type checkers import it for annotations
+if TYPE_CHECKING:
+    import numpy
+else:
+    numpy = lazy_import("numpy")
 
 
 def magnitude(x: float) -> int:
@@ -101,11 +110,11 @@ def discretize(minimum: int, maximum: int, value: float) -> dict:
 
 
 def bnnls(
-    A: numpy.ndarray,
-    b: numpy.ndarray,
+    A: "numpy.ndarray",
+    b: "numpy.ndarray",
     bound: float = 1,
     index_map: Optional[Dict] = None,
-) -> numpy.ndarray:
+) -> "numpy.ndarray":
     """Solves for bounded non-negative least squares approximation. When solving Ax=b, 
     x is constrained to be within 0-bound."""
 
@@ -168,7 +177,7 @@ def bnnls(
         return x
 
 
-def nnls(A: numpy.ndarray, b: numpy.ndarray, tol: float = 1e-8) -> numpy.ndarray:
+def nnls(A: "numpy.ndarray", b: "numpy.ndarray", tol: float = 1e-8) -> "numpy.ndarray":
     """Origninal function by @alexfields
 
     Solve ``argmin_x || Ax - b ||_2`` for ``x>=0``. This version may be superior to the FORTRAN implementation when ``A`` has more rows than
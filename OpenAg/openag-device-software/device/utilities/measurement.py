@@ -0,0 +1,216 @@
+# Import standard python modules
+import collections, heapq, itertools, threading, time
+
+# Import python types
+from typing import Any, Deque, Dict, Generator, List, Optional, Tuple
+from concurrent.futures import Future
+
+# Import device utilities
+from device.utilities.logger import Logger
+from device.utilities.cancellation import CancelToken
+
+# Measurements are generators that trigger a sensor conversion, yield the seconds
+# until the conversion completes, collect it then return the measured value
+Measurement = Generator[float, None, Any]
+
+# Measurements submitted to a sampler with their result future and cancel token
+Sampling = Tuple[Measurement, Future, Optional[CancelToken]]
+
+# Initialize default number of sampler threads running trigger and collect steps
+DEFAULT_STEP_WORKERS = 4
+
+
+class MeasurementCancelled(Exception):
+    """Raised into a measurement when its conversion wait is cancelled."""
+
+    pass
+
+
+def run_measurement(
+    measurement: Measurement, cancel_token: Optional[CancelToken] = None
+) -> Any:
+    """Runs measurement on its own, waits for each conversion in turn. Returns
+    measured value."""
+    cancel_token = cancel_token or CancelToken()
+    try:
+        seconds = next(measurement)
+        while True:
+            if cancel_token.wait(seconds):
+                cancelled = MeasurementCancelled("wait cancelled")
+                seconds = measurement.throw(MeasurementCancelled, cancelled)
+            else:
+                seconds = next(measurement)
+    except StopIteration as e:
+        return e.value
+
+
+class BusSampler(object):
+    """Samples sensors on a bus as a pipeline. Triggers each submitted measurement
+    as soon as it arrives, releases the bus while sensors convert in parallel, then
+    collects each measurement once its conversion completes. A sweep over many
+    sensors takes about the longest conversion instead of the sum of conversions.
+
+    The sampler thread only times conversions, trigger and collect steps run on a
+    bounded number of step workers so a sensor retrying a failed step does not hold
+    up the other sensors on the bus. Measurements whose cancel token is cancelled
+    have the cancellation thrown into them on their next step. The sampler thread
+    and step workers run while measurements are pending, converting or stepping."""
+
+    def __init__(
+        self, name: str = "BusSampler", max_workers: int = DEFAULT_STEP_WORKERS
+    ) -> None:
+        """Initializes bus sampler."""
+        self.name = name
+        self.max_workers = max_workers
+        self.logger = Logger(name, "peripherals")
+        self.condition = threading.Condition()
+        self.pending: List[Sampling] = []
+        self.converting: List[Tuple[float, int, Sampling]] = []
+        self.steps: Deque[Sampling] = collections.deque()
+        self.stepping = 0
+        self.workers = 0
+        self.thread: Optional[threading.Thread] = None
+        self.sequence = itertools.count()
+
+        # Initialize statistics
+        self.measurements = 0
+        self.converting_max = 0
+
+    def sample(
+        self,
+        measurement: Measurement,
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Any:
+        """Submits measurement and waits until it is collected, the cancel token is
+        cancelled or timeout elapses, whichever comes first. Returns measured value
+        or raises the measurement's error, raises measurement cancelled if the
+        token was cancelled first."""
+        future: Future = Future()
+        with self.condition:
+            self.pending.append((measurement, future, cancel_token))
+            if self.thread is None:
+                thread = threading.Thread(target=self.run, daemon=True)
+                self.thread = thread
+                thread.start()
+            self.condition.notify_all()
+        if cancel_token is None:
+            return future.result(timeout)
+
+        # Wait for measurement or cancellation
+        done = threading.Event()
+        future.add_done_callback(lambda future: done.set())
+        cancel_token.add_callback(done.set)
+        try:
+            done.wait(timeout)
+        finally:
+            cancel_token.remove_callback(done.set)
+        if future.done() or not cancel_token.cancelled:
+            return future.result(0)
+
+        # Wake sampler thread to throw cancellation into the measurement
+        with self.condition:
+            self.condition.notify_all()
+        raise MeasurementCancelled("wait cancelled")
+
+    def run(self) -> None:
+        """Queues steps of pending measurements and of completed or cancelled
+        conversions until no measurements are left."""
+        while True:
+            with self.condition:
+                ready = self.pop_ready()
+                while self.pending == [] and ready == []:
+                    if self.converting == [] and self.stepping == 0:
+                        self.thread = None
+                        return
+                    remaining = None
+                    if self.converting != []:
+                        remaining = self.converting[0][0] - time.monotonic()
+                    self.condition.wait(remaining)
+                    ready = self.pop_ready()
+
+                # Queue steps, start workers for them
+                samplings = self.pending + ready
+                self.pending = []
+                self.steps.extend(samplings)
+                self.stepping += len(samplings)
+                while self.workers < min(self.max_workers, self.stepping):
+                    self.workers += 1
+                    threading.Thread(target=self.work, daemon=True).start()
+
+    def pop_ready(self) -> List[Sampling]:
+        """Removes completed and cancelled conversions, called under the sampler
+        condition."""
+        ready = []
+        now = time.monotonic()
+        while self.converting != [] and self.converting[0][0] <= now:
+            _, _, sampling = heapq.heappop(self.converting)
+            ready.append(sampling)
+
+        # Remove cancelled conversions
+        converting = []
+        for conversion in self.converting:
+            cancel_token = conversion[2][2]
+            if cancel_token is not None and cancel_token.cancelled:
+                ready.append(conversion[2])
+            else:
+                converting.append(conversion)
+        if len(converting) != len(self.converting):
+            heapq.heapify(converting)
+            self.converting = converting
+        return ready
+
+    def work(self) -> None:
+        """Runs queued steps until none are left."""
+        while True:
+            with self.condition:
+                if not self.steps:
+                    self.workers -= 1
+                    return
+                sampling = self.steps.popleft()
+            self.advance(sampling)
+
+    def advance(self, sampling: Sampling) -> None:
+        """Runs measurement up to its next conversion, or throws cancellation into it
+        if its token was cancelled. Completes its future once measured or failed."""
+        measurement, future, cancel_token = sampling
+        conversion = None
+        measured = False
+        result: Any = None
+        error: Optional[Exception] = None
+        try:
+            if cancel_token is not None and cancel_token.cancelled:
+                cancelled = MeasurementCancelled("wait cancelled")
+                seconds = measurement.throw(MeasurementCancelled, cancelled)
+            else:
+                seconds = next(measurement)
+            ready_time = time.monotonic() + seconds
+            conversion = (ready_time, next(self.sequence), sampling)
+        except StopIteration as e:
+            result = e.value
+            measured = True
+        except Exception as e:
+            error = e
+
+        # Queue conversion, wake sampler thread
+        with self.condition:
+            self.stepping -= 1
+            if measured:
+                self.measurements += 1
+            if conversion is not None:
+                heapq.heappush(self.converting, conversion)
+                self.converting_max = max(self.converting_max, len(self.converting))
+            self.condition.notify_all()
+
+        # Complete future once measured or failed
+        if measured:
+            future.set_result(result)
+        elif error is not None:
+            future.set_exception(error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Gets sampler statistics as a json serializable dict."""
+        return {
+            "measurements": self.measurements,
+            "max_converting": self.converting_max,
+        }
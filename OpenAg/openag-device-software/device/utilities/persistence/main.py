@@ -0,0 +1,237 @@
+# Import standard python modules
+import threading, queue, time
+
+# Import python types
+from typing import Any, Callable, Dict, List, Optional
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+# Import django modules
+from django.conf import settings
+from django.db import connection, transaction
+
+
+class WriteIntent:
+    """Database write queued for the persistence writer. Waiters are notified once
+    the transaction containing the write has been committed or rolled back."""
+
+    def __init__(
+        self, function: Callable, args: tuple, kwargs: Dict[str, Any], wait: bool
+    ) -> None:
+        """Initializes write intent."""
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.wait = wait
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+    def execute(self) -> None:
+        """Executes write in a savepoint so a failed write does not roll back the
+        other writes in its batch."""
+        with transaction.atomic():
+            self.result = self.function(*self.args, **self.kwargs)
+
+
+class PersistenceWriter:
+    """Owns the only database connection used for device writes. Producers submit
+    write intents to a queue, the writer thread commits them in batched transactions
+    every commit interval or once a batch reaches the max batch size. Intents that
+    are waited on are committed immediately along with everything queued before them.
+    When the writer is not running, writes are executed inline by the caller."""
+
+    def __init__(
+        self,
+        commit_interval: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """Initializes persistence writer."""
+
+        # Initialize batching parameters
+        if commit_interval == None:
+            commit_interval = settings.PERSISTENCE_COMMIT_INTERVAL
+        if max_batch_size == None:
+            max_batch_size = settings.PERSISTENCE_MAX_BATCH_SIZE
+        self.commit_interval = float(commit_interval)  # type: ignore
+        self.max_batch_size = int(max_batch_size)  # type: ignore
+
+        # Initialize logger
+        self.logger = Logger("PersistenceWriter", "coordinator")
+
+        # Initialize queue and thread
+        self.queue: queue.Queue = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self.is_running = False
+
+        # Initialize statistics
+        self.max_queue_depth = 0
+        self.num_commits = 0
+        self.num_writes = 0
+        self.num_errors = 0
+        self.last_commit_latency = 0.0
+        self.max_commit_latency = 0.0
+        self.total_commit_latency = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Gets number of queued write intents."""
+        return self.queue.qsize()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Gets queue depth and commit latency statistics, latencies in ms."""
+        if self.num_commits > 0:
+            average = self.total_commit_latency / self.num_commits
+        else:
+            average = 0.0
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "num_commits": self.num_commits,
+            "num_writes": self.num_writes,
+            "num_errors": self.num_errors,
+            "last_commit_latency_ms": round(self.last_commit_latency * 1000, 2),
+            "average_commit_latency_ms": round(average * 1000, 2),
+            "max_commit_latency_ms": round(self.max_commit_latency * 1000, 2),
+        }
+
+    def start(self) -> None:
+        """Starts writer thread if not already running."""
+        with self.lock:
+            if self.is_running:
+                return
+            self.logger.debug("Starting writer thread")
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.is_running = True
+            self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Stops writer thread after committing all queued writes. Returns false if
+        thread did not stop before timeout."""
+        with self.lock:
+            if not self.is_running:
+                return True
+            self.logger.debug("Stopping writer thread")
+            self.is_running = False
+            self.queue.put(None)
+        self.thread.join(timeout)  # type: ignore
+        return not self.thread.is_alive()  # type: ignore
+
+    def submit(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Queues a write, does not block on disk i/o. Pass wait=True to block until
+        the write is committed, returns function result and re-raises its exception."""
+        wait = kwargs.pop("wait", False)
+        intent = WriteIntent(function, args, kwargs, wait)
+
+        # Queue intent if writer thread is running
+        with self.lock:
+            if self.is_running:
+                self.queue.put(intent)
+                self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+                queued = True
+            else:
+                queued = False
+
+        # Execute write inline if writer thread is not running
+        if not queued:
+            self.commit([intent])
+
+        # Check if waiting on write
+        if not wait:
+            return None
+        intent.done.wait()
+        if intent.error != None:
+            raise intent.error  # type: ignore
+        return intent.result
+
+    def flush(self) -> None:
+        """Blocks until all previously queued writes are committed."""
+        self.submit(lambda: None, wait=True)
+
+    def run(self) -> None:
+        """Runs writer thread. Collects queued intents into batches and commits them."""
+        try:
+            while True:
+
+                # Wait for first intent of batch, None signals stop
+                intent = self.queue.get()
+                if intent == None:
+                    break
+                batch = [intent]
+                stop = False
+
+                # Collect intents until commit interval elapses, batch is full or an
+                # intent is waited on
+                deadline = time.monotonic() + self.commit_interval
+                while not intent.wait and len(batch) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        intent = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if intent == None:
+                        stop = True
+                        break
+                    batch.append(intent)
+
+                # Commit batch
+                self.commit(batch)
+                if stop:
+                    break
+
+            # Commit writes queued before stop
+            batch = []
+            while not self.queue.empty():
+                intent = self.queue.get()
+                if intent != None:
+                    batch.append(intent)
+            if batch != []:
+                self.commit(batch)
+        finally:
+            connection.close()
+            self.logger.debug("Stopped writer thread")
+
+    def commit(self, batch: List[WriteIntent]) -> None:
+        """Executes batch of write intents in a single transaction then notifies
+        waiters."""
+        start = time.monotonic()
+
+        # Execute writes in a single transaction
+        try:
+            with transaction.atomic():
+                for intent in batch:
+                    try:
+                        intent.execute()
+                    except Exception as e:
+                        intent.error = e
+                        self.num_errors += 1
+                        message = "Unable to execute {}".format(intent.function)
+                        self.logger.exception(message)
+        except Exception as e:
+            self.logger.exception("Unable to commit batch")
+            for intent in batch:
+                if intent.error == None:
+                    intent.error = e
+                    self.num_errors += 1
+
+        # Update statistics
+        latency = time.monotonic() - start
+        self.num_commits += 1
+        self.num_writes += len(batch)
+        self.last_commit_latency = latency
+        self.max_commit_latency = max(self.max_commit_latency, latency)
+        self.total_commit_latency += latency
+
+        # Notify waiters
+        for intent in batch:
+            intent.done.set()
+
+
+# Initialize persistence writer shared by device managers
+writer = PersistenceWriter()
@@ -0,0 +1,82 @@
+# Import standard python libraries
+import os, sys, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import persistence writer
+from device.utilities.persistence.main import PersistenceWriter
+
+
+def create_event(name: str) -> models.EventModel:
+    """Creates an event entry."""
+    return models.EventModel.objects.create(recipient={"name": name}, request={})
+
+
+def fail() -> None:
+    """Raises an exception."""
+    raise ValueError("Write failed")
+
+
+def test_submit_inline_when_not_running() -> None:
+    writer = PersistenceWriter(commit_interval=0.1, max_batch_size=10)
+    writer.submit(create_event, "Inline")
+    assert models.EventModel.objects.count() == 1
+    assert writer.num_commits == 1
+
+
+def test_submit_wait_returns_result() -> None:
+    writer = PersistenceWriter(commit_interval=0.1, max_batch_size=10)
+    event = writer.submit(create_event, "Wait", wait=True)
+    assert event.recipient == {"name": "Wait"}
+
+
+def test_submit_wait_raises_error() -> None:
+    writer = PersistenceWriter(commit_interval=0.1, max_batch_size=10)
+    with pytest.raises(ValueError):
+        writer.submit(fail, wait=True)
+    assert writer.num_errors == 1
+
+
+def test_failed_write_does_not_roll_back_batch(transactional_db: None) -> None:
+    writer = PersistenceWriter(commit_interval=10, max_batch_size=10)
+    writer.start()
+    writer.submit(create_event, "First")
+    writer.submit(fail)
+    writer.submit(create_event, "Second")
+    writer.flush()
+    writer.stop()
+    assert models.EventModel.objects.count() == 2
+    assert writer.num_commits == 1
+    assert writer.num_errors == 1
+
+
+def test_group_commit_batch_size(transactional_db: None) -> None:
+    writer = PersistenceWriter(commit_interval=10, max_batch_size=5)
+    writer.start()
+    for index in range(10):
+        writer.submit(create_event, "Event-{}".format(index))
+    writer.flush()
+    writer.stop()
+    assert models.EventModel.objects.count() == 10
+    assert writer.num_commits <= 3
+    stats = writer.stats
+    assert stats["queue_depth"] == 0
+    assert stats["num_writes"] == 11
+    assert stats["max_commit_latency_ms"] >= stats["average_commit_latency_ms"]
+
+
+def test_stop_commits_queued_writes(transactional_db: None) -> None:
+    writer = PersistenceWriter(commit_interval=10, max_batch_size=100)
+    writer.start()
+    for index in range(3):
+        writer.submit(create_event, "Event-{}".format(index))
+    assert writer.stop(timeout=5)
+    assert models.EventModel.objects.count() == 3
+
+    # Writes after stop are executed inline
+    writer.submit(create_event, "Inline")
+    assert models.EventModel.objects.count() == 4
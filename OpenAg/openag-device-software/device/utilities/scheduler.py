@@ -0,0 +1,90 @@
+# Import standard python modules
+import math, time
+
+# Import python types
+from typing import Any, Dict, Optional
+
+
+class PeriodicScheduler:
+    """Schedules periodic work on monotonic deadlines. Deadlines lie on a grid of
+    whole intervals offset by a phase, a fraction of the interval, so work does not
+    drift with update duration and schedulers with the same interval but different
+    phases never fire at the same instant, even if they started at different times.
+    Deadlines missed by a whole interval are skipped."""
+
+    def __init__(self, interval: float, phase: float = 0.0) -> None:
+        """Initializes scheduler."""
+        self.interval = interval
+        self.phase = phase % 1.0
+        self.deadline = 0.0
+        self.start_time = 0.0
+
+        # Initialize statistics
+        self.samples = 0
+        self.jitter_last = 0.0  # seconds
+        self.jitter_total = 0.0  # seconds
+        self.jitter_max = 0.0  # seconds
+        self.overruns = 0
+        self.skipped = 0
+
+    def next_deadline(self, timestamp: float) -> float:
+        """Gets first deadline on the phase grid after timestamp."""
+        offset = self.phase * self.interval
+        periods = math.floor((timestamp - offset) / self.interval) + 1
+        return offset + periods * self.interval
+
+    def start(self, timestamp: Optional[float] = None, immediate: bool = False) -> None:
+        """Starts schedule, first deadline is now if immediate otherwise the next
+        deadline on the phase grid."""
+        now = time.monotonic() if timestamp == None else timestamp
+        self.deadline = now if immediate else self.next_deadline(now)  # type: ignore
+
+    def set_interval(self, interval: float, timestamp: Optional[float] = None) -> None:
+        """Updates interval and moves the deadline onto the new phase grid."""
+        if interval == self.interval:
+            return
+        now = time.monotonic() if timestamp == None else timestamp
+        self.interval = interval
+        self.deadline = self.next_deadline(now)  # type: ignore
+
+    def remaining(self, timestamp: Optional[float] = None) -> float:
+        """Gets seconds until the next deadline."""
+        now = time.monotonic() if timestamp == None else timestamp
+        return self.deadline - now  # type: ignore
+
+    def due(self, timestamp: Optional[float] = None) -> bool:
+        """Checks if the deadline passed."""
+        return self.remaining(timestamp) <= 0
+
+    def begin(self, timestamp: Optional[float] = None) -> None:
+        """Records start of scheduled work, its jitter from the deadline, then
+        advances the deadline skipping deadlines that were missed."""
+        now = time.monotonic() if timestamp == None else timestamp
+        jitter = now - self.deadline  # type: ignore
+        self.samples += 1
+        self.jitter_last = jitter
+        self.jitter_total += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        self.skipped += int(jitter // self.interval)
+        self.deadline = self.next_deadline(max(now, self.deadline))  # type: ignore
+        self.start_time = now  # type: ignore
+
+    def end(self, timestamp: Optional[float] = None) -> None:
+        """Records end of scheduled work, work overran if it ended after the next
+        deadline."""
+        if self.due(timestamp):
+            self.overruns += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Gets schedule statistics as a json serializable dict."""
+        average = self.jitter_total / self.samples if self.samples else 0.0
+        return {
+            "interval": self.interval,
+            "phase": round(self.phase, 3),
+            "samples": self.samples,
+            "last_jitter_ms": round(self.jitter_last * 1000, 3),
+            "average_jitter_ms": round(average * 1000, 3),
+            "max_jitter_ms": round(self.jitter_max * 1000, 3),
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+        }
@@ -0,0 +1,46 @@
+# Import standard python modules
+import os, json, threading
+
+# Import python types
+from typing import Any, Dict, Tuple
+
+# Import jsonschema modules
+from jsonschema.validators import validator_for
+
+
+class SchemaRegistry:
+    """Caches compiled json schema validators. Schemas are loaded and checked once,
+    validators are recompiled when their schema file modification time changes."""
+
+    def __init__(self) -> None:
+        """Initializes schema registry."""
+        self.lock = threading.Lock()
+        self.validators: Dict[str, Tuple[int, Any]] = {}
+
+    def validator(self, path: str) -> Any:
+        """Gets compiled validator for schema at path."""
+        mtime = os.stat(path).st_mtime_ns
+
+        # Check for cached validator with current schema
+        cached = self.validators.get(path)
+        if cached != None and cached[0] == mtime:  # type: ignore
+            return cached[1]  # type: ignore
+
+        # Load and compile schema
+        with self.lock:
+            with open(path) as f:
+                schema = json.load(f)
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema)
+            self.validators[path] = (mtime, validator)
+        return validator
+
+    def validate(self, instance: Any, path: str) -> None:
+        """Validates instance against schema at path. Raises validation error like
+        jsonschema.validate if invalid."""
+        self.validator(path).validate(instance)
+
+
+# Initialize schema registry shared by device managers
+schemas = SchemaRegistry()
@@ -0,0 +1,84 @@
+# Import standard python modules
+import os, json, copy, threading
+
+# Import python types
+from typing import Any, Dict, NoReturn, Tuple
+
+
+def _read_only(*args: Any, **kwargs: Any) -> NoReturn:
+    """Raises type error for mutating read-only objects."""
+    raise TypeError("Object is shared and read-only, copy before modifying")
+
+
+class FrozenDict(dict):
+    """Read-only dict shared between managers. Still a dict so it serializes to
+    json and passes isinstance checks, copies are regular mutable dicts."""
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore
+
+    def __copy__(self) -> Dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict) -> Dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> Tuple:
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """Read-only list shared between managers, copies are regular mutable lists."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore
+    append = clear = extend = insert = pop = remove = _read_only  # type: ignore
+    reverse = sort = _read_only  # type: ignore
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict) -> list:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> Tuple:
+        return list, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively converts dicts and lists into read-only dicts and lists."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    elif isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class SetupCache:
+    """Caches parsed setup files as read-only objects shared by every manager that
+    uses the same setup file. Files are re-parsed when their modification time
+    changes."""
+
+    def __init__(self) -> None:
+        """Initializes setup cache."""
+        self.lock = threading.Lock()
+        self.setups: Dict[str, Tuple[int, FrozenDict]] = {}
+
+    def load(self, path: str) -> FrozenDict:
+        """Loads read-only setup dict for setup file at path."""
+        mtime = os.stat(path).st_mtime_ns
+
+        # Check for cached setup from current file
+        cached = self.setups.get(path)
+        if cached != None and cached[0] == mtime:  # type: ignore
+            return cached[1]  # type: ignore
+
+        # Parse setup file
+        with self.lock:
+            with open(path) as f:
+                setup = freeze(json.load(f))
+            self.setups[path] = (mtime, setup)
+        return setup  # type: ignore
+
+
+# Initialize setup cache shared by peripheral and controller managers
+setups = SetupCache()
@@ -0,0 +1,107 @@
+# Import standard python modules
+import threading, time
+
+# Import python types
+from typing import Any, Dict, List
+
+
+class SectionLock:
+    """Reentrant lock for one state section. Records how often the lock was
+    contended, how long threads waited for it and how long it was held. Timings
+    only cover the outermost acquisition of a thread."""
+
+    def __init__(self, name: str) -> None:
+        """Initializes section lock."""
+        self.name = name
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._acquire_time = 0.0
+
+        # Initialize statistics, only modified while holding the lock
+        self.acquisitions = 0
+        self.contentions = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.hold_time = 0.0
+        self.max_hold_time = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires lock, records wait time if another thread holds it."""
+        wait_time = 0.0
+        if not self._lock.acquire(blocking=False):
+            if not blocking:
+                return False
+            start_time = time.perf_counter()
+            if not self._lock.acquire(timeout=timeout):
+                return False
+            wait_time = time.perf_counter() - start_time
+            self.contentions += 1
+
+        # Record outermost acquisition
+        self._depth += 1
+        if self._depth == 1:
+            self._acquire_time = time.perf_counter()
+            self.acquisitions += 1
+            self.wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+        return True
+
+    def release(self) -> None:
+        """Releases lock, records hold time on outermost release."""
+        self._depth -= 1
+        if self._depth == 0:
+            hold_time = time.perf_counter() - self._acquire_time
+            self.hold_time += hold_time
+            self.max_hold_time = max(self.max_hold_time, hold_time)
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Gets lock contention statistics in milliseconds."""
+        acquisitions = max(self.acquisitions, 1)
+        return {
+            "acquisitions": self.acquisitions,
+            "contentions": self.contentions,
+            "total_wait_ms": round(self.wait_time * 1000, 3),
+            "average_wait_ms": round(self.wait_time * 1000 / acquisitions, 3),
+            "max_wait_ms": round(self.max_wait_time * 1000, 3),
+            "total_hold_ms": round(self.hold_time * 1000, 3),
+            "average_hold_ms": round(self.hold_time * 1000 / acquisitions, 3),
+            "max_hold_ms": round(self.max_hold_time * 1000, 3),
+        }
+
+
+class StateLock:
+    """Reentrant lock over all state sections. Acquires section locks in section
+    order so it never deadlocks with threads that nest section locks in the same
+    order. Kept for code that modifies several sections at once."""
+
+    def __init__(self, locks: List[SectionLock]) -> None:
+        """Initializes state lock."""
+        self.locks = locks
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires all section locks."""
+        for index, lock in enumerate(self.locks):
+            if not lock.acquire(blocking, timeout):
+                for acquired in reversed(self.locks[:index]):
+                    acquired.release()
+                return False
+        return True
+
+    def release(self) -> None:
+        """Releases all section locks."""
+        for lock in reversed(self.locks):
+            lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
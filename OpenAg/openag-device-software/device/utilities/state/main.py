@@ -1,19 +1,44 @@
 # Import standard python modules
-import threading
+import threading, time
 
 # Import python types
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # Import device utilities
 from device.utilities.accessors import set_nested_dict_safely, get_nested_dict_safely
+from device.utilities.state.registry import EnvironmentRegistry, MISSING
+from device.utilities.state.locks import SectionLock, StateLock
+from device.utilities.setups import freeze
+from device.utilities.state.snapshots import Snapshot
+from device.utilities.state.subscriptions import Subscription
+
+# Initialize state section names
+SECTIONS = (
+    "device",
+    "recipe",
+    "environment",
+    "peripherals",
+    "controllers",
+    "iot",
+    "resource",
+    "network",
+    "upgrade",
+)
 
 
 class State(object):
     """ Shared memory object used to store and transmit 
-        state between threads. """
+        state between threads. Each section keeps a generation counter that is 
+        incremented whenever the section is modified so consumers (e.g. the state 
+        storage) can tell which sections changed. Each section has its own lock, 
+        the state lock acquires every section lock. Threads that hold several 
+        section locks must acquire them in section order. Readers that need a 
+        consistent view get an immutable snapshot of the section, snapshots are 
+        shared until the section is modified. Threads can subscribe to environment 
+        sensor variables to be woken when their reported or desired values change. 
+        """
 
     device: Dict[str, Any] = {}
-    environment: Dict[str, Any] = {}
     recipe: Dict[str, Any] = {}
     peripherals: Dict[str, Any] = {}
     controllers: Dict[str, Any] = {}
@@ -21,7 +46,101 @@ class State(object):
     resource: Dict[str, Any] = {}
     network: Dict[str, Any] = {}
     upgrade: Dict[str, Any] = {}
-    lock = threading.RLock()
+    lock: StateLock
+    locks: Dict[str, SectionLock]
+    generations: Dict[str, int]
+    snapshots: Dict[str, Snapshot]
+    subscriptions: Dict[str, List[Subscription]]
+    registry: EnvironmentRegistry
+    environment_cache: Optional[Tuple[int, Dict[str, Any]]]
+
+    def __init__(self) -> None:
+        """Initializes section locks, generation counters, snapshots, 
+        subscriptions and environment registry."""
+        self.locks = {section: SectionLock(section) for section in SECTIONS}
+        self.lock = StateLock([self.locks[section] for section in SECTIONS])
+        self.generations_lock = threading.Lock()
+        self.generations = {section: 0 for section in SECTIONS}
+        self.snapshots = {}
+        self.subscriptions = {}
+        self.subscriptions_lock = threading.Lock()
+        self.registry = EnvironmentRegistry()
+        self.environment_cache = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets attribute, marks section as modified if replacing a section."""
+        super().__setattr__(name, value)
+        if name in SECTIONS:
+            self.mark_dirty(name)
+
+    def mark_dirty(self, section: str) -> None:
+        """Increments generation counter for section. Should be called after directly 
+        modifying a section dict instead of using a state setter function."""
+        with self.generations_lock:
+            self.generations[section] += 1
+
+    def generation(self, section: str) -> int:
+        """Gets generation counter for section."""
+        return self.generations[section]
+
+    def snapshot(self, section: str, refresh: bool = False) -> Snapshot:
+        """Gets immutable snapshot of section. Returns the shared snapshot without 
+        locking if the section has not been modified since it was taken. Refreshing 
+        takes a new snapshot to catch modifications that were not marked dirty."""
+        snapshot = self.snapshots.get(section)
+        if not refresh and snapshot is not None:
+            if snapshot.version == self.generations[section]:
+                return snapshot
+
+        # Take new snapshot, unless another thread just took one
+        with self.locks[section]:
+            generation = self.generations[section]
+            snapshot = self.snapshots.get(section)
+            if refresh or snapshot is None or snapshot.version != generation:
+                snapshot = Snapshot(section, generation, getattr(self, section))
+                self.snapshots[section] = snapshot
+        return snapshot
+
+    def subscribe(
+        self, variables: Iterable[str], callback: Optional[Callable[[], None]] = None
+    ) -> Subscription:
+        """Subscribes to changes of environment sensor variables. Callback is called 
+        on every change."""
+        subscription = Subscription(variables, callback)
+        with self.subscriptions_lock:
+            for variable in subscription.variables:
+                subscriptions = self.subscriptions.get(variable, [])
+                self.subscriptions[variable] = subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Removes subscription."""
+        with self.subscriptions_lock:
+            for variable in subscription.variables:
+                subscriptions = self.subscriptions.get(variable, [])
+                subscriptions = [s for s in subscriptions if s is not subscription]
+                if subscriptions == []:
+                    self.subscriptions.pop(variable, None)
+                else:
+                    self.subscriptions[variable] = subscriptions
+
+    def notify_subscribers(self, variable: str) -> None:
+        """Wakes subscribers of environment variable. Subscriber lists are replaced 
+        rather than modified so they can be read without locking."""
+        subscriptions = self.subscriptions.get(variable)
+        if not subscriptions:
+            return
+        timestamp = time.monotonic()
+        for subscription in subscriptions:  # type: ignore
+            subscription.notify(variable, timestamp)
+
+    def section_lock(self, section: str) -> SectionLock:
+        """Gets lock for section."""
+        return self.locks[section]
+
+    def lock_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Gets wait and hold time statistics of each section lock."""
+        return {section: lock.stats for section, lock in self.locks.items()}
 
     def __str__(self) -> str:
         return "State(device={}, environment={}, recipe={}, peripherals={}, controllers={}, iot={}, resource={}, network={}, upgrade={})".format(
@@ -36,170 +155,131 @@ class State(object):
             self.upgrade,
         )
 
+    @property
+    def environment(self) -> Dict[str, Any]:
+        """Gets environment section as a read-only nested dict built from the 
+        environment registry. Modifying it raises a type error, use the environment 
+        setters instead. The dict is rebuilt only after the section is marked dirty, 
+        readers of single values should use the environment getters instead."""
+        with self.locks["environment"]:
+            generation = self.generations["environment"]
+            cache = self.environment_cache
+            if cache is not None and cache[0] == generation:
+                return cache[1]
+            environment = freeze(self.registry.to_dict())
+            self.environment_cache = (generation, environment)
+            return environment
+
+    @environment.setter
+    def environment(self, value: Dict[str, Any]) -> None:
+        """Replaces environment registry variables with values from a nested dict."""
+        with self.locks["environment"]:
+            self.registry.load_dict(value)
+
+    def register_environment_variables(
+        self,
+        peripheral: str,
+        sensor_variables: Iterable[str],
+        actuator_variables: Iterable[str],
+    ) -> None:
+        """Registers environment variables reported or actuated by peripheral."""
+        with self.locks["environment"]:
+            self.registry.register(peripheral, sensor_variables, actuator_variables)
+
+    def remove_environment_sensor(self, sensor: str, variables: Iterable[str]) -> None:
+        """Removes values reported by sensor from shared environment state."""
+        with self.locks["environment"]:
+            self.registry.remove_sensor(sensor, variables)
+        self.mark_dirty("environment")
+
+    def clear_environment_reported_sensor_values(self) -> None:
+        """Clears reported sensor values and statistics in shared environment state."""
+        with self.locks["environment"]:
+            self.registry.clear_reported_sensor_values()
+        self.mark_dirty("environment")
+
+    def clear_environment_desired_sensor_values(self) -> None:
+        """Sets desired sensor values in shared environment state to None."""
+        with self.locks["environment"]:
+            for record in self.registry.sensors.values():
+                if record.desired is not MISSING:
+                    record.desired = None
+        self.mark_dirty("environment")
+
     def set_environment_reported_sensor_value(
         self, sensor: str, variable: str, value: Any, simple: bool = False
     ) -> None:
-        """Sets reported sensor value to shared environment state."""
-
-        # TODO: Clean this up, it is a mess...
-
-        # Ensure valid dict structure
-        if "reported_sensor_stats" not in self.environment:
-            self.environment["reported_sensor_stats"] = {}
-
-        # Individual
-        if "individual" not in self.environment["reported_sensor_stats"]:
-            self.environment["reported_sensor_stats"]["individual"] = {}
-        if (
-            "instantaneous"
-            not in self.environment["reported_sensor_stats"]["individual"]
-        ):
-            self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ] = {}
-        if "average" not in self.environment["reported_sensor_stats"]["individual"]:
-            self.environment["reported_sensor_stats"]["individual"]["average"] = {}
-
-        # Group
-        if "group" not in self.environment["reported_sensor_stats"]:
-            self.environment["reported_sensor_stats"]["group"] = {}
-        if "instantaneous" not in self.environment["reported_sensor_stats"]["group"]:
-            self.environment["reported_sensor_stats"]["group"]["instantaneous"] = {}
-        if "average" not in self.environment["reported_sensor_stats"]["group"]:
-            self.environment["reported_sensor_stats"]["group"]["average"] = {}
-
-        # Sensor
-        if "sensor" not in self.environment:
-            self.environment["sensor"] = {}
-        if "reported" not in self.environment["sensor"]:
-            self.environment["sensor"]["reported"] = {}
-
-        # Force simple if value is None (don't want to try averaging `None`)
-        if value is None:
-            simple = True
-
-        with self.lock:
-            # Update individual instantaneous
-            by_type = self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ]
-            if variable not in by_type:
-                by_type[variable] = {}
-            by_var = self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ][variable]
-            by_var[sensor] = value
-
-            if simple:
-                # Update simple sensor value with reported value
-                self.environment["sensor"]["reported"][variable] = value
-
-            else:
-                # Update individual average
-                by_type = self.environment["reported_sensor_stats"]["individual"][
-                    "average"
-                ]
-                if variable not in by_type:
-                    by_type[variable] = {}
-                if sensor not in by_type:
-                    by_type[sensor] = {"value": value, "samples": 1}
-                else:
-                    stored_value = by_type[sensor]["value"]
-                    stored_samples = by_type[sensor]["samples"]
-                    new_samples = stored_samples + 1
-                    new_value = (stored_value * stored_samples + value) / new_samples
-                    by_type[sensor]["value"] = new_value
-                    by_type[sensor]["samples"] = new_samples
-
-                # Update group instantaneous
-                by_var_i = self.environment["reported_sensor_stats"]["individual"][
-                    "instantaneous"
-                ][variable]
-                num_sensors = 0
-                total = 0
-                for sensor in by_var_i:
-                    if by_var_i[sensor] != None:
-                        total += by_var_i[sensor]
-                        num_sensors += 1
-                new_value = total / num_sensors
-                self.environment["reported_sensor_stats"]["group"]["instantaneous"][
-                    variable
-                ] = {"value": new_value, "samples": num_sensors}
-
-                # Update group average
-                by_type = self.environment["reported_sensor_stats"]["group"]["average"]
-                if variable not in by_type:
-                    by_type[variable] = {"value": value, "samples": 1}
-                else:
-                    stored_value = by_type[variable]["value"]
-                    stored_samples = by_type[variable]["samples"]
-                    new_samples = stored_samples + 1
-
-                    # Check if group average > 20 samples
-                    if new_samples > 20:
-                        new_samples = 1
-                        new_value = value
-                    else:
-                        new_value = (
-                            stored_value * stored_samples + value
-                        ) / new_samples
-
-                    # Update dict
-                    by_type[variable]["value"] = new_value
-                    by_type[variable]["samples"] = new_samples
-
-                # Update simple sensor value with instantaneous group value
-                self.environment["sensor"]["reported"][variable] = self.environment[
-                    "reported_sensor_stats"
-                ]["group"]["instantaneous"][variable]["value"]
+        """Sets reported sensor value to shared environment state. Updates sensor 
+        and group statistics unless value is simple."""
+        with self.locks["environment"]:
+            registry = self.registry
+            record = registry.sensors.get(variable) or registry.sensor(variable)
+            record.report(sensor, value, simple)
+        self.mark_dirty("environment")
+        self.notify_subscribers(variable)
 
     def set_environment_desired_sensor_value(self, variable: str, value: Any) -> None:
         """Sets desired sensor value to shared environment state."""
-        set_nested_dict_safely(
-            self.environment, ["sensor", "desired", variable], value, self.lock
-        )
+        with self.locks["environment"]:
+            self.registry.sensor(variable).desired = value
+        self.mark_dirty("environment")
+        self.notify_subscribers(variable)
 
     def set_environment_reported_actuator_value(
         self, variable: str, value: Any
     ) -> None:
         """Sets reported actuator value to shared environment state."""
-        set_nested_dict_safely(
-            self.environment, ["actuator", "reported", variable], value, self.lock
-        )
+        with self.locks["environment"]:
+            self.registry.actuator(variable).reported = value
+        self.mark_dirty("environment")
 
     def set_environment_desired_actuator_value(self, variable: str, value: Any) -> None:
         """Sets desired actuator value to shared environment state."""
-        set_nested_dict_safely(
-            self.environment, ["actuator", "desired", variable], value, self.lock
-        )
+        with self.locks["environment"]:
+            self.registry.actuator(variable).desired = value
+        self.mark_dirty("environment")
 
     def get_environment_reported_sensor_value(self, variable: str) -> Any:
         """Gets reported sensor value from shared environment state."""
-        return get_nested_dict_safely(
-            self.environment, ["sensor", "reported", variable]
-        )
+        record = self.registry.sensors.get(variable)
+        return None if record is None else self.registry.get(record.reported)
+
+    def get_environment_sensor_statistics(
+        self, variable: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Gets mean, min, max, standard deviation and rate of change of reported 
+        sensor values over each statistics window, for each sensor and each sensor 
+        group. Only includes variable if given."""
+        with self.locks["environment"]:
+            return self.registry.statistics_dict(variable)
+
+    def get_environment_instantaneous_sensor_values(self) -> Dict[str, Dict[str, Any]]:
+        """Gets latest value reported by each sensor for each variable from shared 
+        environment state."""
+        with self.locks["environment"]:
+            return self.registry.instantaneous_dict()
 
     def get_environment_desired_sensor_value(self, variable: str) -> Any:
         """Gets desired sensor value from shared environment state."""
-        return get_nested_dict_safely(self.environment, ["sensor", "desired", variable])
+        record = self.registry.sensors.get(variable)
+        return None if record is None else self.registry.get(record.desired)
 
     def get_environment_reported_actuator_value(self, variable: str) -> Any:
         """Gets reported actuator value from shared environment state."""
-        return get_nested_dict_safely(
-            self.environment, ["actuator", "reported", variable]
-        )
+        record = self.registry.actuators.get(variable)
+        return None if record is None else self.registry.get(record.reported)
 
     def get_environment_desired_actuator_value(self, variable: str) -> Any:
         """Gets desired actuator value from shared environment state."""
-        return get_nested_dict_safely(
-            self.environment, ["actuator", "desired", variable]
-        )
+        record = self.registry.actuators.get(variable)
+        return None if record is None else self.registry.get(record.desired)
 
     def set_peripheral_value(self, peripheral: str, variable: str, value: Any) -> None:
         """Sets peripheral to shared peripheral state."""
         set_nested_dict_safely(
-            self.peripherals, [peripheral, variable], value, self.lock
+            self.peripherals, [peripheral, variable], value, self.locks["peripherals"]
         )
+        self.mark_dirty("peripherals")
 
     def get_peripheral_value(self, peripheral: str, variable: str) -> Any:
         """ Gets peripheral value from shared peripheral state. """
@@ -213,8 +293,9 @@ class State(object):
             self.peripherals,
             [peripheral, "sensor", "reported", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def set_peripheral_desired_sensor_value(
         self, peripheral: str, variable: str, value: Any
@@ -224,8 +305,9 @@ class State(object):
             self.peripherals,
             [peripheral, "sensor", "desired", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def set_peripheral_reported_actuator_value(
         self, peripheral: str, variable: str, value: Any
@@ -235,8 +317,9 @@ class State(object):
             self.peripherals,
             [peripheral, "actuator", "reported", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def set_peripheral_desired_actuator_value(
         self, peripheral: str, variable: str, value: Any
@@ -246,8 +329,9 @@ class State(object):
             self.peripherals,
             [peripheral, "actuator", "desired", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def get_peripheral_reported_sensor_value(
         self, peripheral: str, variable: str
@@ -284,8 +368,9 @@ class State(object):
     def set_controller_value(self, controller: str, variable: str, value: Any) -> None:
         """Sets controller to shared controller state."""
         set_nested_dict_safely(
-            self.controllers, [controller, variable], value, self.lock
+            self.controllers, [controller, variable], value, self.locks["controllers"]
         )
+        self.mark_dirty("controllers")
 
     def get_controller_value(self, controller: str, variable: str) -> Any:
         """Gets controller value from shared controller state."""
@@ -0,0 +1,358 @@
+# Import standard python modules
+import time
+
+# Import python types
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Import device utilities
+from device.utilities.state.statistics import StreamStatistics
+
+# Initialize marker for values that have not been set, None is a valid value
+MISSING = object()
+
+# Initialize number of samples after which group averages restart
+GROUP_AVERAGE_SAMPLES = 20
+
+
+class SensorReading:
+    """Latest value, running average and windowed statistics reported by one sensor 
+    for a variable."""
+
+    __slots__ = ("sensor", "value", "average", "samples", "statistics")
+
+    def __init__(self, sensor: str) -> None:
+        """Initializes sensor reading."""
+        self.sensor = sensor
+        self.value: Any = MISSING
+        self.average: Any = MISSING
+        self.samples = 0
+        self.statistics: Optional[StreamStatistics] = None
+
+
+class SensorVariable:
+    """Reported and desired values of a sensor variable with its per sensor readings
+    and group statistics."""
+
+    __slots__ = (
+        "name",
+        "reported",
+        "desired",
+        "readings",
+        "group_value",
+        "group_samples",
+        "group_average",
+        "group_average_samples",
+        "group_statistics",
+    )
+
+    def __init__(self, name: str) -> None:
+        """Initializes sensor variable."""
+        self.name = name
+        self.reported: Any = MISSING
+        self.desired: Any = MISSING
+        self.readings: Dict[str, SensorReading] = {}
+        self.group_value: Any = MISSING
+        self.group_samples = 0
+        self.group_average: Any = MISSING
+        self.group_average_samples = 0
+        self.group_statistics: Optional[StreamStatistics] = None
+
+    def reading(self, sensor: str) -> SensorReading:
+        """Gets reading for sensor, registers sensor on first use."""
+        reading = self.readings.get(sensor)
+        if reading is None:
+            reading = SensorReading(sensor)
+            self.readings[sensor] = reading
+        return reading
+
+    def report(
+        self,
+        sensor: str,
+        value: Any,
+        simple: bool = False,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Reports sensor value. Simple values are reported directly, other values
+        update sensor and group statistics and report the group value. Timestamp is
+        a monotonic time in seconds, defaults to now."""
+        reading = self.readings.get(sensor) or self.reading(sensor)
+        reading.value = value
+
+        # Report simple values directly, never average None
+        if simple or value is None:
+            self.reported = value
+            return
+
+        # Update sensor average
+        if reading.average is MISSING:
+            reading.average = value
+            reading.samples = 1
+        else:
+            samples = reading.samples + 1
+            reading.average = (reading.average * reading.samples + value) / samples
+            reading.samples = samples
+
+        # Update group instantaneous value from latest sensor values
+        self.update_group_value()
+
+        # Update group average, restarts after enough samples
+        samples = self.group_average_samples + 1
+        if self.group_average is MISSING or samples > GROUP_AVERAGE_SAMPLES:
+            self.group_average = value
+            self.group_average_samples = 1
+        else:
+            average = self.group_average * self.group_average_samples + value
+            self.group_average = average / samples
+            self.group_average_samples = samples
+
+        # Update sensor and group windowed statistics
+        if timestamp is None:
+            timestamp = time.monotonic()
+        statistics = reading.statistics
+        if statistics is None:
+            statistics = reading.statistics = StreamStatistics()
+        statistics.add(value, timestamp)
+        group_statistics = self.group_statistics
+        if group_statistics is None:
+            group_statistics = self.group_statistics = StreamStatistics()
+        group_statistics.add(self.group_value, timestamp)
+
+        # Report group instantaneous value
+        self.reported = self.group_value
+
+    def update_group_value(self) -> None:
+        """Updates group instantaneous value from the latest value of each sensor."""
+        total = 0
+        num_sensors = 0
+        for reading in self.readings.values():
+            if reading.value is not MISSING and reading.value is not None:
+                total += reading.value
+                num_sensors += 1
+        self.group_value = total / num_sensors
+        self.group_samples = num_sensors
+
+    def remove(self, sensor: str) -> None:
+        """Removes reading of a sensor. Recomputes the group value from the sensors
+        that still report a value, resets the variable if none remain."""
+        self.readings.pop(sensor, None)
+        values = [
+            reading.value
+            for reading in self.readings.values()
+            if reading.value is not MISSING and reading.value is not None
+        ]
+
+        # Reset variable once no sensor reports it
+        if values == []:
+            self.reported = MISSING
+            self.group_value = MISSING
+            self.group_samples = 0
+            return
+
+        # Keep simple values reported directly by remaining sensors
+        if self.group_value is MISSING:
+            return
+
+        # Report group value of remaining sensors
+        self.update_group_value()
+        self.reported = self.group_value
+
+
+class ActuatorVariable:
+    """Reported and desired values of an actuator variable."""
+
+    __slots__ = ("name", "reported", "desired")
+
+    def __init__(self, name: str) -> None:
+        """Initializes actuator variable."""
+        self.name = name
+        self.reported: Any = MISSING
+        self.desired: Any = MISSING
+
+
+# Initialize variable record types
+Variable = Union[SensorVariable, ActuatorVariable]
+
+
+class EnvironmentRegistry:
+    """Stores environment sensor and actuator variables as slot records looked up
+    once by name. Variables are registered when peripherals are set up or on first
+    use. The nested environment dict is only built on demand for json consumers."""
+
+    def __init__(self) -> None:
+        """Initializes environment registry."""
+        self.sensors: Dict[str, SensorVariable] = {}
+        self.actuators: Dict[str, ActuatorVariable] = {}
+
+    def sensor(self, variable: str) -> SensorVariable:
+        """Gets sensor variable, registers variable on first use."""
+        record = self.sensors.get(variable)
+        if record is None:
+            record = SensorVariable(variable)
+            self.sensors[variable] = record
+        return record
+
+    def actuator(self, variable: str) -> ActuatorVariable:
+        """Gets actuator variable, registers variable on first use."""
+        record = self.actuators.get(variable)
+        if record is None:
+            record = ActuatorVariable(variable)
+            self.actuators[variable] = record
+        return record
+
+    def register(
+        self,
+        sensor: str,
+        sensor_variables: Iterable[str],
+        actuator_variables: Iterable[str],
+    ) -> None:
+        """Registers variables reported by a sensor or actuated by a peripheral."""
+        for variable in sensor_variables:
+            self.sensor(variable).reading(sensor)
+        for variable in actuator_variables:
+            self.actuator(variable)
+
+    def remove_sensor(self, sensor: str, variables: Iterable[str]) -> None:
+        """Removes readings of a sensor, variables keep the values reported by other
+        sensors."""
+        for variable in variables:
+            record = self.sensors.get(variable)
+            if record is not None:
+                record.remove(sensor)
+
+    def clear_reported_sensor_values(self) -> None:
+        """Clears reported sensor values and statistics, keeps desired values."""
+        for variable, record in list(self.sensors.items()):
+            cleared = SensorVariable(variable)
+            cleared.desired = record.desired
+            self.sensors[variable] = cleared
+
+    def clear(self) -> None:
+        """Removes all variables."""
+        self.sensors = {}
+        self.actuators = {}
+
+    def get(self, value: Any) -> Any:
+        """Gets value, unset values are None."""
+        return None if value is MISSING else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Builds nested environment dict from registered variables."""
+        sensor_reported: Dict[str, Any] = {}
+        sensor_desired: Dict[str, Any] = {}
+        instantaneous: Dict[str, Any] = {}
+        average: Dict[str, Any] = {}
+        group_instantaneous: Dict[str, Any] = {}
+        group_average: Dict[str, Any] = {}
+        for variable, record in self.sensors.items():
+            if record.reported is not MISSING:
+                sensor_reported[variable] = record.reported
+            if record.desired is not MISSING:
+                sensor_desired[variable] = record.desired
+            for sensor, reading in record.readings.items():
+                if reading.value is not MISSING:
+                    instantaneous.setdefault(variable, {})[sensor] = reading.value
+                if reading.average is not MISSING:
+                    average.setdefault(variable, {})[sensor] = {
+                        "value": reading.average,
+                        "samples": reading.samples,
+                    }
+            if record.group_value is not MISSING:
+                group_instantaneous[variable] = {
+                    "value": record.group_value,
+                    "samples": record.group_samples,
+                }
+            if record.group_average is not MISSING:
+                group_average[variable] = {
+                    "value": record.group_average,
+                    "samples": record.group_average_samples,
+                }
+
+        actuator_reported: Dict[str, Any] = {}
+        actuator_desired: Dict[str, Any] = {}
+        for variable, actuator in self.actuators.items():
+            if actuator.reported is not MISSING:
+                actuator_reported[variable] = actuator.reported
+            if actuator.desired is not MISSING:
+                actuator_desired[variable] = actuator.desired
+
+        return {
+            "sensor": {"desired": sensor_desired, "reported": sensor_reported},
+            "actuator": {"desired": actuator_desired, "reported": actuator_reported},
+            "reported_sensor_stats": {
+                "individual": {"instantaneous": instantaneous, "average": average},
+                "group": {
+                    "instantaneous": group_instantaneous,
+                    "average": group_average,
+                },
+            },
+        }
+
+    def instantaneous_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Builds latest value reported by each sensor for each variable."""
+        instantaneous: Dict[str, Dict[str, Any]] = {}
+        for variable, record in self.sensors.items():
+            for sensor, reading in record.readings.items():
+                if reading.value is not MISSING:
+                    instantaneous.setdefault(variable, {})[sensor] = reading.value
+        return instantaneous
+
+    def statistics_dict(
+        self, variable: Optional[str] = None, timestamp: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Builds windowed statistics dict of every sensor and sensor group, or of 
+        one variable if given. Timestamp is a monotonic time in seconds, defaults 
+        to now."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        individual: Dict[str, Any] = {}
+        group: Dict[str, Any] = {}
+        for name, record in self.sensors.items():
+            if variable is not None and name != variable:
+                continue
+            for sensor, reading in record.readings.items():
+                if reading.statistics is not None:
+                    stats = reading.statistics.to_dict(timestamp)
+                    individual.setdefault(name, {})[sensor] = stats
+            if record.group_statistics is not None:
+                group[name] = record.group_statistics.to_dict(timestamp)
+        return {"individual": individual, "group": group}
+
+    def load_dict(self, environment: Optional[Dict[str, Any]]) -> None:
+        """Replaces variables with values from a nested environment dict."""
+        self.clear()
+        environment = environment or {}
+
+        # Load sensor and actuator values
+        lookups: List[Tuple[str, Callable[[str], Variable]]] = [
+            ("sensor", self.sensor),
+            ("actuator", self.actuator),
+        ]
+        for key, records in lookups:
+            values = environment.get(key) or {}
+            for variable, value in (values.get("reported") or {}).items():
+                records(variable).reported = value
+            for variable, value in (values.get("desired") or {}).items():
+                records(variable).desired = value
+
+        # Load sensor statistics
+        stats = environment.get("reported_sensor_stats") or {}
+        individual = stats.get("individual") or {}
+        for variable, values in (individual.get("instantaneous") or {}).items():
+            for sensor, value in values.items():
+                self.sensor(variable).reading(sensor).value = value
+        for variable, values in (individual.get("average") or {}).items():
+            for sensor, average in values.items():
+                if not isinstance(average, dict) or "value" not in average:
+                    continue
+                reading = self.sensor(variable).reading(sensor)
+                reading.average = average["value"]
+                reading.samples = average.get("samples", 1)
+        group = stats.get("group") or {}
+        for variable, value in (group.get("instantaneous") or {}).items():
+            record = self.sensor(variable)
+            record.group_value = value["value"]
+            record.group_samples = value["samples"]
+        for variable, value in (group.get("average") or {}).items():
+            record = self.sensor(variable)
+            record.group_average = value["value"]
+            record.group_average_samples = value["samples"]
@@ -0,0 +1,38 @@
+# Import standard python modules
+import json, threading
+
+# Import python types
+from typing import Any, Optional
+
+# Import device utilities
+from device.utilities.setups import freeze
+
+
+class Snapshot:
+    """Immutable copy of a state section at one generation. Snapshots are shared by
+    every reader of the same generation, so the section is copied and encoded to
+    json at most once per generation."""
+
+    __slots__ = ("section", "version", "value", "_json", "_lock")
+
+    def __init__(self, section: str, version: int, value: Any) -> None:
+        """Initializes snapshot, freezes a copy of value."""
+        self.section = section
+        self.version = version
+        self.value = freeze(value)
+        self._json: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def json(self) -> str:
+        """Gets json encoded value, encodes value on first use."""
+        json_ = self._json
+        if json_ == None:
+            with self._lock:
+                if self._json == None:
+                    self._json = json.dumps(self.value)
+                json_ = self._json
+        return json_  # type: ignore
+
+    def __repr__(self) -> str:
+        return "Snapshot(section={}, version={})".format(self.section, self.version)
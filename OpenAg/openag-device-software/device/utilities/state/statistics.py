@@ -0,0 +1,144 @@
+# Import standard python modules
+import math
+from collections import deque
+
+# Import python types
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Initialize statistics windows in seconds
+WINDOWS = (("1m", 60.0), ("10m", 600.0), ("1h", 3600.0))
+
+# Initialize maximum number of samples kept per window
+MAX_WINDOW_SAMPLES = 4096
+
+
+class WindowStatistics:
+    """Statistics of the samples received within the last duration seconds. Samples
+    are kept in a bounded ring buffer, mean and standard deviation are updated with
+    Welford's algorithm as samples enter and leave the window, min and max are kept
+    in monotonic queues. Each sample costs amortized constant time."""
+
+    __slots__ = (
+        "duration",
+        "capacity",
+        "samples",
+        "minimums",
+        "maximums",
+        "count",
+        "index",
+        "mean",
+        "m2",
+    )
+
+    def __init__(self, duration: float, capacity: int = MAX_WINDOW_SAMPLES) -> None:
+        """Initializes window statistics."""
+        self.duration = duration
+        self.capacity = capacity
+        self.samples: Deque[Tuple[int, float, float]] = deque()
+        self.minimums: Deque[Tuple[int, float]] = deque()
+        self.maximums: Deque[Tuple[int, float]] = deque()
+        self.count = 0
+        self.index = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Adds sample, evicts samples that left the window."""
+        samples = self.samples
+        oldest_timestamp = timestamp - self.duration
+        while samples and (
+            samples[0][1] < oldest_timestamp or self.count >= self.capacity
+        ):
+            self.remove()
+
+        # Append sample to ring buffer
+        index = self.index
+        self.index = index + 1
+        samples.append((index, timestamp, value))
+
+        # Update mean and sum of squared differences
+        count = self.count = self.count + 1
+        delta = value - self.mean
+        mean = self.mean = self.mean + delta / count
+        self.m2 += delta * (value - mean)
+
+        # Update monotonic min and max queues
+        minimums = self.minimums
+        while minimums and minimums[-1][1] >= value:
+            minimums.pop()
+        minimums.append((index, value))
+        maximums = self.maximums
+        while maximums and maximums[-1][1] <= value:
+            maximums.pop()
+        maximums.append((index, value))
+
+    def evict(self, oldest_timestamp: float) -> None:
+        """Removes samples older than oldest timestamp."""
+        samples = self.samples
+        while samples and samples[0][1] < oldest_timestamp:
+            self.remove()
+
+    def remove(self) -> None:
+        """Removes oldest sample."""
+        index, _, value = self.samples.popleft()
+
+        # Update mean and sum of squared differences
+        count = self.count = self.count - 1
+        if count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+        else:
+            delta = value - self.mean
+            mean = self.mean = self.mean - delta / count
+            self.m2 = max(self.m2 - delta * (value - mean), 0.0)
+
+        # Update monotonic min and max queues
+        if self.minimums[0][0] == index:
+            self.minimums.popleft()
+        if self.maximums[0][0] == index:
+            self.maximums.popleft()
+
+    def to_dict(self, timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """Gets window statistics. Evicts expired samples first if timestamp is
+        given. Rate of change is in units per second."""
+        if timestamp is not None:
+            self.evict(timestamp - self.duration)
+        if self.count == 0:
+            return {"samples": 0}
+
+        # Compute sample standard deviation and rate of change
+        stddev = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+        _, first_timestamp, first_value = self.samples[0]
+        _, last_timestamp, last_value = self.samples[-1]
+        elapsed = last_timestamp - first_timestamp
+        rate = (last_value - first_value) / elapsed if elapsed > 0 else 0.0
+
+        return {
+            "samples": self.count,
+            "mean": self.mean,
+            "min": self.minimums[0][1],
+            "max": self.maximums[0][1],
+            "stddev": stddev,
+            "rate": rate,
+        }
+
+
+class StreamStatistics:
+    """Statistics of one stream of sensor values over every statistics window."""
+
+    __slots__ = ("windows",)
+
+    def __init__(self) -> None:
+        """Initializes stream statistics."""
+        self.windows = [
+            (name, WindowStatistics(duration)) for name, duration in WINDOWS
+        ]
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Adds sample to every window."""
+        for _, window in self.windows:
+            window.add(value, timestamp)
+
+    def to_dict(self, timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """Gets statistics of every window."""
+        return {name: window.to_dict(timestamp) for name, window in self.windows}
@@ -0,0 +1,145 @@
+# Import standard python modules
+import time
+
+# Import python types
+from typing import Dict, Optional
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.logger import Logger
+from device.utilities.state.main import State, SECTIONS
+from device.utilities.persistence.main import writer
+
+# Import django modules
+from django.conf import settings
+
+# Initialize state model field names for each state section
+FIELDS = {
+    "device": "device",
+    "recipe": "recipe",
+    "environment": "environment",
+    "peripherals": "peripherals",
+    "controllers": "controllers",
+    "iot": "iot",
+    "resource": "resource",
+    "network": "connect",  # TODO: migrate this
+    "upgrade": "upgrade",
+}
+
+
+class StateStorage:
+    """Persists shared state in the state table. Only serializes sections whose
+    generation changed since the last flush and only writes sections whose
+    serialized value changed. Flushes at most once every flush interval. Every full
+    flush interval all sections are re-serialized to catch modifications that were
+    not marked in shared state."""
+
+    def __init__(
+        self,
+        state: State,
+        flush_interval: Optional[float] = None,
+        full_flush_interval: Optional[float] = None,
+    ) -> None:
+        """Initializes state storage."""
+
+        # Initialize passed in parameters
+        self.state = state
+
+        # Initialize flush intervals
+        self.flush_interval = float(
+            settings.STATE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+        self.full_flush_interval = float(
+            settings.STATE_FULL_FLUSH_INTERVAL
+            if full_flush_interval is None
+            else full_flush_interval
+        )
+
+        # Initialize logger
+        self.logger = Logger("StateStorage", "coordinator")
+
+        # Initialize flushed generations and serialized sections
+        self.flushed_generations: Dict[str, int] = {}
+        self.flushed_json: Dict[str, str] = {}
+
+        # Initialize flush timing
+        self.last_flush_timestamp = 0.0
+        self.last_full_flush_timestamp = 0.0
+
+        # Initialize statistics
+        self.num_flushes = 0
+        self.num_writes = 0
+        self.bytes_written = 0
+
+    @property
+    def next_flush_timestamp(self) -> float:
+        """Gets timestamp after which the next flush writes modified sections."""
+        return self.last_flush_timestamp + self.flush_interval
+
+    def flush(self, force: bool = False, timestamp: Optional[float] = None) -> int:
+        """Queues modified state sections to be written to the state table if flush
+        interval has elapsed or if forced. Returns number of bytes queued."""
+
+        # Get current timestamp
+        now = time.time() if timestamp is None else timestamp
+
+        # Check flush interval elapsed
+        if not force and now - self.last_flush_timestamp < self.flush_interval:
+            return 0
+        self.last_flush_timestamp = now
+        self.num_flushes += 1
+
+        # Check if doing a full flush
+        elapsed = now - self.last_full_flush_timestamp
+        full = force or elapsed >= self.full_flush_interval
+        if full:
+            self.last_full_flush_timestamp = now
+
+        # Serialize modified sections
+        updates: Dict[str, str] = {}
+        for section in SECTIONS:
+
+            # Skip sections that have not been modified since last flush
+            snapshot = self.state.snapshot(section, refresh=full)
+            if not full and self.flushed_generations.get(section) == snapshot.version:
+                continue
+
+            # Get serialized section, shared with other readers of the same snapshot
+            json_ = snapshot.json
+            self.flushed_generations[section] = snapshot.version
+
+            # Skip sections with unchanged value
+            if self.flushed_json.get(section) == json_:
+                continue
+            updates[section] = json_
+
+        # Check for updates
+        if updates == {}:
+            return 0
+
+        # Queue updates for persistence writer with a copy of every flushed section
+        self.flushed_json.update(updates)
+        writer.submit(self.write, updates, dict(self.flushed_json))
+
+        # Update statistics
+        num_bytes = sum(len(json_) for json_ in updates.values())
+        self.num_writes += 1
+        self.bytes_written += num_bytes
+        return num_bytes
+
+    def write(self, updates: Dict[str, str], sections: Dict[str, str]) -> None:
+        """Writes serialized sections to state table. If state does not exist,
+        creates it from every section serialized as of the updates. Runs on the
+        persistence writer thread so only uses the passed in sections."""
+
+        # Update existing state
+        fields = {FIELDS[section]: json_ for section, json_ in updates.items()}
+        if models.StateModel.objects.filter(pk=1).update(**fields) > 0:
+            return
+
+        # Create state from all serialized sections
+        self.logger.debug("Creating stored state")
+        fields = {FIELDS[section]: json_ for section, json_ in sections.items()}
+        models.StateModel.objects.create(id=1, **fields)
@@ -0,0 +1,55 @@
+# Import standard python modules
+import threading
+
+# Import python types
+from typing import Callable, Iterable, Optional, Set, Tuple
+
+
+class Subscription:
+    """Wakes a subscriber when any of its environment variables change. Changes that
+    arrive before the subscriber consumes them are coalesced into one wakeup, the
+    time of the first unconsumed change is kept to measure reaction latency. An 
+    optional callback is called on every change, e.g. to wake a waiting thread."""
+
+    def __init__(
+        self, variables: Iterable[str], callback: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Initializes subscription."""
+        self.variables = frozenset(variables)
+        self.callback = callback
+        self.lock = threading.Lock()
+        self.event = threading.Event()
+        self.changed: Set[str] = set()
+        self.change_time: Optional[float] = None
+
+        # Initialize statistics
+        self.notifications = 0
+        self.wakeups = 0
+
+    def notify(self, variable: str, timestamp: float) -> None:
+        """Records variable change and wakes subscriber."""
+        with self.lock:
+            self.changed.add(variable)
+            self.notifications += 1
+            if self.change_time == None:
+                self.change_time = timestamp
+            self.event.set()
+        if self.callback != None:
+            self.callback()  # type: ignore
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until a variable changes or timeout elapses. Returns true if there
+        are unconsumed changes."""
+        return self.event.wait(timeout)
+
+    def consume(self) -> Tuple[Set[str], Optional[float]]:
+        """Gets changed variables and monotonic time of the first change since last
+        call, then clears them."""
+        with self.lock:
+            changed, change_time = self.changed, self.change_time
+            self.changed = set()
+            self.change_time = None
+            self.event.clear()
+            if changed:
+                self.wakeups += 1
+        return changed, change_time
@@ -1,5 +1,5 @@
 # Import standard python libraries
-import os, sys, pytest, threading
+import os, sys, json, pytest, threading, time
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -16,3 +16,197 @@ from device.utilities.state.main import State
 #     assert list(s.recipe.keys()) == []
 #     assert list(s.peripherals.keys()) == []
 #     assert list(s.controllers.keys()) == []
+
+
+def test_set_environment_reported_sensor_value() -> None:
+    state = State()
+    state.register_environment_variables("Sensor-1", ["temperature"], [])
+    state.set_environment_reported_sensor_value("Sensor-1", "temperature", 20.0)
+    state.set_environment_reported_sensor_value("Sensor-2", "temperature", 22.0)
+    assert state.get_environment_reported_sensor_value("temperature") == 21.0
+    environment = state.environment
+    stats = environment["reported_sensor_stats"]
+    assert stats["individual"]["instantaneous"]["temperature"] == {
+        "Sensor-1": 20.0,
+        "Sensor-2": 22.0,
+    }
+    assert stats["individual"]["average"]["temperature"]["Sensor-1"] == {
+        "value": 20.0,
+        "samples": 1,
+    }
+    assert stats["group"]["instantaneous"]["temperature"] == {
+        "value": 21.0,
+        "samples": 2,
+    }
+    assert stats["group"]["average"]["temperature"] == {"value": 21.0, "samples": 2}
+
+
+def test_set_environment_simple_values() -> None:
+    state = State()
+    state.set_environment_reported_sensor_value("Camera", "image", "a.png", simple=True)
+    state.set_environment_desired_sensor_value("temperature", 25)
+    state.set_environment_reported_actuator_value("light", 50)
+    environment = state.environment
+    assert environment["sensor"] == {
+        "desired": {"temperature": 25},
+        "reported": {"image": "a.png"},
+    }
+    assert environment["actuator"] == {"desired": {}, "reported": {"light": 50}}
+    assert state.get_environment_desired_actuator_value("light") == None
+    state.clear_environment_desired_sensor_values()
+    assert state.environment["sensor"]["desired"] == {"temperature": None}
+
+
+def test_environment_dict_round_trip() -> None:
+    state = State()
+    state.set_environment_reported_sensor_value("Sensor-1", "humidity", 40.0)
+    state.set_environment_desired_actuator_value("light", 10)
+    environment = state.environment
+    other = State()
+    other.environment = environment
+    assert other.environment == environment
+
+    # Removing a sensor removes its reported values
+    other.remove_environment_sensor("Sensor-1", ["humidity"])
+    assert other.environment["sensor"]["reported"] == {}
+
+
+def test_remove_sensor_keeps_values_of_other_sensors() -> None:
+    state = State()
+    state.set_environment_reported_sensor_value("Sensor-1", "temperature", 20.0)
+    state.set_environment_reported_sensor_value("Sensor-2", "temperature", 24.0)
+    state.remove_environment_sensor("Sensor-1", ["temperature"])
+    assert state.get_environment_reported_sensor_value("temperature") == 24.0
+    group = state.environment["reported_sensor_stats"]["group"]
+    assert group["instantaneous"]["temperature"] == {"value": 24.0, "samples": 1}
+    assert state.get_environment_instantaneous_sensor_values() == {
+        "temperature": {"Sensor-2": 24.0}
+    }
+    state.remove_environment_sensor("Sensor-2", ["temperature"])
+    assert state.get_environment_reported_sensor_value("temperature") == None
+
+
+def test_environment_dict_rebuilt_when_dirty() -> None:
+    state = State()
+    state.set_environment_desired_sensor_value("temperature", 25)
+    environment = state.environment
+    assert state.environment is environment
+    state.set_environment_desired_sensor_value("temperature", 20)
+    assert state.environment is not environment
+    assert state.environment["sensor"]["desired"]["temperature"] == 20
+
+
+def test_environment_dict_is_read_only() -> None:
+    state = State()
+    state.set_environment_desired_sensor_value("temperature", 25)
+    with pytest.raises(TypeError):
+        state.environment["sensor"] = {}
+    with pytest.raises(TypeError):
+        state.environment["sensor"]["desired"]["temperature"] = 20
+    assert state.get_environment_desired_sensor_value("temperature") == 25
+
+
+def test_section_locks_are_independent() -> None:
+    state = State()
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold_peripherals() -> None:
+        with state.section_lock("peripherals"):
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold_peripherals)
+    thread.start()
+    held.wait(5)
+
+    # Other sections stay available while peripherals is held
+    state.set_environment_reported_sensor_value("Sensor-1", "temperature", 20.0)
+    state.set_controller_value("Controller-1", "mode", "NORMAL")
+    assert not state.lock.acquire(blocking=False)
+    assert not state.section_lock("peripherals").acquire(blocking=False)
+    release.set()
+    thread.join()
+
+    # State lock holds every section lock and is reentrant
+    with state.lock:
+        with state.section_lock("environment"):
+            state.set_peripheral_value("Sensor-1", "mode", "NORMAL")
+    assert state.peripherals["Sensor-1"]["mode"] == "NORMAL"
+
+
+def test_lock_stats_record_contention() -> None:
+    state = State()
+    lock = state.section_lock("device")
+    held = threading.Event()
+
+    def hold_device() -> None:
+        with lock:
+            held.set()
+            time.sleep(0.05)
+
+    thread = threading.Thread(target=hold_device)
+    thread.start()
+    held.wait(5)
+    with lock:
+        pass
+    thread.join()
+    stats = state.lock_stats()["device"]
+    assert stats["acquisitions"] == 2
+    assert stats["contentions"] == 1
+    assert stats["max_wait_ms"] > 0
+    assert stats["max_hold_ms"] >= 40
+
+
+def test_snapshot_is_shared_until_section_changes() -> None:
+    state = State()
+    state.peripherals = {}
+    state.set_peripheral_value("Sensor-1", "mode", "NORMAL")
+    snapshot = state.snapshot("peripherals")
+    assert snapshot.value == {"Sensor-1": {"mode": "NORMAL"}}
+    assert state.snapshot("peripherals") is snapshot
+    assert snapshot.json is snapshot.json
+
+    # Snapshots are immutable and unaffected by later writes
+    with pytest.raises(TypeError):
+        snapshot.value["Sensor-1"]["mode"] = "ERROR"
+    state.set_peripheral_value("Sensor-1", "mode", "ERROR")
+    new_snapshot = state.snapshot("peripherals")
+    assert new_snapshot.version > snapshot.version
+    assert snapshot.value["Sensor-1"]["mode"] == "NORMAL"
+    assert json.loads(new_snapshot.json) == {"Sensor-1": {"mode": "ERROR"}}
+
+
+def test_environment_snapshot() -> None:
+    state = State()
+    state.set_environment_desired_sensor_value("temperature", 25)
+    snapshot = state.snapshot("environment")
+    assert snapshot.value["sensor"]["desired"] == {"temperature": 25}
+    state.set_environment_desired_sensor_value("temperature", 30)
+    assert state.snapshot("environment").value["sensor"]["desired"] == {
+        "temperature": 30
+    }
+
+
+def test_subscription_coalesces_changes() -> None:
+    state = State()
+    subscription = state.subscribe(["temperature"])
+    assert not subscription.wait(0)
+
+    # Several changes before the subscriber wakes are one wakeup
+    state.set_environment_reported_sensor_value("Sensor-1", "temperature", 20.0)
+    state.set_environment_desired_sensor_value("temperature", 25)
+    state.set_environment_reported_sensor_value("Sensor-1", "humidity", 40.0)
+    assert subscription.wait(0)
+    changed, change_time = subscription.consume()
+    assert changed == {"temperature"}
+    assert change_time <= time.monotonic()
+    assert subscription.notifications == 2
+    assert subscription.wakeups == 1
+    assert not subscription.wait(0)
+
+    # Unsubscribed subscriptions are not notified
+    state.unsubscribe(subscription)
+    state.set_environment_reported_sensor_value("Sensor-1", "temperature", 21.0)
+    assert not subscription.wait(0)
+    assert state.subscriptions == {}
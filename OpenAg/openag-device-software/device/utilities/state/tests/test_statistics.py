@@ -0,0 +1,71 @@
+# Import standard python libraries
+import os, sys, statistics
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.state.main import State
+from device.utilities.state.statistics import WindowStatistics
+
+
+def test_window_statistics() -> None:
+    window = WindowStatistics(duration=10)
+    values = [20.0, 22.0, 21.0, 25.0, 19.0]
+    for timestamp, value in enumerate(values):
+        window.add(value, timestamp)
+    stats = window.to_dict()
+    assert stats["samples"] == 5
+    assert abs(stats["mean"] - statistics.mean(values)) < 1e-9
+    assert abs(stats["stddev"] - statistics.stdev(values)) < 1e-9
+    assert stats["min"] == 19.0
+    assert stats["max"] == 25.0
+    assert stats["rate"] == (19.0 - 20.0) / 4
+
+
+def test_window_statistics_evicts_old_samples() -> None:
+    window = WindowStatistics(duration=10)
+    values = [float(value % 7) for value in range(100)]
+    for timestamp, value in enumerate(values):
+        window.add(value, timestamp)
+
+    # Window keeps samples of the last 10 seconds
+    expected = values[89:]
+    stats = window.to_dict()
+    assert stats["samples"] == len(expected)
+    assert abs(stats["mean"] - statistics.mean(expected)) < 1e-9
+    assert abs(stats["stddev"] - statistics.stdev(expected)) < 1e-9
+    assert stats["min"] == min(expected)
+    assert stats["max"] == max(expected)
+
+    # Expired windows are empty
+    assert window.to_dict(timestamp=1000) == {"samples": 0}
+
+
+def test_window_statistics_capacity() -> None:
+    window = WindowStatistics(duration=3600, capacity=3)
+    for timestamp, value in enumerate([1.0, 2.0, 3.0, 4.0]):
+        window.add(value, timestamp)
+    stats = window.to_dict()
+    assert stats["samples"] == 3
+    assert stats["mean"] == 3.0
+    assert stats["min"] == 2.0
+
+
+def test_environment_sensor_statistics() -> None:
+    state = State()
+    state.set_environment_reported_sensor_value("Sensor-1", "temperature", 20.0)
+    state.set_environment_reported_sensor_value("Sensor-2", "temperature", 22.0)
+    state.set_environment_reported_sensor_value("Camera", "image", "a.png", True)
+    stats = state.get_environment_sensor_statistics()
+    assert list(stats["individual"]) == ["temperature"]
+    assert stats["individual"]["temperature"]["Sensor-1"]["1m"]["mean"] == 20.0
+    assert stats["group"]["temperature"]["1h"]["max"] == 21.0
+    assert state.get_environment_sensor_statistics("humidity") == {
+        "individual": {},
+        "group": {},
+    }
+
+    # Clearing reported values clears statistics
+    state.clear_environment_reported_sensor_values()
+    assert state.get_environment_sensor_statistics()["group"] == {}
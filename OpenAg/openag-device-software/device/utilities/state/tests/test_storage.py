@@ -0,0 +1,97 @@
+# Import standard python libraries
+import os, sys, pytest, json
+
+# Import python types
+from typing import Any
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import device state
+from device.utilities.state.main import State
+from device.utilities.state.storage import StateStorage
+
+
+def load(value: Any) -> Any:
+    """Loads stored state field, json field may already be decoded."""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def test_mark_dirty() -> None:
+    state = State()
+    generation = state.generation("recipe")
+    state.mark_dirty("recipe")
+    assert state.generation("recipe") == generation + 1
+
+
+def test_setter_marks_dirty() -> None:
+    state = State()
+    generation = state.generation("peripherals")
+    state.set_peripheral_value("Test", "mode", "NORMAL")
+    assert state.generation("peripherals") == generation + 1
+
+
+def test_replace_section_marks_dirty() -> None:
+    state = State()
+    generation = state.generation("controllers")
+    state.controllers = {}
+    assert state.generation("controllers") == generation + 1
+
+
+def test_flush_creates_state() -> None:
+    state = State()
+    storage = StateStorage(state, flush_interval=1, full_flush_interval=60)
+    assert storage.flush(timestamp=100) > 0
+    stored_state = models.StateModel.objects.get(pk=1)
+    assert load(stored_state.device) == state.device
+
+
+def test_flush_skips_unchanged_sections() -> None:
+    state = State()
+    storage = StateStorage(state, flush_interval=1, full_flush_interval=60)
+    storage.flush(timestamp=100)
+    assert storage.flush(timestamp=102) == 0
+    state.set_controller_value("Test", "mode", "NORMAL")
+    num_bytes = storage.flush(timestamp=104)
+    assert num_bytes == len(json.dumps(state.controllers))
+    stored_state = models.StateModel.objects.get(pk=1)
+    assert load(stored_state.controllers)["Test"]["mode"] == "NORMAL"
+
+
+def test_flush_interval() -> None:
+    state = State()
+    storage = StateStorage(state, flush_interval=1, full_flush_interval=60)
+    storage.flush(timestamp=100)
+    state.set_controller_value("Test", "mode", "ERROR")
+    assert storage.flush(timestamp=100.5) == 0
+    assert storage.flush(timestamp=100.5, force=True) > 0
+
+
+def test_full_flush_catches_unmarked_modifications() -> None:
+    state = State()
+    storage = StateStorage(state, flush_interval=1, full_flush_interval=60)
+    storage.flush(timestamp=100)
+    state.resource["status"] = "Unmarked"
+    assert storage.flush(timestamp=102) == 0
+    assert storage.flush(timestamp=161) > 0
+    stored_state = models.StateModel.objects.get(pk=1)
+    assert load(stored_state.resource)["status"] == "Unmarked"
+
+
+def test_write_creates_state_from_queued_sections() -> None:
+    state = State()
+    storage = StateStorage(state, flush_interval=1, full_flush_interval=60)
+    storage.flush(timestamp=100)
+    models.StateModel.objects.all().delete()
+    state.set_controller_value("Test", "mode", "NORMAL")
+    sections = dict(storage.flushed_json)
+    storage.write({"controllers": sections["controllers"]}, sections)
+    stored_state = models.StateModel.objects.get(pk=1)
+    assert load(stored_state.controllers) == json.loads(sections["controllers"])
+    assert load(stored_state.device) == json.loads(sections["device"])
+    assert storage.flushed_json == sections
@@ -0,0 +1,145 @@
+# Import standard python modules
+import collections, queue, threading, time
+
+# Import python types
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+# Initialize event priorities, lower values are processed first
+HIGH_PRIORITY = 0
+NORMAL_PRIORITY = 1
+
+
+class EventQueue(queue.Queue):
+    """Event queue that state machine threads can block on until an event is queued
+    or the thread is woken for other work (e.g. a subscribed variable changed),
+    instead of polling the queue on a fixed interval. State machines that are not
+    run by their own thread set a listener that is called on every put or wake.
+
+    Events are processed by priority then first-in-first-out. An event with the
+    same key as a queued event supersedes it, the queued event is dropped and the
+    new event queued last. Queue depth and the time events dwell in the queue are
+    recorded."""
+
+    # Declare queue internals used by this subclass, typeshed leaves them out
+    mutex: threading.Lock
+    not_empty: threading.Condition
+    unfinished_tasks: int
+
+    def __init__(
+        self,
+        priority: Optional[Callable[[Any], int]] = None,
+        key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+    ) -> None:
+        """Initializes event queue."""
+        self.priority = priority
+        self.key = key
+        super().__init__()
+        self.woken = False
+        self.listener: Optional[Callable[[], None]] = None
+
+        # Initialize statistics
+        self.received = 0
+        self.processed = 0
+        self.coalesced = 0
+        self.depth_max = 0
+        self.dwell_last = 0.0  # seconds
+        self.dwell_total = 0.0  # seconds
+        self.dwell_max = 0.0  # seconds
+
+    def _init(self, maxsize: int) -> None:
+        """Initializes queues for each priority and queued events by key."""
+        self.queues: List[Deque[List[Any]]] = [
+            collections.deque() for priority in (HIGH_PRIORITY, NORMAL_PRIORITY)
+        ]
+        self.keyed: Dict[Hashable, List[Any]] = {}
+
+    def _qsize(self) -> int:
+        """Gets number of queued events."""
+        return sum(len(events) for events in self.queues)
+
+    def _put(self, item: Any) -> None:
+        """Queues event by priority, replaces queued event with the same key."""
+        get_priority, get_key = self.priority, self.key
+        priority = NORMAL_PRIORITY if get_priority is None else get_priority(item)
+        key = None if get_key is None else get_key(item)
+        entry = [time.monotonic(), priority, key, item]
+
+        # Drop superseded event
+        if key is not None:
+            superseded = self.keyed.pop(key, None)
+            if superseded is not None:
+                self.queues[superseded[1]].remove(superseded)
+                self.unfinished_tasks -= 1
+                self.coalesced += 1
+            self.keyed[key] = entry
+
+        # Queue event
+        self.queues[priority].append(entry)
+        self.received += 1
+        self.depth_max = max(self.depth_max, self._qsize())
+
+    def _get(self) -> Any:
+        """Gets highest priority event that was queued first, records its dwell
+        time."""
+        events = next(events for events in self.queues if events)
+        timestamp, priority, key, item = events.popleft()
+        if key != None:
+            self.keyed.pop(key, None)
+        dwell = time.monotonic() - timestamp
+        self.processed += 1
+        self.dwell_last = dwell
+        self.dwell_total += dwell
+        self.dwell_max = max(self.dwell_max, dwell)
+        return item
+
+    def put(
+        self, item: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Puts event in queue and notifies listener."""
+        super().put(item, block, timeout)
+        self.notify_listener()
+
+    def notify_listener(self) -> None:
+        """Calls listener if set."""
+        listener = self.listener
+        if listener is not None:
+            listener()
+
+    def wake(self) -> None:
+        """Wakes threads waiting on the queue without queueing an event."""
+        with self.not_empty:
+            self.woken = True
+            self.not_empty.notify_all()
+        self.notify_listener()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the queue has an event, the queue is woken or timeout
+        elapses. Does not consume events. Returns true if not timed out."""
+        with self.not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._qsize() and not self.woken:
+                if deadline is None:
+                    self.not_empty.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.not_empty.wait(remaining)
+            self.woken = False
+            return True
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Gets queue statistics as a json serializable dict."""
+        with self.mutex:
+            average = self.dwell_total / self.processed if self.processed else 0.0
+            return {
+                "depth": self._qsize(),
+                "max_depth": self.depth_max,
+                "received": self.received,
+                "processed": self.processed,
+                "coalesced": self.coalesced,
+                "last_dwell_ms": round(self.dwell_last * 1000, 3),
+                "average_dwell_ms": round(average * 1000, 3),
+                "max_dwell_ms": round(self.dwell_max * 1000, 3),
+            }
@@ -2,25 +2,54 @@
 import logging, threading, queue, time
 
 # Import python types
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Callable, Hashable
+from concurrent.futures import Future, TimeoutError
 
 # Import device utilities
 from device.utilities.logger import Logger
+from device.utilities.cancellation import CancelToken
 
 # Import module elements
 from device.utilities.statemachine import modes, events
+from device.utilities.statemachine.eventqueue import EventQueue
+from device.utilities.statemachine.eventqueue import HIGH_PRIORITY, NORMAL_PRIORITY
+from device.utilities.statemachine.runtime import AsyncRuntime
+
+# Initialize longest time a state machine blocks waiting for events, bounds how long
+# state changes that are not signalled by an event take to be noticed
+MAX_EVENT_WAIT = 1.0  # seconds
+
+# Initialize most events processed per check, bounds how long queued events delay
+# scheduled work
+MAX_EVENT_BATCH = 16
+
+# Initialize mode step types, a mode entry function and an optional mode update
+# function that returns seconds until the next update or None after a transition
+ModeUpdate = Callable[[], Optional[float]]
+ModeStep = Tuple[Callable[[], None], Optional[ModeUpdate]]
 
 
 class StateMachineManager:
     """Manages state machines. Runs as a daemon thread, ensures valid transitions, 
-    and handles external events with an Events mixin class."""
+    and handles external events with an Events mixin class. Mode loops block on the 
+    event queue until an event arrives or their next scheduled work is due. State 
+    machines that define mode steps can instead be run as tasks of an async 
+    runtime, which calls step until the state machine shuts down."""
 
     def __init__(self) -> None:
         """Initializes state machine manager."""
         self.logger: Logger = Logger("StateMachineManager", __name__)
         self.thread: threading.Thread = threading.Thread(target=self.run)
-        self.event_queue: queue.Queue = queue.Queue()
+        self.event_queue: EventQueue = EventQueue(self.event_priority, self.event_key)
         self.is_shutdown: bool = False
+        self.cancel_token: CancelToken = CancelToken()
+        self.initialized: threading.Event = threading.Event()
+        self.create_duration: Optional[float] = None
+        self.spawn_time: Optional[float] = None
+        self.init_duration: Optional[float] = None
+        self.task: Optional[Future] = None
+        self.mode_steps: Dict[str, ModeStep] = {}
+        self.step_mode: Optional[str] = None
         self._mode: str = modes.INIT
         self.transitions: Dict[str, List[str]] = {
             modes.INIT: [modes.NORMAL, modes.SHUTDOWN, modes.ERROR],
@@ -39,14 +68,96 @@ class StateMachineManager:
     def mode(self, value: str) -> None:
         """Sets mode."""
         self._mode = value
+        self.signal_initialized(value)
+
+    def signal_initialized(self, mode: str) -> None:
+        """Sets initialized event when manager leaves init mode, clears it when 
+        manager re-enters init mode. Called by mode setters."""
+        if mode == modes.INIT:
+            self.initialized.clear()
+            return
+
+        # Record time from spawn to leaving init mode
+        if not self.initialized.is_set() and self.spawn_time != None:
+            self.init_duration = time.monotonic() - self.spawn_time  # type: ignore
+        self.initialized.set()
 
     ##### STATE MACHINE FUNCTIONS #############################################
 
-    def spawn(self) -> None:
-        """ Spawns state machine thread. """
+    def spawn(self, runtime: Optional[AsyncRuntime] = None) -> None:
+        """ Spawns state machine thread, or a task on runtime if given. """
+        self.spawn_time = time.monotonic()
+        if runtime != None:
+            self.task = runtime.spawn(self)  # type: ignore
+            return
         self.thread.daemon = True
         self.thread.start()
 
+    def is_alive(self) -> bool:
+        """Checks if state machine thread or task is running."""
+        if self.task != None:
+            return not self.task.done()  # type: ignore
+        return self.thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Waits until state machine thread or task exits. Returns true if exited."""
+        if timeout != None:
+            timeout = max(timeout, 0)  # type: ignore
+        if self.task != None:
+            try:
+                self.task.result(timeout)  # type: ignore
+            except TimeoutError:
+                return False
+            except Exception:
+                pass
+            return True
+        if self.spawn_time == None:
+            return True
+        self.thread.join(timeout)
+        return not self.thread.is_alive()
+
+    def step(self) -> Optional[float]:
+        """Runs one step of the state machine without waiting for events. Runs the 
+        entry function when entering a mode, then its update function on each 
+        step. Returns seconds until the next step is due, or None after shutdown."""
+
+        # Check if manager is shutdown
+        if self.is_shutdown:
+            return None
+
+        # Get mode step functions
+        mode = self.mode
+        if mode not in self.mode_steps:
+            self.logger.critical("Invalid state machine mode")
+            self.mode = modes.INVALID
+            self.is_shutdown = True
+            return None
+        enter, update = self.mode_steps[mode]
+
+        # Enter mode, modes without update function run once per entry
+        if mode != self.step_mode:
+            enter()
+            if update == None or self.mode != mode:
+                self.step_mode = None
+                return None if self.is_shutdown else 0.0
+            self.step_mode = mode
+
+        # Update mode
+        timeout = update()  # type: ignore
+        if timeout == None:
+            self.step_mode = None
+            return None if self.is_shutdown else 0.0
+        return timeout
+
+    def run_mode_loop(self, update: ModeUpdate) -> None:
+        """Runs mode update function until it returns None after a transition, waits 
+        for events or the next update between updates."""
+        while True:
+            timeout = update()
+            if timeout == None:
+                break
+            self.wait_for_event(timeout)
+
     def run(self) -> None:
         """Runs state machine."""
 
@@ -97,8 +208,8 @@ class StateMachineManager:
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode."""
@@ -123,8 +234,8 @@ class StateMachineManager:
             if self.new_transition(modes.ERROR):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next event
+            self.wait_for_event()
 
     def run_shutdown_mode(self) -> None:
         """Runs shutdown mode."""
@@ -164,6 +275,20 @@ class StateMachineManager:
             self.mode = modes.ERROR
             return True
 
+    def wait_for_event(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until an event is queued, the manager is woken or timeout elapses. 
+        Waits at most max event wait. Returns true if an event arrived or the 
+        manager was woken."""
+        if timeout == None or timeout > MAX_EVENT_WAIT:  # type: ignore
+            timeout = MAX_EVENT_WAIT
+        if timeout <= 0:  # type: ignore
+            return False
+        return self.event_queue.wait(timeout)
+
+    def wake(self) -> None:
+        """Wakes manager blocked waiting for an event."""
+        self.event_queue.wake()
+
     def create_event(self, request: Dict[str, Any]) -> Tuple[str, int]:
         """Creates a new event, checks for matching event type, pre-processes request,
         then adds to event queue. Returns message and http status code."""
@@ -175,16 +300,43 @@ class StateMachineManager:
         else:
             return "Unknown event request type", 400
 
+    def event_priority(self, request: Dict[str, Any]) -> int:
+        """Gets event priority, shutdown and reset events are processed first."""
+        if request.get("type") in (events.SHUTDOWN, events.RESET):
+            return HIGH_PRIORITY
+        return NORMAL_PRIORITY
+
+    def event_key(self, request: Dict[str, Any]) -> Optional[Hashable]:
+        """Gets key of events that supersede queued events with the same key, or None 
+        if every event is processed. Overridden by child classes."""
+        return None
+
     def check_events(self) -> None:
-        """Checks for a new event. Only processes one event per call, even if there are 
-        multiple in the queue. Events are processed first-in-first-out (FIFO)."""
+        """Checks for new events. Processes up to max event batch queued events by 
+        priority then first-in-first-out (FIFO). Stops after an event changes mode 
+        so remaining events are processed by the new mode."""
+        mode = self.mode
+        processed = 0
+        while processed < MAX_EVENT_BATCH:
+            try:
+                request = self.event_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.process_event(request)
+            processed += 1
+            if self.mode != mode or self.is_shutdown:
+                break
 
-        # Check for new events
-        if self.event_queue.empty():
-            return
+        # Record event queue statistics after processing events
+        if processed > 0:
+            self.record_event_stats()
 
-        # Get request
-        request = self.event_queue.get()
+    def record_event_stats(self) -> None:
+        """Records event queue statistics. Overridden by child classes."""
+        self.logger.debug("Event queue: {}".format(self.event_queue.stats))
+
+    def process_event(self, request: Dict[str, Any]) -> None:
+        """Processes event request."""
         self.logger.debug("Received new request: {}".format(request))
 
         # Get request parameters
@@ -207,6 +359,9 @@ class StateMachineManager:
         """Pre-processes shutdown event. Returns message and http status code."""
         self.logger.debug("Pre-processing shutdown event request")
 
+        # Cancel waits in progress so shutdown is not held up by sleeping drivers
+        self.cancel_token.cancel()
+
         # Add shutdown event request to event queue
         request = {"type": events.SHUTDOWN}
         self.event_queue.put(request)
@@ -0,0 +1,108 @@
+# Import standard python modules
+import asyncio, threading
+
+# Import python types
+from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+# Initialize runtime modes
+THREADS = "threads"
+ASYNCIO = "asyncio"
+
+# Initialize default number of executor threads running state machine steps
+DEFAULT_MAX_WORKERS = 4
+
+# Initialize default number of executor threads running mode entry steps
+DEFAULT_MAX_ENTRY_WORKERS = 4
+
+# Initialize longest time a task waits between steps, matches state machine threads
+MAX_STEP_WAIT = 1.0  # seconds
+
+
+class AsyncRuntime:
+    """Runs state machines as tasks on a single asyncio event loop instead of one
+    thread per state machine. Update steps may block briefly on driver calls so they
+    run in a bounded thread pool executor, between steps tasks wait on the event
+    loop until an event is queued or the next step is due. Mode entry steps (e.g.
+    INIT and SETUP) may block for seconds on driver retries so they run in a
+    separate bounded executor and never hold the workers running update steps."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_entry_workers: int = DEFAULT_MAX_ENTRY_WORKERS,
+    ) -> None:
+        """Initializes async runtime."""
+        if max_workers < 1 or max_entry_workers < 1:
+            raise ValueError("Runtime needs at least one worker in each executor")
+        self.logger = Logger("AsyncRuntime", "coordinator")
+        self.max_workers = max_workers
+        self.max_entry_workers = max_entry_workers
+        self.num_tasks = 0
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.entry_executor = ThreadPoolExecutor(max_workers=max_entry_workers)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        """Runs event loop forever."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def spawn(self, manager: Any) -> Future:
+        """Schedules state machine task, returns future that is done once the state
+        machine shuts down."""
+        coroutine = self.run_manager(manager)
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    async def run_manager(self, manager: Any) -> None:
+        """Steps state machine until shutdown. Waits for events or the next step
+        between steps."""
+        wakeup = asyncio.Event()
+        manager.event_queue.listener = lambda: self.loop.call_soon_threadsafe(
+            wakeup.set
+        )
+        self.num_tasks += 1
+        try:
+            while True:
+                wakeup.clear()
+                try:
+                    entering = manager.mode != manager.step_mode
+                    executor = self.entry_executor if entering else self.executor
+                    timeout = await self.loop.run_in_executor(executor, manager.step)
+                except Exception:
+                    manager.logger.exception("Unhandled exception in state machine")
+                    break
+                if timeout == None:
+                    break
+                if manager.event_queue.qsize() > 0 or timeout <= 0:
+                    continue
+                try:
+                    timeout = min(timeout, MAX_STEP_WAIT)
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            manager.event_queue.listener = None
+            self.num_tasks -= 1
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops event loop and executors, tasks should be shutdown first."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        self.executor.shutdown(wait=False)
+        self.entry_executor.shutdown(wait=False)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Gets runtime statistics."""
+        return {
+            "mode": ASYNCIO,
+            "max_workers": self.max_workers,
+            "max_entry_workers": self.max_entry_workers,
+            "tasks": self.num_tasks,
+        }
@@ -1,11 +1,16 @@
 # Import standard python libraries
-import os, sys, pytest, logging, time
+import os, sys, pytest, logging, threading, time
+
+# Import python types
+from typing import Any, Dict, List, Optional
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
 
 # Import state machine elements
-from device.utilities.statemachine.manager import StateMachineManager
+from device.utilities.statemachine.manager import StateMachineManager, MAX_EVENT_BATCH
+from device.utilities.statemachine.eventqueue import EventQueue
+from device.utilities.statemachine.runtime import AsyncRuntime
 from device.utilities.statemachine import modes, events
 
 
@@ -219,3 +224,151 @@ def test_process_reset_invalid_mode() -> None:
     assert manager._mode == modes.INIT
     manager._reset()
     assert manager._mode != modes.RESET
+
+
+def test_initialized_event() -> None:
+    manager = StateMachineManager()
+    assert not manager.initialized.is_set()
+    manager.spawn()
+    assert manager.initialized.wait(1)
+    assert manager.init_duration != None
+    manager.mode = modes.SHUTDOWN
+    manager.thread.join(1)
+
+
+def test_initialized_event_cleared_on_init() -> None:
+    manager = StateMachineManager()
+    manager.mode = modes.NORMAL
+    assert manager.initialized.is_set()
+    manager.mode = modes.INIT
+    assert not manager.initialized.is_set()
+
+
+def test_wait_for_event_returns_on_event() -> None:
+    manager = StateMachineManager()
+    assert manager.wait_for_event(0.01) == False
+    manager.shutdown()
+    start_time = time.monotonic()
+    assert manager.wait_for_event(5) == True
+    assert time.monotonic() - start_time < 1
+
+    # Waiting does not consume events
+    assert manager.event_queue.qsize() == 1
+
+
+def test_wake_interrupts_wait() -> None:
+    manager = StateMachineManager()
+    manager.wake()
+    assert manager.wait_for_event(5) == True
+    assert manager.wait_for_event(0.01) == False
+
+
+def test_event_queue_listener() -> None:
+    manager = StateMachineManager()
+    calls = []
+    manager.event_queue.listener = lambda: calls.append(time.time())
+    manager.event_queue.put({"type": events.RESET})
+    manager.wake()
+    assert len(calls) == 2
+
+
+def test_event_queue_priority_and_coalescing() -> None:
+    queue = EventQueue(
+        priority=lambda request: 0 if request["type"] == events.SHUTDOWN else 1,
+        key=lambda request: request.get("channel"),
+    )
+    queue.put({"type": "Set", "channel": "A", "value": 1})
+    queue.put({"type": "Set", "channel": "B", "value": 2})
+    queue.put({"type": "Off"})
+    queue.put({"type": "Set", "channel": "A", "value": 3})
+    queue.put({"type": events.SHUTDOWN})
+    assert queue.qsize() == 4
+    requests = [queue.get_nowait() for i in range(4)]
+    assert requests == [
+        {"type": events.SHUTDOWN},
+        {"type": "Set", "channel": "B", "value": 2},
+        {"type": "Off"},
+        {"type": "Set", "channel": "A", "value": 3},
+    ]
+    stats = queue.stats
+    assert stats["depth"] == 0
+    assert stats["max_depth"] == 4
+    assert stats["received"] == 5
+    assert stats["processed"] == 4
+    assert stats["coalesced"] == 1
+
+
+def test_check_events_processes_batch(monkeypatch) -> None:  # type: ignore
+    manager = StateMachineManager()
+    manager._mode = modes.NORMAL
+    processed: List[Dict[str, Any]] = []
+    monkeypatch.setattr(manager, "process_event", processed.append)
+    for i in range(MAX_EVENT_BATCH + 2):
+        manager.event_queue.put({"type": "Junk", "index": i})
+    manager.check_events()
+    assert len(processed) == MAX_EVENT_BATCH
+    manager.check_events()
+    assert len(processed) == MAX_EVENT_BATCH + 2
+
+
+def test_check_events_reset_first_and_stops_on_transition() -> None:
+    manager = StateMachineManager()
+    manager._mode = modes.NORMAL
+    manager.event_queue.put({"type": "Junk"})
+    manager.event_queue.put({"type": events.RESET})
+    manager.check_events()
+    assert manager._mode == modes.RESET
+    assert manager.event_queue.qsize() == 1
+
+
+def test_shutdown_cancels_waits_and_join() -> None:
+    manager = StateMachineManager()
+    assert manager.join(0) == True
+    manager.spawn()
+    assert manager.join(0.05) == False
+    manager.shutdown()
+    assert manager.cancel_token.cancelled
+    assert manager.join(1) == True
+
+
+def test_runtime_runs_entry_steps_in_entry_pool() -> None:
+    released = threading.Event()
+
+    class BlockingManager(StateMachineManager):
+        def __init__(self, blocking: bool) -> None:
+            super().__init__()
+            self.blocking = blocking
+            self.mode_steps = {
+                modes.INIT: (self.enter_init_mode, None),
+                modes.NORMAL: (lambda: None, self.update_normal_mode),
+                modes.SHUTDOWN: (self.run_shutdown_mode, None),
+            }
+
+        def enter_init_mode(self) -> None:
+            if self.blocking:
+                released.wait(5)
+            self.mode = modes.NORMAL
+
+        def update_normal_mode(self) -> Optional[float]:
+            released.set()
+            self.check_events()
+            return None if self.mode != modes.NORMAL else 0.1
+
+    # Blocking init step must not hold the only update step worker
+    runtime = AsyncRuntime(max_workers=1, max_entry_workers=2)
+    managers = [BlockingManager(True), BlockingManager(False)]
+    for manager in managers:
+        manager.spawn(runtime)
+    for manager in managers:
+        assert manager.initialized.wait(1)
+    for manager in managers:
+        manager.shutdown()
+        assert manager.join(1)
+    runtime.stop(timeout=1)
+
+
+def test_runtime_needs_a_worker() -> None:
+    with pytest.raises(ValueError):
+        AsyncRuntime(max_workers=0)
+    with pytest.raises(ValueError):
+        AsyncRuntime(max_entry_workers=0)
@@ -0,0 +1,47 @@
+# Import standard python libraries
+import os, sys, threading, time
+
+# Import python types
+from typing import List
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.cancellation import CancelToken
+
+
+def test_wait_times_out() -> None:
+    token = CancelToken()
+    assert token.wait(0.01) == False
+    assert token.wait(0) == False
+    assert not token.cancelled
+
+
+def test_cancel_wakes_wait() -> None:
+    token = CancelToken()
+    threading.Timer(0.05, token.cancel).start()
+    start_time = time.monotonic()
+    assert token.wait(10) == True
+    assert time.monotonic() - start_time < 1
+    assert token.cancelled
+    assert token.cancel_time != None
+
+    # Cleared token can be waited on again
+    token.clear()
+    assert token.wait(0.01) == False
+
+
+def test_cancel_calls_callbacks() -> None:
+    token = CancelToken()
+    called: List[str] = []
+    token.add_callback(lambda: called.append("added"))
+    removed = lambda: called.append("removed")
+    token.add_callback(removed)
+    token.remove_callback(removed)
+    token.cancel()
+    assert called == ["added"]
+
+    # Callbacks added after cancellation are called right away
+    token.add_callback(lambda: called.append("late"))
+    assert called == ["added", "late"]
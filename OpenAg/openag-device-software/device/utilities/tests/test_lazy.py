@@ -0,0 +1,38 @@
+# Import standard python libraries
+import os, sys
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.lazy import lazy_import, module_available
+from device.utilities.importtime import ImportTimer, format_record, parse_record
+
+
+def test_lazy_import_defers_import() -> None:
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_import("colorsys")
+    assert "colorsys" not in sys.modules
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert "colorsys" in sys.modules
+
+
+def test_module_available() -> None:
+    assert module_available("json")
+    assert not module_available("missing_module")
+    assert not module_available("missing_package.module")
+
+
+def test_import_timer_records_imports() -> None:
+    sys.modules.pop("wave", None)
+    timer = ImportTimer()
+    timer.install()
+    try:
+        import wave
+    finally:
+        timer.uninstall()
+    names = [record[0] for record in timer.records]
+    assert "wave" in names
+    assert wave.__loader__.__class__.__name__ != "TimedLoader"
+    record = timer.records[names.index("wave")]
+    assert parse_record(format_record(record)) == record
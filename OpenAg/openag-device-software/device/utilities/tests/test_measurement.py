@@ -0,0 +1,125 @@
+# Import standard python libraries
+import os, sys, threading, time, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.cancellation import CancelToken
+from device.utilities.functiontools import retry
+from device.utilities.measurement import (
+    BusSampler,
+    MeasurementCancelled,
+    run_measurement,
+)
+
+
+def convert(value, seconds, events=None):  # type: ignore
+    """Simulates a sensor conversion, records trigger and collect events."""
+    if events != None:
+        events.append(("trigger", value))
+    yield seconds
+    if events != None:
+        events.append(("collect", value))
+    return value
+
+
+def test_run_measurement_returns_value() -> None:
+    events = []  # type: ignore
+    assert run_measurement(convert(1.5, 0.01, events)) == 1.5
+    assert events == [("trigger", 1.5), ("collect", 1.5)]
+
+
+def test_run_measurement_cancel_raises_into_measurement() -> None:
+    token = CancelToken()
+    token.cancel()
+    with pytest.raises(MeasurementCancelled):
+        run_measurement(convert(1.5, 10), token)
+
+
+def test_sampler_overlaps_conversions() -> None:
+    sampler = BusSampler()
+    events = []  # type: ignore
+    results = {}
+
+    def sample(value):  # type: ignore
+        results[value] = sampler.sample(convert(value, 0.2, events), timeout=5)
+
+    # Sample sensors concurrently
+    start_time = time.monotonic()
+    threads = [threading.Thread(target=sample, args=(value,)) for value in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start_time
+
+    # Conversions overlapped instead of running back to back
+    assert results == {0: 0, 1: 1, 2: 2, 3: 3}
+    assert elapsed < 0.6
+    assert sampler.measurements == 4
+    assert sampler.converting_max > 1
+    assert [event for event, value in events[:2]] == ["trigger", "trigger"]
+
+
+def test_sampler_raises_measurement_error() -> None:
+    sampler = BusSampler()
+
+    def fail():  # type: ignore
+        yield 0.01
+        raise ValueError("bad reading")
+
+    with pytest.raises(ValueError):
+        sampler.sample(fail(), timeout=5)
+
+    # Sampler keeps sampling after an error
+    assert sampler.sample(convert(2.0, 0.01), timeout=5) == 2.0
+
+
+def test_sampler_cancel_stops_wait() -> None:
+    sampler = BusSampler()
+    token = CancelToken()
+    thrown = threading.Event()
+
+    def slow():  # type: ignore
+        try:
+            yield 10
+        except MeasurementCancelled:
+            thrown.set()
+            raise
+
+    # Cancelling the token ends the wait and throws into the measurement
+    threading.Timer(0.05, token.cancel).start()
+    start_time = time.monotonic()
+    with pytest.raises(MeasurementCancelled):
+        sampler.sample(slow(), timeout=5, cancel_token=token)
+    assert time.monotonic() - start_time < 1
+    assert thrown.wait(1)
+
+
+def test_sampler_retrying_sensor_does_not_delay_others() -> None:
+    sampler = BusSampler()
+    attempts = []  # type: ignore
+
+    @retry(ValueError, tries=4, delay=0.2, backoff=2)
+    def trigger(retry: bool = True) -> None:
+        attempts.append(time.monotonic())
+        raise ValueError("bus error")
+
+    def failing():  # type: ignore
+        trigger()
+        yield 0.01
+
+    def sample_failing() -> None:
+        with pytest.raises(ValueError):
+            sampler.sample(failing(), timeout=5)
+
+    # Sample failing sensor while another sensor on the bus converts
+    thread = threading.Thread(target=sample_failing)
+    thread.start()
+    start_time = time.monotonic()
+    assert sampler.sample(convert(2.0, 0.05), timeout=5) == 2.0
+    assert time.monotonic() - start_time < 0.5
+    assert len(attempts) < 4
+    thread.join()
+    assert len(attempts) == 4
@@ -0,0 +1,57 @@
+# Import standard python libraries
+import os, sys
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.scheduler import PeriodicScheduler
+
+
+def test_deadlines_do_not_drift() -> None:
+    scheduler = PeriodicScheduler(interval=10)
+    scheduler.start(timestamp=3)
+    assert scheduler.deadline == 10
+
+    # Late starts and slow updates do not shift later deadlines
+    for deadline, start, end in [(10, 10.5, 12), (20, 21, 23), (30, 30.2, 30.4)]:
+        assert scheduler.deadline == deadline
+        assert scheduler.due(timestamp=start)
+        scheduler.begin(timestamp=start)
+        scheduler.end(timestamp=end)
+    assert scheduler.deadline == 40
+    stats = scheduler.to_dict()
+    assert stats["samples"] == 3
+    assert stats["last_jitter_ms"] == 200
+    assert stats["max_jitter_ms"] == 1000
+    assert stats["overruns"] == 0
+    assert stats["skipped"] == 0
+
+
+def test_phases_stagger_deadlines() -> None:
+    schedulers = [PeriodicScheduler(interval=4, phase=i / 4) for i in range(4)]
+    for index, scheduler in enumerate(schedulers):
+        scheduler.start(timestamp=100 + index * 0.01)
+    deadlines = [scheduler.deadline for scheduler in schedulers]
+    assert deadlines == [104, 101, 102, 103]
+
+
+def test_overrun_skips_missed_deadlines() -> None:
+    scheduler = PeriodicScheduler(interval=1)
+    scheduler.start(timestamp=0.5)
+    scheduler.begin(timestamp=1)
+    scheduler.end(timestamp=3.5)
+    assert scheduler.overruns == 1
+    scheduler.begin(timestamp=3.5)
+    assert scheduler.skipped == 1
+    assert scheduler.deadline == 4
+
+
+def test_immediate_start_and_interval_change() -> None:
+    scheduler = PeriodicScheduler(interval=5, phase=0.5)
+    scheduler.start(timestamp=1, immediate=True)
+    assert scheduler.due(timestamp=1)
+    scheduler.begin(timestamp=1)
+    assert scheduler.deadline == 2.5
+    scheduler.set_interval(10, timestamp=2)
+    assert scheduler.deadline == 5
@@ -0,0 +1,41 @@
+# Import standard python libraries
+import os, sys, pytest, json, time, jsonschema
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.schemas import SchemaRegistry
+
+
+def write_schema(path: str, schema: dict) -> None:
+    """Writes schema file."""
+    with open(path, "w") as f:
+        json.dump(schema, f)
+
+
+def test_validator_is_cached(tmpdir) -> None:
+    path = str(tmpdir.join("schema.json"))
+    write_schema(path, {"type": "object"})
+    registry = SchemaRegistry()
+    assert registry.validator(path) is registry.validator(path)
+
+
+def test_validate_raises_validation_error(tmpdir) -> None:
+    path = str(tmpdir.join("schema.json"))
+    write_schema(path, {"type": "object", "required": ["uuid"]})
+    registry = SchemaRegistry()
+    registry.validate({"uuid": "1"}, path)
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        registry.validate({}, path)
+
+
+def test_validator_invalidated_on_mtime_change(tmpdir) -> None:
+    path = str(tmpdir.join("schema.json"))
+    write_schema(path, {"type": "object"})
+    registry = SchemaRegistry()
+    validator = registry.validator(path)
+    write_schema(path, {"type": "array"})
+    os.utime(path, (time.time() + 10, time.time() + 10))
+    assert registry.validator(path) is not validator
+    registry.validate([], path)
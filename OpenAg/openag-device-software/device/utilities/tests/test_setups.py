@@ -0,0 +1,40 @@
+# Import standard python libraries
+import os, sys, pytest, json, copy, time
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.setups import SetupCache, freeze
+
+
+def test_freeze_is_read_only() -> None:
+    setup = freeze({"properties": {"channels": [1, 2]}})
+    with pytest.raises(TypeError):
+        setup["name"] = "Setup"
+    with pytest.raises(TypeError):
+        setup["properties"]["channels"].append(3)
+    assert json.loads(json.dumps(setup)) == {"properties": {"channels": [1, 2]}}
+
+
+def test_copies_of_frozen_setup_are_mutable() -> None:
+    setup = freeze({"properties": {"channels": [1, 2]}})
+    setup_copy = copy.deepcopy(setup)
+    setup_copy["properties"]["channels"].append(3)
+    assert setup["properties"]["channels"] == [1, 2]
+    assert type(setup_copy) == dict
+
+
+def test_setup_cache_shares_setup(tmpdir) -> None:
+    path = str(tmpdir.join("setup.json"))
+    with open(path, "w") as f:
+        json.dump({"name": "Setup"}, f)
+    cache = SetupCache()
+    assert cache.load(path) is cache.load(path)
+
+    # Changed file is re-parsed
+    setup = cache.load(path)
+    with open(path, "w") as f:
+        json.dump({"name": "New Setup"}, f)
+    os.utime(path, (time.time() + 10, time.time() + 10))
+    assert cache.load(path)["name"] == "New Setup"
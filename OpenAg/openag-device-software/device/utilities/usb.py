@@ -1,11 +1,15 @@
 # Import standard python modules
-import pyudev, glob, subprocess
+import glob, subprocess
 
 # Import python types
 from typing import List
 
 # Import device utilities
 from device.utilities.logger import Logger
+from device.utilities.lazy import lazy_import
+
+# Import udev library on first use
+pyudev = lazy_import("pyudev")
 
 # Initialize logger
 logger = Logger("USBUtility", "device")
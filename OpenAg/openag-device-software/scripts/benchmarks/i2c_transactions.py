@@ -0,0 +1,75 @@
+# Import standard python modules
+import sys, os, argparse, threading, time
+
+# Import python types
+from typing import Any, Callable
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c.connection import close_connections
+from device.utilities.communication.i2c.device_io import DeviceIO
+from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
+
+
+def measure(transaction: Callable[[], Any], seconds: float) -> float:
+    """Runs transaction until duration elapses, returns transactions per second."""
+    count = 0
+    start_time = time.perf_counter()
+    end = start_time + seconds
+    while time.perf_counter() < end:
+        transaction()
+        count += 1
+    return count / (time.perf_counter() - start_time)
+
+
+def main() -> None:
+    """Measures i2c transactions per second. On the simulator measures the i2c
+    stack through a simulated mux. On hardware (IS_I2C_ENABLED or IS_USB_I2C_ENABLED)
+    compares opening the bus for every transaction against the pooled persistent
+    bus connection, reading a byte from the device at address."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="I2C transactions benchmark")
+    parser.add_argument("--bus", type=int, default=2, help="i2c bus")
+    parser.add_argument("--address", type=lambda x: int(x, 0), default=0x40)
+    parser.add_argument("--seconds", type=float, default=2, help="duration (s)")
+    args = parser.parse_args()
+    message = "{:<24} {:>10.1f} transactions/s"
+
+    # Measure simulated i2c stack
+    i2c = I2C(
+        name="Benchmark",
+        i2c_lock=threading.RLock(),
+        bus=args.bus,
+        address=args.address,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=PeripheralSimulator,
+    )
+    rate = measure(lambda: i2c.read(1, retry=False), args.seconds)
+    print(message.format("simulator", rate))
+
+    # Check hardware is available
+    hardware = [os.getenv("IS_I2C_ENABLED"), os.getenv("IS_USB_I2C_ENABLED")]
+    if "true" not in hardware:
+        print("Skipping hardware, i2c is not enabled on this platform")
+        return
+
+    # Measure device io with and without persistent bus connections
+    for name, persistent in [("open/close", False), ("pooled", True)]:
+        close_connections()
+        io = DeviceIO("Benchmark", args.bus, persistent=persistent)
+        rate = measure(lambda: io.read(args.address, 1), args.seconds)
+        stats = io.connection.to_dict()
+        print(message.format(name, rate) + " | opens {}".format(stats["opens"]))
+    close_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Import standard python modules
+import sys, os, argparse, time
+
+# Import python types
+from typing import List, Type
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.statemachine import modes
+from device.utilities.statemachine.manager import StateMachineManager
+
+
+class PollingManager(StateMachineManager):
+    """State machine that polls its event queue every 100ms like managers did before
+    blocking on the event queue. Kept here as the benchmark baseline."""
+
+    def run_normal_mode(self) -> None:
+        """Runs normal mode."""
+        while True:
+            self.check_events()
+            if self.new_transition(modes.NORMAL):
+                break
+            time.sleep(0.1)
+
+
+def measure(
+    name: str, manager_class: Type[StateMachineManager], num: int, seconds: float
+) -> None:
+    """Measures idle cpu time and shutdown event latency of idle managers."""
+
+    # Spawn managers and wait for them to enter normal mode
+    managers: List[StateMachineManager] = [manager_class() for i in range(num)]
+    for manager in managers:
+        manager.spawn()
+    for manager in managers:
+        manager.initialized.wait(5)
+
+    # Measure cpu time of idle managers
+    start_cpu = time.process_time()
+    time.sleep(seconds)
+    idle_cpu = (time.process_time() - start_cpu) / seconds * 100
+
+    # Measure time from shutdown event to thread exit
+    latencies = []
+    for manager in managers:
+        start_time = time.perf_counter()
+        manager.shutdown()
+        manager.thread.join(5)
+        latencies.append(time.perf_counter() - start_time)
+    average_ms = sum(latencies) / len(latencies) * 1000
+    max_ms = max(latencies) * 1000
+    message = "{:<8} idle cpu {:>5.2f}% | event latency avg {:>7.2f} ms max {:>7.2f} ms"
+    print(message.format(name, idle_cpu, average_ms, max_ms))
+
+
+def main() -> None:
+    """Compares idle cpu usage and event handling latency of managers polling their
+    event queue against managers blocking on it."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Manager idle benchmark")
+    parser.add_argument("--managers", type=int, default=30, help="number of managers")
+    parser.add_argument("--seconds", type=float, default=5, help="idle duration (s)")
+    args = parser.parse_args()
+
+    # Run benchmarks
+    measure("polling", PollingManager, args.managers, args.seconds)
+    measure("blocking", StateMachineManager, args.managers, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
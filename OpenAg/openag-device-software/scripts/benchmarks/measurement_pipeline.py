@@ -0,0 +1,79 @@
+# Import standard python modules
+import sys, os, argparse, threading, time
+
+# Import python types
+from typing import Any, Callable, List
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.measurement import BusSampler, run_measurement
+
+# Import peripheral elements
+from device.peripherals.modules.sht25.driver import SHT25Driver
+
+
+def sweep(measure: Callable[[SHT25Driver], Any], drivers: List[SHT25Driver]) -> float:
+    """Measures every driver from its own thread, returns sweep seconds."""
+    threads = [threading.Thread(target=measure, args=(driver,)) for driver in drivers]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    """Measures time to sample simulated sht25 sensors sharing one mux. Compares
+    running each measurement with the bus held for the whole conversion against
+    a bus sampler that triggers every sensor then collects them as conversions
+    complete."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Measurement pipeline benchmark")
+    parser.add_argument("--sensors", type=int, default=4, help="sensors on bus")
+    parser.add_argument("--sweeps", type=int, default=3, help="sweeps to average")
+    args = parser.parse_args()
+    message = "{:<24} {:>10.3f} s/sweep"
+
+    # Initialize simulated sensors on separate mux channels of one bus
+    bus_lock = threading.RLock()
+    mux_simulator = MuxSimulator()
+    drivers = [
+        SHT25Driver(
+            name="SHT25-{}".format(channel),
+            i2c_lock=bus_lock,
+            bus=2,
+            address=0x40,
+            mux=0x77,
+            channel=channel,
+            simulate=True,
+            mux_simulator=mux_simulator,
+        )
+        for channel in range(args.sensors)
+    ]
+
+    # Measure holding the bus through each conversion
+    def measure_locked(driver: SHT25Driver) -> Any:
+        with bus_lock:
+            return run_measurement(driver.measure())
+
+    total = sum(sweep(measure_locked, drivers) for _ in range(args.sweeps))
+    print(message.format("sequential", total / args.sweeps))
+
+    # Measure with conversions overlapped by the bus sampler
+    sampler = BusSampler()
+    total = sum(
+        sweep(lambda driver: sampler.sample(driver.measure()), drivers)
+        for _ in range(args.sweeps)
+    )
+    print(message.format("pipelined", total / args.sweeps))
+    print("max converting: {}".format(sampler.to_dict()["max_converting"]))
+
+
+if __name__ == "__main__":
+    main()
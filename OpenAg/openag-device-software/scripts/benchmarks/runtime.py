@@ -0,0 +1,129 @@
+# Import standard python modules
+import sys, os, argparse, json, resource, subprocess, threading, time
+
+# Import python types
+from typing import List, Optional
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities import accessors
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.state.main import State
+from device.utilities.statemachine.runtime import AsyncRuntime, ASYNCIO, THREADS
+
+# Import peripheral manager
+from device.peripherals.classes.peripheral import modes
+from device.peripherals.modules.sht25.manager import SHT25Manager
+
+# Load simulated peripheral config
+CONFIG_PATH = "device/peripherals/modules/sht25/tests/config.json"
+
+
+def get_rss_mb() -> float:
+    """Gets resident set size of this process in MB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(mode: str, num: int, seconds: float, max_workers: int) -> None:
+    """Measures memory and cpu usage of simulated peripherals in runtime mode,
+    prints results as json."""
+    device_config = json.load(open(CONFIG_PATH))
+    config = accessors.get_peripheral_config(device_config["peripherals"], "SHT25-Top")
+    runtime: Optional[AsyncRuntime] = None
+    if mode == ASYNCIO:
+        runtime = AsyncRuntime(max_workers)
+
+    # Create and spawn simulated peripherals sharing one mux simulator
+    start_rss = get_rss_mb()
+    state = State()
+    i2c_lock = threading.RLock()
+    mux_simulator = MuxSimulator()
+    managers: List[SHT25Manager] = []
+    for index in range(num):
+        manager = SHT25Manager(
+            name="SHT25-{}".format(index),
+            i2c_lock=i2c_lock,
+            state=state,
+            config=config,
+            simulate=True,
+            mux_simulator=mux_simulator,
+        )
+        manager.spawn(runtime)  # type: ignore
+        managers.append(manager)
+    while any(manager.mode != modes.NORMAL for manager in managers):
+        time.sleep(0.1)
+
+    # Measure cpu time of peripherals sampling every interval
+    start_cpu = time.process_time()
+    time.sleep(seconds)
+    cpu = (time.process_time() - start_cpu) / seconds * 100
+    rss = get_rss_mb()
+    num_threads = threading.active_count()
+
+    # Measure time until all peripherals shutdown
+    start_time = time.perf_counter()
+    for manager in managers:
+        manager.shutdown()
+    while any(manager.is_alive() for manager in managers):
+        time.sleep(0.01)
+    shutdown_ms = (time.perf_counter() - start_time) * 1000
+    result = {
+        "mode": mode,
+        "threads": num_threads,
+        "rss_mb": rss,
+        "peripherals_rss_mb": rss - start_rss,
+        "cpu": cpu,
+        "shutdown_ms": shutdown_ms,
+    }
+    print(json.dumps(result))
+
+
+def main() -> None:
+    """Compares memory and cpu usage of simulated peripherals running as one thread
+    per peripheral against tasks on the asyncio runtime. Each runtime is measured
+    in its own process so memory usage is not shared."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Runtime benchmark")
+    parser.add_argument("--peripherals", type=int, default=100, help="peripherals")
+    parser.add_argument("--seconds", type=float, default=30, help="duration (s)")
+    parser.add_argument("--max-workers", type=int, default=16, help="executor size")
+    parser.add_argument("--mode", choices=[THREADS, ASYNCIO], help="measure mode")
+    args = parser.parse_args()
+
+    # Measure a single runtime
+    if args.mode != None:
+        measure(args.mode, args.peripherals, args.seconds, args.max_workers)
+        return
+
+    # Measure each runtime in a child process
+    message = "{:<8} threads {:>4} | rss {:>6.1f} MB (+{:>5.1f}) | cpu {:>5.2f}% | "
+    message += "shutdown {:>7.1f} ms"
+    for mode in [THREADS, ASYNCIO]:
+        command = [sys.executable, __file__, "--mode", mode]
+        command += ["--peripherals", str(args.peripherals)]
+        command += ["--seconds", str(args.seconds)]
+        command += ["--max-workers", str(args.max_workers)]
+        output = subprocess.run(command, stdout=subprocess.PIPE, check=True).stdout
+        result = json.loads(output.decode().strip().splitlines()[-1])
+        print(
+            message.format(
+                mode,
+                result["threads"],
+                result["rss_mb"],
+                result["peripherals_rss_mb"],
+                result["cpu"],
+                result["shutdown_ms"],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Import standard python modules
+import sys, os, argparse, glob, json, time, jsonschema
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.schemas import SchemaRegistry
+
+# Initialize file paths
+RECIPES_PATH = "data/recipes/*.json"
+RECIPE_SCHEMA_PATH = "data/schemas/recipe.json"
+
+
+def validate_uncached(recipe: dict) -> None:
+    """Previous behaviour, loads schema and builds a validator every validation."""
+    schema = json.load(open(RECIPE_SCHEMA_PATH))
+    jsonschema.validate(recipe, schema)
+
+
+def main() -> None:
+    """Compares recipe validations per second with and without the schema registry."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Schema validation benchmark")
+    parser.add_argument("--seconds", type=float, default=3, help="duration per run")
+    args = parser.parse_args()
+
+    # Load recipes
+    recipes = []
+    for filepath in sorted(glob.glob(RECIPES_PATH)):
+        recipes.append(json.load(open(filepath)))
+
+    # Run benchmarks
+    registry = SchemaRegistry()
+    runs = [
+        ("uncached", validate_uncached),
+        ("registry", lambda recipe: registry.validate(recipe, RECIPE_SCHEMA_PATH)),
+    ]
+    for name, validate in runs:
+        num_validations = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < args.seconds:
+            validate(recipes[num_validations % len(recipes)])
+            num_validations += 1
+        rate = num_validations / (time.perf_counter() - start)
+        print("{:<8} {:>10.0f} validations/s".format(name, rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# Import standard python modules
+import sys, os, argparse, json, random, sqlite3, tempfile, threading, time
+
+# Import python types
+from typing import Any, Dict, List, Tuple
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Setup django
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
+django.setup()
+
+# Import django modules
+from django.conf import settings
+
+# Import app modules
+from app.database import apply_pragmas
+
+# Initialize storage profiles
+PROFILES = {
+    "default": [("journal_mode", "DELETE"), ("synchronous", "FULL")],
+    "tuned": settings.SQLITE_PRAGMAS,
+}
+
+# Initialize coordinator update interval
+UPDATE_INTERVAL = 0.1  # seconds
+
+
+def connect(path: str, pragmas: List[Tuple[str, Any]], timeout: float) -> Any:
+    """Opens a persistent connection with storage profile applied."""
+    connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+    apply_pragmas(connection.cursor(), pragmas)
+    return connection
+
+
+def create_tables(path: str, pragmas: List[Tuple[str, Any]]) -> None:
+    """Creates state and environment tables shaped like the app tables."""
+    connection = connect(path, pragmas, timeout=5)
+    connection.execute("CREATE TABLE state (id INTEGER PRIMARY KEY, peripherals TEXT)")
+    connection.execute(
+        "CREATE TABLE environment (id INTEGER PRIMARY KEY, timestamp REAL, state TEXT)"
+    )
+    connection.execute("INSERT INTO state VALUES (1, '{}')")
+    connection.close()
+
+
+def write(path: str, pragmas: List[Tuple[str, Any]], args: Any, stats: Dict) -> None:
+    """Imitates coordinator writing state every update interval."""
+    connection = connect(path, pragmas, timeout=args.timeout)
+    end = time.monotonic() + args.seconds
+    tick = 0
+    while time.monotonic() < end:
+        state = {"Sensor-{}".format(i): random.random() for i in range(args.sensors)}
+        start = time.monotonic()
+        try:
+            connection.execute("BEGIN")
+            connection.execute(
+                "UPDATE state SET peripherals = ? WHERE id = 1", (json.dumps(state),)
+            )
+            if tick % 10 == 0:
+                connection.execute(
+                    "INSERT INTO environment (timestamp, state) VALUES (?, ?)",
+                    (time.time(), json.dumps(state)),
+                )
+            connection.execute("COMMIT")
+            stats["write_latencies"].append(time.monotonic() - start)
+        except sqlite3.OperationalError:
+            connection.execute("ROLLBACK")
+            stats["write_errors"] += 1
+        tick += 1
+        time.sleep(max(0, UPDATE_INTERVAL - (time.monotonic() - start)))
+    connection.close()
+
+
+def read(path: str, pragmas: List[Tuple[str, Any]], args: Any, stats: Dict) -> None:
+    """Imitates rest api readers polling state and environments."""
+    connection = connect(path, pragmas, timeout=args.timeout)
+    end = time.monotonic() + args.seconds
+    while time.monotonic() < end:
+        start = time.monotonic()
+        try:
+            connection.execute("SELECT peripherals FROM state WHERE id = 1").fetchone()
+            connection.execute(
+                "SELECT state FROM environment ORDER BY timestamp DESC LIMIT 10"
+            ).fetchall()
+            stats["read_latencies"].append(time.monotonic() - start)
+        except sqlite3.OperationalError:
+            stats["read_errors"] += 1
+        time.sleep(args.read_interval)
+    connection.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Gets percentile of values in ms."""
+    if values == []:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000
+
+
+def run(profile: str, args: Any) -> None:
+    """Runs a writer thread and reader threads against a fresh database."""
+    pragmas = PROFILES[profile]
+    stats: Dict[str, Any] = {
+        "write_latencies": [],
+        "read_latencies": [],
+        "write_errors": 0,
+        "read_errors": 0,
+    }
+
+    # Run benchmark against a temporary database
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.sqlite")
+        create_tables(path, pragmas)
+        threads = [threading.Thread(target=write, args=(path, pragmas, args, stats))]
+        for index in range(args.readers):
+            thread = threading.Thread(target=read, args=(path, pragmas, args, stats))
+            threads.append(thread)
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Report results
+    writes = stats["write_latencies"]
+    reads = stats["read_latencies"]
+    print(
+        "{:<8} writes: {:>5} p50 {:>7.2f} ms p99 {:>7.2f} ms max {:>7.2f} ms "
+        "errors {:>3} | reads: {:>6} p99 {:>7.2f} ms errors {:>3}".format(
+            profile,
+            len(writes),
+            percentile(writes, 0.5),
+            percentile(writes, 0.99),
+            percentile(writes, 1.0),
+            stats["write_errors"],
+            len(reads),
+            percentile(reads, 0.99),
+            stats["read_errors"],
+        )
+    )
+
+
+def main() -> None:
+    """Compares default and tuned sqlite storage profiles with a coordinator writer
+    and concurrent rest api readers."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Sqlite concurrency benchmark")
+    parser.add_argument("--seconds", type=float, default=10, help="duration (s)")
+    parser.add_argument("--readers", type=int, default=4, help="number of readers")
+    parser.add_argument("--sensors", type=int, default=200, help="state size")
+    parser.add_argument(
+        "--read-interval", type=float, default=0.01, help="reader interval (s)"
+    )
+    parser.add_argument("--timeout", type=float, default=1, help="busy timeout (s)")
+    args = parser.parse_args()
+
+    # Run profiles
+    random.seed(0)
+    for profile in PROFILES:
+        run(profile, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Import standard python modules
+import sys, os, argparse, json, threading, time
+
+# Import python types
+from typing import Any, Callable, List
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.state.main import State
+
+
+def run_threads(targets: List[Callable[[], None]], seconds: float) -> int:
+    """Runs targets in parallel threads until duration elapses, returns number of
+    completed calls."""
+    counts = [0] * len(targets)
+    end = time.perf_counter() + seconds
+
+    def loop(index: int, target: Callable[[], None]) -> None:
+        while time.perf_counter() < end:
+            target()
+            counts[index] += 1
+
+    threads = [
+        threading.Thread(target=loop, args=(index, target))
+        for index, target in enumerate(targets)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts)
+
+
+def main() -> None:
+    """Compares state throughput of peripheral writers and a serializing reader when
+    every thread uses the state lock against threads using section locks."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="State lock benchmark")
+    parser.add_argument("--writers", type=int, default=8, help="number of writers")
+    parser.add_argument("--seconds", type=float, default=2, help="duration (s)")
+    args = parser.parse_args()
+
+    for name in ["state lock", "section locks"]:
+        state = State()
+        for i in range(50):
+            state.set_controller_value("Controller-{}".format(i), "mode", "NORMAL")
+
+        def lock(section: str) -> Any:
+            if name == "state lock":
+                return state.lock
+            return state.section_lock(section)
+
+        def writer() -> None:
+            with lock("peripherals"):
+                state.peripherals["Sensor"] = {"value": time.time()}
+
+        def reader() -> None:
+            with lock("controllers"):
+                json.dumps(state.controllers)
+
+        targets = [writer] * args.writers + [reader]
+        calls = run_threads(targets, args.seconds)
+        stats = state.lock_stats()
+        print(
+            "{:<13} calls/s {:>9.0f} | peripherals wait {:>8.3f} ms".format(
+                name, calls / args.seconds, stats["peripherals"]["total_wait_ms"]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Import standard python modules
+import sys, os, argparse, json, random, time
+
+# Import python types
+from typing import Dict
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Setup django
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
+django.setup()
+
+# Import device utilities
+from device.utilities.state.main import State, SECTIONS
+from device.utilities.state.storage import StateStorage
+
+# Initialize coordinator update interval
+UPDATE_INTERVAL = 0.1  # seconds
+
+
+class CountingStateStorage(StateStorage):
+    """State storage that counts written sections instead of writing to database."""
+
+    def write(self, updates: Dict[str, str]) -> None:
+        """Discards updates, bytes are counted in flush."""
+        pass
+
+
+def simulate(state: State, timestamp: float, args: argparse.Namespace) -> None:
+    """Simulates peripheral, recipe and resource threads updating shared state."""
+    tick = int(round(timestamp / UPDATE_INTERVAL))
+
+    # Update sensors every sampling interval, staggered by sensor index
+    ticks_per_sample = int(args.sampling_interval / UPDATE_INTERVAL)
+    for index in range(args.sensors):
+        if (tick + index) % ticks_per_sample != 0:
+            continue
+        peripheral = "Sensor-{}".format(index)
+        variable = "variable_{}".format(index % 5)
+        value = round(20 + random.random(), 2)
+        state.set_peripheral_reported_sensor_value(peripheral, variable, value)
+        state.set_environment_reported_sensor_value(peripheral, variable, value)
+
+    # Update recipe every minute
+    if tick % int(60 / UPDATE_INTERVAL) == 0:
+        with state.lock:
+            state.recipe["last_update_minute"] = tick
+            state.mark_dirty("recipe")
+
+    # Update resource every 5 minutes
+    if tick % int(300 / UPDATE_INTERVAL) == 0:
+        with state.lock:
+            state.resource["free_memory"] = "{}M".format(random.randint(100, 200))
+            state.mark_dirty("resource")
+
+
+def main() -> None:
+    """Compares bytes written per hour by full and incremental state persistence."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="State persistence benchmark")
+    parser.add_argument("--sensors", type=int, default=20, help="number of sensors")
+    parser.add_argument(
+        "--sampling-interval", type=float, default=5, help="sensor interval (s)"
+    )
+    parser.add_argument(
+        "--flush-interval", type=float, default=1, help="state flush interval (s)"
+    )
+    parser.add_argument("--hours", type=float, default=1, help="simulated hours")
+    args = parser.parse_args()
+
+    # Initialize state
+    random.seed(0)
+    state = State()
+    state.environment = {}
+    state.peripherals = {}
+    storage = CountingStateStorage(state, flush_interval=args.flush_interval)
+
+    # Simulate coordinator loop
+    full_bytes = 0
+    full_seconds = 0.0
+    incremental_seconds = 0.0
+    num_ticks = int(args.hours * 3600 / UPDATE_INTERVAL)
+    for tick in range(num_ticks):
+        timestamp = tick * UPDATE_INTERVAL
+        simulate(state, timestamp, args)
+
+        # Previous behaviour, serialize and write every section every update
+        start = time.perf_counter()
+        for section in SECTIONS:
+            full_bytes += len(json.dumps(getattr(state, section)))
+        full_seconds += time.perf_counter() - start
+
+        # Incremental behaviour
+        start = time.perf_counter()
+        storage.flush(timestamp=timestamp)
+        incremental_seconds += time.perf_counter() - start
+
+    # Report results
+    hours = args.hours
+    print("Simulated {} sensors for {} hour(s)".format(args.sensors, hours))
+    print(
+        "Full:        {:>12.0f} bytes/hour, {:>7.0f} writes/hour, {:.3f} s cpu/hour".format(
+            full_bytes / hours, num_ticks / hours, full_seconds / hours
+        )
+    )
+    print(
+        "Incremental: {:>12.0f} bytes/hour, {:>7.0f} writes/hour, {:.3f} s cpu/hour".format(
+            storage.bytes_written / hours,
+            storage.num_writes / hours,
+            incremental_seconds / hours,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# Import standard python modules
+import sys, os, argparse, json, random, threading, time
+
+# Import python types
+from typing import Any, Callable, Dict
+
+# Set system path and directory
+sys.path.append(os.environ["PROJECT_ROOT"])
+os.chdir(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.state.main import State
+
+
+class NestedDictState:
+    """Environment state stored in nested dicts like State before the environment
+    registry. Kept here as the benchmark baseline."""
+
+    def __init__(self) -> None:
+        """Initializes nested dict state."""
+        self.lock = threading.RLock()
+        self.generations = {"environment": 0}
+        self.environment: Dict[str, Any] = {
+            "sensor": {"desired": {}, "reported": {}},
+            "actuator": {"desired": {}, "reported": {}},
+            "reported_sensor_stats": {
+                "individual": {"instantaneous": {}, "average": {}},
+                "group": {"instantaneous": {}, "average": {}},
+            },
+        }
+
+    def set_environment_reported_sensor_value(
+        self, sensor: str, variable: str, value: Any, simple: bool = False
+    ) -> None:
+        """Sets reported sensor value, copied from State before the registry."""
+
+        # TODO: Clean this up, it is a mess...
+
+        # Ensure valid dict structure
+        if "reported_sensor_stats" not in self.environment:
+            self.environment["reported_sensor_stats"] = {}
+
+        # Individual
+        if "individual" not in self.environment["reported_sensor_stats"]:
+            self.environment["reported_sensor_stats"]["individual"] = {}
+        if (
+            "instantaneous"
+            not in self.environment["reported_sensor_stats"]["individual"]
+        ):
+            self.environment["reported_sensor_stats"]["individual"][
+                "instantaneous"
+            ] = {}
+        if "average" not in self.environment["reported_sensor_stats"]["individual"]:
+            self.environment["reported_sensor_stats"]["individual"]["average"] = {}
+
+        # Group
+        if "group" not in self.environment["reported_sensor_stats"]:
+            self.environment["reported_sensor_stats"]["group"] = {}
+        if "instantaneous" not in self.environment["reported_sensor_stats"]["group"]:
+            self.environment["reported_sensor_stats"]["group"]["instantaneous"] = {}
+        if "average" not in self.environment["reported_sensor_stats"]["group"]:
+            self.environment["reported_sensor_stats"]["group"]["average"] = {}
+
+        # Sensor
+        if "sensor" not in self.environment:
+            self.environment["sensor"] = {}
+        if "reported" not in self.environment["sensor"]:
+            self.environment["sensor"]["reported"] = {}
+
+        # Force simple if value is None (don't want to try averaging `None`)
+        if value is None:
+            simple = True
+
+        with self.lock:
+            # Update individual instantaneous
+            by_type = self.environment["reported_sensor_stats"]["individual"][
+                "instantaneous"
+            ]
+            if variable not in by_type:
+                by_type[variable] = {}
+            by_var = self.environment["reported_sensor_stats"]["individual"][
+                "instantaneous"
+            ][variable]
+            by_var[sensor] = value
+
+            if simple:
+                # Update simple sensor value with reported value
+                self.environment["sensor"]["reported"][variable] = value
+
+            else:
+                # Update individual average
+                by_type = self.environment["reported_sensor_stats"]["individual"][
+                    "average"
+                ]
+                if variable not in by_type:
+                    by_type[variable] = {}
+                if sensor not in by_type:
+                    by_type[sensor] = {"value": value, "samples": 1}
+                else:
+                    stored_value = by_type[sensor]["value"]
+                    stored_samples = by_type[sensor]["samples"]
+                    new_samples = stored_samples + 1
+                    new_value = (stored_value * stored_samples + value) / new_samples
+                    by_type[sensor]["value"] = new_value
+                    by_type[sensor]["samples"] = new_samples
+
+                # Update group instantaneous
+                by_var_i = self.environment["reported_sensor_stats"]["individual"][
+                    "instantaneous"
+                ][variable]
+                num_sensors = 0
+                total = 0
+                for sensor in by_var_i:
+                    if by_var_i[sensor] != None:
+                        total += by_var_i[sensor]
+                        num_sensors += 1
+                new_value = total / num_sensors
+                self.environment["reported_sensor_stats"]["group"]["instantaneous"][
+                    variable
+                ] = {"value": new_value, "samples": num_sensors}
+
+                # Update group average
+                by_type = self.environment["reported_sensor_stats"]["group"]["average"]
+                if variable not in by_type:
+                    by_type[variable] = {"value": value, "samples": 1}
+                else:
+                    stored_value = by_type[variable]["value"]
+                    stored_samples = by_type[variable]["samples"]
+                    new_samples = stored_samples + 1
+
+                    # Check if group average > 20 samples
+                    if new_samples > 20:
+                        new_samples = 1
+                        new_value = value
+                    else:
+                        new_value = (
+                            stored_value * stored_samples + value
+                        ) / new_samples
+
+                    # Update dict
+                    by_type[variable]["value"] = new_value
+                    by_type[variable]["samples"] = new_samples
+
+                # Update simple sensor value with instantaneous group value
+                self.environment["sensor"]["reported"][variable] = self.environment[
+                    "reported_sensor_stats"
+                ]["group"]["instantaneous"][variable]["value"]
+
+            # Mark environment as modified
+            self.mark_dirty("environment")
+
+    def mark_dirty(self, section: str) -> None:
+        """Increments generation counter for section."""
+        with self.lock:
+            self.generations[section] += 1
+
+    def get_environment_reported_sensor_value(self, variable: str) -> Any:
+        """Gets reported sensor value with a key walk."""
+        value = self.environment
+        for key in ["sensor", "reported", variable]:
+            if key not in value:
+                return None
+            value = value[key]
+        return value
+
+
+def measure(function: Callable[[], None], seconds: float) -> float:
+    """Runs function repeatedly, returns calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    end = start + seconds
+    while time.perf_counter() < end:
+        for _ in range(100):
+            function()
+        calls += 100
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Compares environment updates and reads per second of the environment registry
+    against nested dict state."""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="State registry benchmark")
+    parser.add_argument("--sensors", type=int, default=50, help="number of sensors")
+    parser.add_argument("--seconds", type=float, default=2, help="duration (s)")
+    args = parser.parse_args()
+
+    # Initialize sensors, each reports one variable shared with another sensor
+    sensors = ["Sensor-{}".format(i) for i in range(args.sensors)]
+    variables = ["variable_{}".format(i // 2) for i in range(args.sensors)]
+    random.seed(0)
+    values = [random.random() * 100 for i in range(1000)]
+
+    # Run benchmarks
+    for name, state in [("nested", NestedDictState()), ("registry", State())]:
+        if isinstance(state, State):
+            for sensor, variable in zip(sensors, variables):
+                state.register_environment_variables(sensor, [variable], [])
+        index = [0]
+
+        def update() -> None:
+            i = index[0] = (index[0] + 1) % len(sensors)
+            state.set_environment_reported_sensor_value(  # type: ignore
+                sensors[i], variables[i], values[i % len(values)]
+            )
+
+        def read() -> None:
+            i = index[0] = (index[0] + 1) % len(sensors)
+            state.get_environment_reported_sensor_value(variables[i])  # type: ignore
+
+        def serialize() -> None:
+            json.dumps(state.environment)  # type: ignore
+
+        updates = measure(update, args.seconds)
+        reads = measure(read, args.seconds)
+        serializations = measure(serialize, args.seconds / 4)
+        print(
+            "{:<9} updates/s {:>10.0f} | reads/s {:>10.0f} | json/s {:>7.0f}".format(
+                name, updates, reads, serializations
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()